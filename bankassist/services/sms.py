@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 import time
@@ -15,11 +16,16 @@ class SMS:
 class SMSService:
     """Dummy SMS service. Keeps an outbox and an inbox. Supports 'expected' messages.
     Messages not expected can be ignored by consumers.
+
+    The inbox keeps the newest ``max_per_phone`` messages for each of the
+    ``max_phones`` most recently used phones.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_phones: int = 10_000, max_per_phone: int = 500) -> None:
         self.outbox: List[SMS] = []
-        self.inbox: List[SMS] = []
+        self.max_phones = max_phones
+        self.max_per_phone = max_per_phone
+        self._inboxes: OrderedDict[str, deque] = OrderedDict()  # phone -> messages, least recent first
         self.expected_from_numbers: Dict[str, str] = {}  # phone -> purpose
 
     def send_sms(self, to: str, body: str, media_url: Optional[str] = None) -> SMS:
@@ -33,16 +39,31 @@ class SMSService:
     def receive_sms(self, from_number: str, body: str, media_url: Optional[str] = None) -> None:
         # Simulate inbound; store only if expected
         if from_number in self.expected_from_numbers:
-            self.inbox.append(SMS(to=from_number, body=body, media_url=media_url))
+            inbox = self._inboxes.get(from_number)
+            if inbox is None:
+                inbox = self._inboxes[from_number] = deque(maxlen=self.max_per_phone)
+            inbox.append(SMS(to=from_number, body=body, media_url=media_url))
+            self._inboxes.move_to_end(from_number)
+            if len(self._inboxes) > self.max_phones:
+                self._inboxes.popitem(last=False)
             # clear expectation after one receive for simplicity
             self.expected_from_numbers.pop(from_number, None)
 
-    def get_inbox_for(self, phone: str) -> List[SMS]:
-        return [m for m in self.inbox if m.to == phone]
+    def get_inbox_for(self, phone: str, limit: Optional[int] = None) -> List[SMS]:
+        """Messages received from ``phone``, oldest first; the newest ``limit`` if given."""
+        inbox = self._inboxes.get(phone)
+        if inbox is None:
+            return []
+        self._inboxes.move_to_end(phone)
+        messages = list(inbox)
+        if limit is None:
+            return messages
+        # limit <= 0 leaves nothing
+        return messages[max(len(messages) - limit, 0):]
 
     def stats(self) -> dict:
         return {
             "outbox_count": len(self.outbox),
-            "inbox_count": len(self.inbox),
+            "inbox_count": sum(len(inbox) for inbox in self._inboxes.values()),
             "active_expectations": len(self.expected_from_numbers),
         }
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 
 def classify_intent(text: str) -> str:
-    lt = text.lower()
+    # Normalize first so case/whitespace variants of a phrase share one cache entry
+    return _classify(text.strip().lower())
+
+
+@lru_cache(maxsize=4096)
+def _classify(lt: str) -> str:
     if any(w in lt for w in ["transfer", "send money", "pay", "move"]):
         return "write"
     if any(w in lt for w in ["how much", "balance", "last transactions", "transactions"]):
@@ -5,6 +5,7 @@ const bodyParser = require('body-parser');
 const cors = require('cors');
 const http = require('http');
 const { WebSocketServer } = require('ws');
+const { decode: decodeMsgpack } = require('@msgpack/msgpack');
 const twilio = require('twilio');
 const axios = require('axios');
 const localtunnel = require('localtunnel');
@@ -154,8 +155,11 @@ function updateTwilioWebhook(webhookUrl) {
 let PUBLIC_URL = `http://localhost:${PORT}`;
 
 // Health check
+// Probes get a prebuilt body instead of a JSON.stringify per request
+const HEALTH_BODY = JSON.stringify({ status: 'ok', service: SERVICE_NAME });
+
 app.get('/health', (req, res) => {
-  res.json({ status: 'ok', service: SERVICE_NAME });
+  res.type('json').send(HEALTH_BODY);
 });
 
 app.get('/healthz', (req, res) => {
@@ -420,9 +424,10 @@ wss.on('connection', (ws, req) => {
         }
       });
       
-      voiceWs.on('message', (data) => {
+      voiceWs.on('message', (data, isBinary) => {
         try {
-          const message = JSON.parse(data.toString());
+          // Binary frames are MessagePack (audio as raw bytes), text frames JSON
+          const message = isBinary ? decodeMsgpack(data) : JSON.parse(data.toString());
           
           // Handler sends instructions - call service just executes
           
@@ -432,8 +437,10 @@ wss.on('connection', (ws, req) => {
             
             if (message.audio) {
               try {
-                // Decode base64 WAV audio from handler
-                const wavBuffer = Buffer.from(message.audio, 'base64');
+                // WAV audio from handler: raw bytes over MessagePack, base64 over JSON
+                const wavBuffer = typeof message.audio === 'string'
+                  ? Buffer.from(message.audio, 'base64')
+                  : Buffer.from(message.audio.buffer, message.audio.byteOffset, message.audio.byteLength);
                 log('INFO', '[AUDIO] Received TTS audio for playback', { 
                   callSid: callSid,
                   wavSize: wavBuffer.length 
@@ -468,6 +475,15 @@ wss.on('connection', (ws, req) => {
                     callSid: callSid,
                     mulawSize: mulawData.length 
                   });
+                  
+                  // Twilio echoes a mark back once the audio before it has played
+                  if (message.mark) {
+                    wsRefs.twilioWs.send(JSON.stringify({
+                      event: 'mark',
+                      streamSid: streamSid,
+                      mark: { name: message.mark }
+                    }));
+                  }
                 } else {
                   log('ERROR', '[AUDIO] Twilio WebSocket not available for playback', { callSid: callSid });
                 }
@@ -657,6 +673,12 @@ wss.on('connection', (ws, req) => {
           }
         }
       } 
+      else if (message.event === 'mark') {
+        // Marked audio finished playing: let the handler know
+        if (voiceWs && voiceWs.readyState === 1) {
+          voiceWs.send(JSON.stringify({ type: 'play_done', mark: message.mark?.name }));
+        }
+      }
       else if (message.event === 'stop') {
         log('INFO', '[WS] Stream stopped', { callSid: callSid });
         
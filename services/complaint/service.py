@@ -2,19 +2,25 @@
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Run as a script: add the project root to the path. Imported as
+    # services.<name>.service (tests, uvicorn workers) it is already there.
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
 from fastapi import FastAPI
 from pydantic import BaseModel
 from typing import Optional, List
 from bankassist.services.complaint import ComplaintService, Complaint
+from shared.utils.bulk import add_bulk_endpoint
+from shared.utils.health import add_health_route
+from shared.utils.json import DefaultResponse
 
 from services.complaint import config
 
-app = FastAPI(title="Complaint Service")
+app = FastAPI(title="Complaint Service", default_response_class=DefaultResponse)
+add_bulk_endpoint(app)
+add_health_route(app, "complaint")
 complaint_svc = ComplaintService()
 
 
@@ -35,20 +41,17 @@ class ComplaintResponse(BaseModel):
 @app.post("/lodge", response_model=ComplaintResponse)
 def lodge(req: LodgeRequest):
     c = complaint_svc.lodge(req.phone, req.text, req.image_url)
-    return ComplaintResponse(id=c.id, phone=c.phone, text=c.text, image_url=c.image_url, timestamp=c.timestamp)
+    # Plain dicts are validated once against response_model
+    return vars(c)
 
 
 @app.get("/recent", response_model=List[ComplaintResponse])
 def recent(limit: int = 5):
     complaints = complaint_svc.list_recent(limit)
-    return [ComplaintResponse(id=c.id, phone=c.phone, text=c.text, image_url=c.image_url, timestamp=c.timestamp) for c in complaints]
-
-
-@app.get("/health")
-def health():
-    return {"status": "ok", "service": "complaint"}
+    # Plain dicts are validated once against response_model
+    return [vars(c) for c in complaints]
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=config.PORT)
+    uvicorn.run(app, host="0.0.0.0", port=config.PORT, timeout_keep_alive=75)
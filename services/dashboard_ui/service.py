@@ -2,54 +2,257 @@
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Run as a script: add the project root to the path. Imported as
+    # services.<name>.service (tests, uvicorn workers) it is already there.
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
-import requests
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 import asyncio
-import json
-from typing import List
-from shared.config import get_service_url, SERVICE_PORTS
+import base64
+import gzip
+import hashlib
+import httpx
+import re
+from typing import Dict, Set
+from shared.config import SERVICE_PORTS
+from shared.utils.health import add_health_route
+from shared.utils.json import DefaultResponse, dumps
+
+try:
+    import msgpack
+except ImportError:
+    # msgpack not installed, push JSON text frames instead
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:
+    # brotli not installed, precompress the dashboard with gzip only
+    brotli = None
 
 from services.dashboard_ui import config
 
-app = FastAPI(title="Dashboard UI Service")
 
-# WebSocket connections for live updates
-active_connections: List[WebSocket] = []
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled async client for polling services and proxying API calls,
+    # so none of them blocks the event loop that serves the dashboard
+    app.state.http = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+        timeout=15.0
+    )
+    publisher = asyncio.create_task(_publish_updates())
+    yield
+    publisher.cancel()
+    await app.state.http.aclose()
+
+
+app = FastAPI(title="Dashboard UI Service", lifespan=lifespan, default_response_class=DefaultResponse)
+add_health_route(app, "dashboard_ui")
+
+# Most updates a connection's sender folds into one frame
+MAX_BATCH_SIZE = 32
+
+# Most updates held for a slow client before the oldest are dropped
+MAX_QUEUED_UPDATES = 64
+
+
+class UpdateQueue(asyncio.Queue):
+    """Bounded per-connection update queue.
+
+    Every update is stamped with a per-connection ``seq``. When the client
+    falls behind, the oldest pending update is dropped instead of growing
+    without bound; the gap in ``seq`` makes the loss visible client-side.
+    """
+
+    def __init__(self, maxsize: int = MAX_QUEUED_UPDATES):
+        super().__init__(maxsize)
+        self.seq = 0
+
+    def offer(self, data: dict):
+        self.seq += 1
+        if self.full():
+            self.get_nowait()
+        self.put_nowait({**data, "seq": self.seq})
+
+
+# WebSocket connections for live updates, each with its queue of pending updates
+active_connections: Dict[WebSocket, UpdateQueue] = {}
+
+# Pending updates for each /sse stream
+sse_queues: Set[UpdateQueue] = set()
+
+# Seconds between metrics snapshots
+UPDATE_INTERVAL_SECONDS = 2
 
 
 async def broadcast_update(data: dict):
     """Broadcast updates to all connected WebSocket clients."""
-    for connection in active_connections:
+    for queue in active_connections.values():
+        queue.offer(data)
+    for queue in sse_queues:
+        queue.offer(data)
+
+
+async def _publish_updates():
+    """Collect one metrics snapshot per interval and hand it to every viewer.
+
+    Services are polled once per tick however many dashboards are open, and
+    not at all while none are.
+    """
+    while True:
+        await asyncio.sleep(UPDATE_INTERVAL_SECONDS)
+        if not active_connections and not sse_queues:
+            continue
         try:
-            await connection.send_json(data)
-        except:
-            active_connections.remove(connection)
+            await broadcast_update(await collect_all_metrics())
+        except Exception:
+            pass  # skip this snapshot; the next tick tries again
+
+
+async def _send_batched(websocket: WebSocket, queue: UpdateQueue):
+    """Drain a connection's queue, sending everything pending as one frame.
+
+    A lone update is sent as-is; bursts go out as {"batch": [...]} so the
+    client pays for one frame instead of one per update. Frames are binary
+    MessagePack when msgpack is installed, JSON text otherwise.
+    """
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < MAX_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        payload = batch[0] if len(batch) == 1 else {"batch": batch}
+        if msgpack is not None:
+            await websocket.send_bytes(msgpack.packb(payload))
+        else:
+            await websocket.send_json(payload)
+
+
+async def _wait_for_disconnect(websocket: WebSocket):
+    """Return once the client has gone away."""
+    try:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    except WebSocketDisconnect:
+        pass
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for live dashboard updates."""
     await websocket.accept()
-    active_connections.append(websocket)
+    queue = UpdateQueue()
+    active_connections[websocket] = queue
+    # Updates are pushed by _publish_updates through the sender. The
+    # connection ends when the client goes away or a send fails, whichever
+    # comes first, so a dead socket is never left queued for
+    receiver = asyncio.create_task(_wait_for_disconnect(websocket))
+    sender = asyncio.create_task(_send_batched(websocket, queue))
     
     try:
-        while True:
-            # Send updates every 2 seconds
-            await asyncio.sleep(2)
-            
-            # Collect data from all services
-            update_data = await collect_all_metrics()
-            await websocket.send_json(update_data)
+        done, _ = await asyncio.wait({receiver, sender}, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.exception()  # retrieved so a failed send is not reported as unhandled
+    finally:
+        receiver.cancel()
+        sender.cancel()
+        active_connections.pop(websocket, None)
+
+
+@app.get("/sse")
+async def sse_endpoint():
+    """Server-sent events stream of dashboard updates.
+
+    One-way alternative to /ws for read-only consumers: plain HTTP framing,
+    no ping/pong bookkeeping, and browsers reconnect EventSource on their own.
+    """
+    async def event_stream():
+        queue = UpdateQueue()
+        sse_queues.add(queue)
+        try:
+            # Ask EventSource to wait one tick before reconnecting
+            yield "retry: 2000\n\n"
+            while True:
+                update_data = await queue.get()
+                yield f"data: {dumps(update_data).decode()}\n\n"
+        finally:
+            sse_queues.discard(queue)
     
-    except WebSocketDisconnect:
-        active_connections.remove(websocket)
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# Paths fetched from every service per tick, in one /bulk round trip when supported
+BULK_PATHS = ["/health", "/metrics", "/logs"]
+
+# Ports whose service answered /bulk with 404 (e.g. the Node.js services)
+_no_bulk_ports = set()
+
+
+async def _fetch_json(port: int, path: str, default):
+    """GET a single endpoint, returning default on a non-200 response."""
+    resp = await app.state.http.get(f"http://localhost:{port}{path}", timeout=1)
+    return resp.json() if resp.status_code == 200 else default
+
+
+async def _collect_one(port: int):
+    """Fetch health, metrics and logs for one service.
+
+    Uses the batched /bulk endpoint where available and falls back to
+    the individual endpoints for services that don't expose it.
+    """
+    if port not in _no_bulk_ports:
+        resp = await app.state.http.post(f"http://localhost:{port}/bulk", json={"paths": BULK_PATHS}, timeout=1)
+        if resp.status_code == 200:
+            results = resp.json()
+            return (
+                results.get("/health", {"status": "down"}),
+                results.get("/metrics", {}),
+                results.get("/logs", []),
+            )
+        if resp.status_code in (404, 405):
+            _no_bulk_ports.add(port)
+    
+    health, metrics, logs = await asyncio.gather(
+        _fetch_json(port, "/health", {"status": "down"}),
+        _fetch_json(port, "/metrics", {}),
+        _fetch_json(port, "/logs", []),
+        return_exceptions=True
+    )
+    if isinstance(health, Exception):
+        raise health
+    if isinstance(metrics, Exception):
+        metrics = {}
+    if isinstance(logs, Exception):
+        logs = []
+    return health, metrics, logs
+
+
+async def _fetch_active_calls(port: int):
+    """The call service's active call list, or None if unavailable."""
+    try:
+        resp = await app.state.http.get(f"http://localhost:{port}/active", timeout=1)
+        if resp.status_code == 200:
+            return resp.json()
+    except (httpx.HTTPError, ValueError):
+        pass
+    return None
+
+
+async def _collect_service(service_name: str, port: int):
+    """Health, metrics, logs and (for the call service) active calls."""
+    if service_name == "call":
+        collected, active_calls = await asyncio.gather(_collect_one(port), _fetch_active_calls(port))
+        return (*collected, active_calls)
+    return (*await _collect_one(port), None)
 
 
 async def collect_all_metrics():
@@ -61,58 +264,40 @@ async def collect_all_metrics():
         "call_metrics": {}
     }
     
-    for service_name, port in SERVICE_PORTS.items():
-        if service_name == "dashboard_ui":
-            continue
-        
-        try:
-            # Get health status
-            health_resp = requests.get(f"http://localhost:{port}/health", timeout=1)
-            health = health_resp.json() if health_resp.status_code == 200 else {"status": "down"}
-            
-            # Get metrics if available
-            try:
-                metrics_resp = requests.get(f"http://localhost:{port}/metrics", timeout=1)
-                metrics = metrics_resp.json() if metrics_resp.status_code == 200 else {}
-                
-                # Special handling for call service metrics
-                if service_name == "call" and metrics:
-                    data["call_metrics"] = metrics
-            except:
-                metrics = {}
-            
-            # Get logs if available
-            try:
-                logs_resp = requests.get(f"http://localhost:{port}/logs", timeout=1)
-                logs = logs_resp.json() if logs_resp.status_code == 200 else []
-                data["logs"].extend(logs)
-            except:
-                pass
-            
-            # Get active calls for call service
-            if service_name == "call":
-                try:
-                    active_resp = requests.get(f"http://localhost:{port}/active", timeout=1)
-                    if active_resp.status_code == 200:
-                        active_calls = active_resp.json()
-                        if "call_metrics" not in data:
-                            data["call_metrics"] = {}
-                        data["call_metrics"]["active_calls_list"] = active_calls
-                except:
-                    pass
-            
-            data["services"][service_name] = {
-                "status": health.get("status", "unknown"),
-                "port": port,
-                "metrics": metrics
-            }
-        
-        except Exception as e:
+    # Poll every service at once, so a tick takes as long as the slowest
+    # service rather than the sum of all of them
+    services = [(name, port) for name, port in SERVICE_PORTS.items() if name != "dashboard_ui"]
+    results = await asyncio.gather(
+        *(_collect_service(name, port) for name, port in services),
+        return_exceptions=True
+    )
+    
+    for (service_name, port), result in zip(services, results):
+        if isinstance(result, Exception):
             data["services"][service_name] = {
                 "status": "error",
                 "port": port,
-                "error": str(e)
+                "error": str(result)
             }
+            continue
+        
+        health, metrics, logs, active_calls = result
+        
+        # Special handling for call service metrics
+        if service_name == "call" and metrics:
+            data["call_metrics"] = metrics
+        
+        data["logs"].extend(logs)
+        
+        # Active calls for call service
+        if active_calls is not None:
+            data["call_metrics"]["active_calls_list"] = active_calls
+        
+        data["services"][service_name] = {
+            "status": health.get("status", "unknown"),
+            "port": port,
+            "metrics": metrics
+        }
     
     # Sort logs by timestamp
     data["logs"].sort(key=lambda x: x.get("timestamp", ""), reverse=True)
@@ -129,9 +314,9 @@ async def get_service_metrics(service_name: str, period: int = 60):
     
     port = SERVICE_PORTS[service_name]
     try:
-        resp = requests.get(f"http://localhost:{port}/metrics?period={period}", timeout=2)
+        resp = await app.state.http.get(f"http://localhost:{port}/metrics?period={period}", timeout=2)
         return resp.json() if resp.status_code == 200 else {"error": "No metrics"}
-    except:
+    except (httpx.HTTPError, ValueError):
         return {"error": "Service unavailable"}
 
 
@@ -139,7 +324,7 @@ async def get_service_metrics(service_name: str, period: int = 60):
 async def proxy_voice_transcribe(request_data: dict):
     """Proxy transcription requests to Voice service."""
     try:
-        resp = requests.post(
+        resp = await app.state.http.post(
             "http://localhost:8001/transcribe",
             json=request_data,
             timeout=30
@@ -150,15 +335,30 @@ async def proxy_voice_transcribe(request_data: dict):
 
 
 @app.post("/api/voice/synthesize")
-async def proxy_voice_synthesize(request_data: dict):
-    """Proxy synthesis requests to Voice service."""
+async def proxy_voice_synthesize(request_data: dict, request: Request):
+    """Proxy synthesis requests to Voice service.
+
+    Clients sending ``Accept: audio/wav`` get the raw WAV bytes back instead of
+    base64 JSON, so the browser never has to decode audio on its main thread.
+    """
+    want_wav = request.headers.get("accept", "").startswith("audio/wav")
     try:
-        resp = requests.post(
+        resp = await app.state.http.post(
             "http://localhost:8001/synthesize",
             json=request_data,
+            headers={"Accept": "audio/wav"} if want_wav else None,
             timeout=30
         )
-        return resp.json() if resp.status_code == 200 else {"error": resp.text}
+        if resp.status_code != 200:
+            return {"error": resp.text}
+        if not want_wav:
+            return resp.json()
+        if resp.headers.get("content-type", "").startswith("audio/"):
+            audio = resp.content
+        else:
+            # Older voice service builds only speak JSON
+            audio = base64.b64decode(resp.json()["audio_bytes"])
+        return Response(content=audio, media_type="audio/wav")
     except Exception as e:
         return {"error": str(e)}
 
@@ -167,7 +367,7 @@ async def proxy_voice_synthesize(request_data: dict):
 async def proxy_llm_answer(request_data: dict):
     """Proxy LLM answer requests to LLM service."""
     try:
-        resp = requests.post(
+        resp = await app.state.http.post(
             "http://localhost:8004/answer",
             json=request_data,
             timeout=30
@@ -178,11 +378,12 @@ async def proxy_llm_answer(request_data: dict):
 
 
 @app.get("/api/conversations/completed")
-async def proxy_conversations_completed(limit: int = 50):
+async def proxy_conversations_completed(limit: int = 50, since: float = 0):
     """Proxy request to get completed conversations from handler service."""
     try:
-        resp = requests.get(
-            f"http://localhost:8012/conversations/completed?limit={limit}",
+        resp = await app.state.http.get(
+            "http://localhost:8012/conversations/completed",
+            params={"limit": limit, "since": since},
             timeout=5
         )
         return resp.json() if resp.status_code == 200 else {"error": resp.text}
@@ -190,10 +391,65 @@ async def proxy_conversations_completed(limit: int = 50):
         return {"error": str(e), "completed_conversations": [], "count": 0}
 
 
+@app.get("/api/conversations/completed/stream")
+async def proxy_conversations_stream(limit: int = 50, since: float = 0):
+    """Relay the handler's NDJSON conversation stream as it arrives."""
+    client = app.state.http
+    try:
+        resp = await client.send(
+            client.build_request(
+                "GET",
+                "http://localhost:8012/conversations/completed/stream",
+                params={"limit": limit, "since": since},
+                timeout=5
+            ),
+            stream=True
+        )
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=502)
+    if resp.status_code != 200:
+        await resp.aread()
+        await resp.aclose()
+        return JSONResponse({"error": resp.text}, status_code=502)
+    return StreamingResponse(
+        resp.aiter_raw(),
+        media_type="application/x-ndjson",
+        headers={"X-Total-Count": resp.headers.get("X-Total-Count", "0")},
+        background=BackgroundTask(resp.aclose)
+    )
+
+
+def _accepted_codings(header: str) -> set:
+    """Content-codings an Accept-Encoding header allows, leaving out any refused with q=0."""
+    accepted = set()
+    for token in header.split(","):
+        coding, *params = (part.strip() for part in token.split(";"))
+        refused = False
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    refused = float(value) <= 0
+                except ValueError:
+                    refused = True
+        if coding and not refused:
+            accepted.add(coding.lower())
+    return accepted
+
+
 @app.get("/", response_class=HTMLResponse)
-async def get_dashboard():
-    """Serve the dashboard HTML."""
-    return HTML_TEMPLATE
+async def get_dashboard(request: Request):
+    """Serve the dashboard HTML, precompressed, answering revalidations with 304."""
+    accepted = _accepted_codings(request.headers.get("accept-encoding", ""))
+    for coding, body, etag in _HTML_VARIANTS:
+        if coding is None or coding in accepted:
+            break
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if coding is not None:
+        headers["Content-Encoding"] = coding
+    return HTMLResponse(body, headers=headers)
 
 
 # Dark-themed dashboard HTML with live updates
@@ -446,6 +702,11 @@ HTML_TEMPLATE = """
             box-shadow: 0 0 10px #238636;
         }
         
+        .connection-status.gave-up {
+            cursor: pointer;
+            box-shadow: 0 0 10px #da3633;
+        }
+        
         .test-section {
             margin-top: 15px;
             padding: 15px;
@@ -548,6 +809,10 @@ HTML_TEMPLATE = """
             color: #8b949e;
             margin-bottom: 5px;
         }
+        
+        .vrow {
+            display: flow-root;
+        }
     </style>
 </head>
 <body>
@@ -611,7 +876,24 @@ HTML_TEMPLATE = """
         
         <div class="card">
             <h2>�📈 System Metrics</h2>
-            <div class="metrics-grid" id="systemMetrics"></div>
+            <div class="metrics-grid" id="systemMetrics">
+                <div class="metric-box">
+                    <div class="metric-label">Healthy Services</div>
+                    <div class="metric-value" id="healthyServices">0/0</div>
+                </div>
+                <div class="metric-box">
+                    <div class="metric-label">Total Requests</div>
+                    <div class="metric-value" id="totalRequests">0</div>
+                </div>
+                <div class="metric-box">
+                    <div class="metric-label">Active Calls</div>
+                    <div class="metric-value" id="systemActiveCalls">0</div>
+                </div>
+                <div class="metric-box">
+                    <div class="metric-label">SMS Sent</div>
+                    <div class="metric-value" id="smsSent">0</div>
+                </div>
+            </div>
         </div>
     </div>
     
@@ -684,12 +966,33 @@ HTML_TEMPLATE = """
     <div class="card">
         <h2>� Completed Call Conversations</h2>
         <div class="controls">
-            <button onclick="refreshConversations()">🔄 Refresh</button>
+            <button onclick="refreshConversations(true)">🔄 Refresh</button>
             <span id="conversationCount" style="color: #8b949e; margin-left: 10px;">Loading...</span>
         </div>
         <div id="conversationsContainer" style="max-height: 600px; overflow-y: auto;">
             <em style="color: #8b949e;">Loading conversations...</em>
         </div>
+        <template id="convCardTpl">
+            <div style="background: #161b22; border: 1px solid #30363d; border-radius: 8px; padding: 15px; margin: 10px 0;">
+                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px; padding-bottom: 10px; border-bottom: 1px solid #30363d;">
+                    <div>
+                        <div class="conv-title" style="font-weight: bold; color: #58a6ff; font-size: 16px;"></div>
+                        <div class="conv-meta" style="color: #8b949e; font-size: 13px; margin-top: 4px;"></div>
+                    </div>
+                    <div style="text-align: right;">
+                        <div class="conv-duration" style="color: #238636; font-weight: bold;"></div>
+                        <div class="conv-count" style="color: #8b949e; font-size: 12px;"></div>
+                    </div>
+                </div>
+                <div class="conv-messages" style="max-height: 300px; overflow-y: auto;"></div>
+            </div>
+        </template>
+        <template id="convMsgTpl">
+            <div class="chat-message" style="margin: 8px 0;">
+                <div class="chat-label"><span class="conv-who"></span> <span class="conv-ts" style="color: #8b949e; font-weight: normal; font-size: 11px;"></span></div>
+                <div class="conv-text"></div>
+            </div>
+        </template>
     </div>
     
     <div class="card">
@@ -701,11 +1004,148 @@ HTML_TEMPLATE = """
         let ws;
         let chart;
         let latestData = {};
+        let dashboardFramePending = false;
+        let lastSeq = 0;
+        let droppedUpdates = 0;
         let voiceWs = null;
         let mediaRecorder = null;
         let audioContext = null;
         let audioProcessor = null;
         let isRecording = false;
+        let pcmWorker = null;
+        let ttsAudioUrl = null;
+        let logsList;
+        let chatList;
+        let conversationsList;
+        const serviceRows = new Map();
+        const htmlRange = document.createRange();
+        
+        const CHAT_GREETING = {
+            role: 'assistant',
+            label: 'ASSISTANT',
+            body: "Hello! I'm your AI banking assistant. How can I help you today?"
+        };
+        
+        // Renders only the rows of a long list that are in (or near) view,
+        // padding the rest so the scrollbar still reflects the full list.
+        // Row heights vary, so each rendered row is measured and remembered
+        // by key; rows not yet seen use an estimate.
+        class VirtualList {
+            constructor(container, renderRow, keyOf, estimate = 60, overscan = 5) {
+                this.container = container;
+                this.renderRow = renderRow;
+                this.keyOf = keyOf;
+                this.estimate = estimate;
+                this.overscan = overscan;
+                this.items = [];
+                this.emptyHtml = '';
+                this.nodeRows = false;
+                this.sizeMap = new Map();
+                this.scheduled = false;
+                this.body = document.createElement('div');
+                container.replaceChildren(this.body);
+                container.addEventListener('scroll', () => this.schedule(), { passive: true });
+            }
+            
+            setItems(items) {
+                this.items = items;
+                this.render();
+            }
+            
+            append(item) {
+                this.items.push(item);
+                this.render();
+            }
+            
+            remove(item) {
+                const i = this.items.indexOf(item);
+                if (i !== -1) {
+                    this.items.splice(i, 1);
+                    this.render();
+                }
+            }
+            
+            scrollToEnd() {
+                this.container.scrollTop = this.container.scrollHeight;
+                this.render();
+            }
+            
+            schedule() {
+                if (this.scheduled) return;
+                this.scheduled = true;
+                requestAnimationFrame(() => {
+                    this.scheduled = false;
+                    this.render();
+                });
+            }
+            
+            offsets() {
+                const n = this.items.length;
+                const offsets = new Array(n + 1);
+                offsets[0] = 0;
+                for (let i = 0; i < n; i++) {
+                    const h = this.sizeMap.get(this.keyOf(this.items[i], i));
+                    offsets[i + 1] = offsets[i] + (h === undefined ? this.estimate : h);
+                }
+                return offsets;
+            }
+            
+            render(remeasure = true) {
+                const n = this.items.length;
+                if (n === 0) {
+                    this.body.style.paddingTop = this.body.style.paddingBottom = '0px';
+                    replaceHtml(this.body, this.emptyHtml);
+                    return;
+                }
+                const offsets = this.offsets();
+                const top = this.container.scrollTop;
+                const bottom = top + this.container.clientHeight;
+                
+                // Binary search for the first row crossing the top edge
+                let lo = 0, hi = n;
+                while (lo < hi) {
+                    const mid = (lo + hi) >> 1;
+                    if (offsets[mid + 1] <= top) lo = mid + 1; else hi = mid;
+                }
+                let end = lo;
+                while (end < n && offsets[end] < bottom) end++;
+                const start = Math.max(0, lo - this.overscan);
+                end = Math.min(n, end + this.overscan);
+                
+                this.body.style.paddingTop = `${offsets[start]}px`;
+                this.body.style.paddingBottom = `${offsets[n] - offsets[end]}px`;
+                if (this.nodeRows) {
+                    // renderRow returns ready-built DOM nodes
+                    const fragment = document.createDocumentFragment();
+                    for (let i = start; i < end; i++) {
+                        const row = document.createElement('div');
+                        row.className = 'vrow';
+                        row.appendChild(this.renderRow(this.items[i], i));
+                        fragment.appendChild(row);
+                    }
+                    this.body.replaceChildren(fragment);
+                } else {
+                    let html = '';
+                    for (let i = start; i < end; i++) {
+                        html += `<div class="vrow">${this.renderRow(this.items[i], i)}</div>`;
+                    }
+                    replaceHtml(this.body, html);
+                }
+                
+                // Record real heights; one more pass if any estimate was off
+                let changed = false;
+                const rows = this.body.children;
+                for (let i = start; i < end; i++) {
+                    const key = this.keyOf(this.items[i], i);
+                    const h = rows[i - start].offsetHeight;
+                    if (this.sizeMap.get(key) !== h) {
+                        this.sizeMap.set(key, h);
+                        changed = true;
+                    }
+                }
+                if (changed && remeasure) this.render(false);
+            }
+        }
         
         // Use dashboard proxy endpoints instead of direct service calls
         const VOICE_API = '/api/voice';
@@ -745,17 +1185,22 @@ HTML_TEMPLATE = """
                         audioProcessor = audioContext.createScriptProcessor(4096, 1, 1);
                         
                         let chunkCount = 0;
-                        audioProcessor.onaudioprocess = (e) => {
+                        pcmWorker = createPcmWorker();
+                        pcmWorker.onmessage = (e) => {
                             if (voiceWs && voiceWs.readyState === WebSocket.OPEN) {
-                                const inputData = e.inputBuffer.getChannelData(0);
-                                const pcm16 = floatTo16BitPCM(inputData);
-                                voiceWs.send(pcm16);
+                                voiceWs.send(e.data);
                                 chunkCount++;
                                 if (chunkCount % 10 === 0) {
                                     console.log('Sent audio chunk', chunkCount);
                                 }
                             }
                         };
+                        audioProcessor.onaudioprocess = (e) => {
+                            // The input buffer is reused by the audio thread, so
+                            // hand the worker a copy and transfer it (no clone).
+                            const samples = e.inputBuffer.getChannelData(0).slice();
+                            pcmWorker.postMessage(samples, [samples.buffer]);
+                        };
                         
                         source.connect(audioProcessor);
                         audioProcessor.connect(audioContext.destination);
@@ -795,12 +1240,12 @@ HTML_TEMPLATE = """
                         console.log('Final:', msg.text);
                         const output = document.getElementById('transcriptOutput');
                         const timestamp = new Date().toLocaleTimeString();
-                        output.innerHTML += `<div style="color: #238636; margin-top: 5px;"><strong>[${timestamp}]</strong> ${escapeHtml(msg.text)}</div>`;
+                        output.insertAdjacentHTML('beforeend', `<div style="color: #238636; margin-top: 5px;"><strong>[${timestamp}]</strong> ${escapeHtml(msg.text)}</div>`);
                         output.scrollTop = output.scrollHeight;
                     } else if (msg.type === 'error') {
                         console.error('Transcription error:', msg.error);
-                        document.getElementById('transcriptOutput').innerHTML += 
-                            `<div style="color: #da3633;">❌ Error: ${escapeHtml(msg.error)}</div>`;
+                        document.getElementById('transcriptOutput').insertAdjacentHTML('beforeend',
+                            `<div style="color: #da3633;">❌ Error: ${escapeHtml(msg.error)}</div>`);
                     } else if (msg.type === 'stopped') {
                         console.log('Live transcription stopped');
                     }
@@ -841,6 +1286,10 @@ HTML_TEMPLATE = """
                 audioProcessor = null;
                 audioContext = null;
             }
+            if (pcmWorker) {
+                pcmWorker.terminate();
+                pcmWorker = null;
+            }
             
             if (voiceWs && voiceWs.readyState === WebSocket.OPEN) {
                 voiceWs.send(JSON.stringify({ type: 'stop' }));
@@ -855,20 +1304,34 @@ HTML_TEMPLATE = """
             
             const output = document.getElementById('transcriptOutput');
             if (output.innerHTML.includes('Recording')) {
-                output.innerHTML += '<div style="color: #8b949e; margin-top: 10px;"><em>Recording stopped.</em></div>';
+                output.insertAdjacentHTML('beforeend', '<div style="color: #8b949e; margin-top: 10px;"><em>Recording stopped.</em></div>');
             }
         }
         
         // Helper: Convert Float32 to PCM16
+        // Writes straight into an Int16Array (little-endian on every browser
+        // platform) so the JIT can vectorise the clamp/scale loop instead of
+        // dispatching a DataView call per sample.
         function floatTo16BitPCM(float32Array) {
-            const buffer = new ArrayBuffer(float32Array.length * 2);
-            const view = new DataView(buffer);
-            let offset = 0;
-            for (let i = 0; i < float32Array.length; i++, offset += 2) {
-                const s = Math.max(-1, Math.min(1, float32Array[i]));
-                view.setInt16(offset, s < 0 ? s * 0x8000 : s * 0x7FFF, true);
+            const n = float32Array.length;
+            const out = new Int16Array(n);
+            for (let i = 0; i < n; i++) {
+                let s = float32Array[i];
+                s = s < -1 ? -1 : (s > 1 ? 1 : s);
+                out[i] = s < 0 ? s * 0x8000 : s * 0x7FFF;
             }
-            return buffer;
+            return out.buffer;
+        }
+
+        // Runs floatTo16BitPCM in a dedicated worker so encoding never competes
+        // with rendering; buffers are transferred both ways.
+        function createPcmWorker() {
+            const src = floatTo16BitPCM.toString() +
+                ';onmessage = (e) => { const buf = floatTo16BitPCM(e.data); postMessage(buf, [buf]); };';
+            const url = URL.createObjectURL(new Blob([src], { type: 'text/javascript' }));
+            const worker = new Worker(url);
+            URL.revokeObjectURL(url);
+            return worker;
         }
 
         async function synthesizeSpeech() {
@@ -886,21 +1349,24 @@ HTML_TEMPLATE = """
             try {
                 const response = await fetch(`${VOICE_API}/synthesize`, {
                     method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
+                    headers: { 'Content-Type': 'application/json', 'Accept': 'audio/wav' },
                     body: JSON.stringify({ text })
                 });
 
-                const data = await response.json();
+                const isAudio = (response.headers.get('Content-Type') || '').startsWith('audio/');
+                const data = isAudio ? null : await response.json();
 
-                if (response.ok) {
-                    const audioData = `data:audio/wav;base64,${data.audio_bytes}`;
-                    document.getElementById('audioPlayer').src = audioData;
+                if (response.ok && isAudio) {
+                    // Play the bytes straight from a Blob URL; no base64 decode
+                    if (ttsAudioUrl) URL.revokeObjectURL(ttsAudioUrl);
+                    ttsAudioUrl = URL.createObjectURL(await response.blob());
+                    document.getElementById('audioPlayer').src = ttsAudioUrl;
                     document.getElementById('audioPlayer').style.display = 'block';
                     document.getElementById('audioPlayer').play();
                     document.getElementById('ttsOutput').innerHTML = '✅ Speech synthesized successfully!';
                     document.getElementById('ttsOutput').style.color = '#238636';
                 } else {
-                    throw new Error(data.error || 'Synthesis failed');
+                    throw new Error((data && data.error) || 'Synthesis failed');
                 }
             } catch (error) {
                 document.getElementById('ttsOutput').innerHTML = `❌ Error: ${error.message}`;
@@ -916,23 +1382,13 @@ HTML_TEMPLATE = """
             if (!question) return;
             
             // Add user message
-            const chatMessages = document.getElementById('chatMessages');
-            chatMessages.innerHTML += `
-                <div class="chat-message user">
-                    <div class="chat-label">YOU</div>
-                    <div>${escapeHtml(question)}</div>
-                </div>
-            `;
+            chatList.append({ role: 'user', label: 'YOU', body: escapeHtml(question) });
             
             // Add loading message
-            chatMessages.innerHTML += `
-                <div class="chat-message assistant" id="loading-message">
-                    <div class="chat-label">ASSISTANT</div>
-                    <div>🔄 Thinking...</div>
-                </div>
-            `;
+            const loadingMessage = { role: 'assistant', label: 'ASSISTANT', body: '🔄 Thinking...' };
+            chatList.append(loadingMessage);
             
-            chatMessages.scrollTop = chatMessages.scrollHeight;
+            chatList.scrollToEnd();
             input.value = '';
             
             try {
@@ -945,84 +1401,186 @@ HTML_TEMPLATE = """
                 const data = await response.json();
                 
                 // Remove loading message
-                document.getElementById('loading-message').remove();
+                chatList.remove(loadingMessage);
                 
                 if (response.ok) {
-                    chatMessages.innerHTML += `
-                        <div class="chat-message assistant">
-                            <div class="chat-label">ASSISTANT (Confidence: ${(data.confidence * 100).toFixed(1)}%)</div>
-                            <div>${escapeHtml(data.answer)}</div>
-                        </div>
-                    `;
+                    chatList.append({
+                        role: 'assistant',
+                        label: `ASSISTANT (Confidence: ${(data.confidence * 100).toFixed(1)}%)`,
+                        body: escapeHtml(data.answer)
+                    });
                 } else {
                     throw new Error(data.error || 'Failed to get answer');
                 }
             } catch (error) {
-                document.getElementById('loading-message').remove();
-                chatMessages.innerHTML += `
-                    <div class="chat-message assistant">
-                        <div class="chat-label">ERROR</div>
-                        <div style="color: #da3633;">❌ ${escapeHtml(error.message)}</div>
-                    </div>
-                `;
+                chatList.remove(loadingMessage);
+                chatList.append({
+                    role: 'assistant',
+                    label: 'ERROR',
+                    body: `<span style="color: #da3633;">❌ ${escapeHtml(error.message)}</span>`
+                });
             }
             
-            chatMessages.scrollTop = chatMessages.scrollHeight;
+            chatList.scrollToEnd();
         }
 
         function clearChat() {
-            document.getElementById('chatMessages').innerHTML = `
-                <div class="chat-message assistant">
-                    <div class="chat-label">ASSISTANT</div>
-                    <div>Hello! I'm your AI banking assistant. How can I help you today?</div>
+            chatList.setItems([CHAT_GREETING]);
+        }
+        
+        function renderChatMessage(msg) {
+            return `
+                <div class="chat-message ${msg.role}">
+                    <div class="chat-label">${msg.label}</div>
+                    <div>${msg.body}</div>
                 </div>
             `;
         }
 
+        // Parse markup into a detached fragment and swap it in with one DOM mutation
+        function replaceHtml(container, html) {
+            container.replaceChildren(htmlRange.createContextualFragment(html));
+        }
+
+        // Table-driven escaping: no throwaway DOM element per call
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+        const HTML_ESCAPE_RE = /[&<>"']/g;
+        const HTML_ESCAPE_TEST = /[&<>"']/;
+        const escapeHtmlChar = (c) => HTML_ESCAPES[c];
         function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
+            if (text == null) return '';
+            const s = String(text);
+            return HTML_ESCAPE_TEST.test(s) ? s.replace(HTML_ESCAPE_RE, escapeHtmlChar) : s;
         }
         
+        // Minimal MessagePack decoder for the binary frames pushed on /ws
+        const utf8Decoder = new TextDecoder();
+        function decodeMsgpack(buffer) {
+            const view = new DataView(buffer);
+            const bytes = new Uint8Array(buffer);
+            let pos = 0;
+            const str = (n) => { const s = utf8Decoder.decode(bytes.subarray(pos, pos + n)); pos += n; return s; };
+            const bin = (n) => { const b = bytes.slice(pos, pos + n); pos += n; return b; };
+            const arr = (n) => { const a = new Array(n); for (let i = 0; i < n; i++) a[i] = read(); return a; };
+            const map = (n) => { const o = {}; for (let i = 0; i < n; i++) { const k = read(); o[k] = read(); } return o; };
+            function read() {
+                const t = bytes[pos++];
+                if (t < 0x80) return t;
+                if (t < 0x90) return map(t & 0x0f);
+                if (t < 0xa0) return arr(t & 0x0f);
+                if (t < 0xc0) return str(t & 0x1f);
+                if (t >= 0xe0) return t - 0x100;
+                let v;
+                switch (t) {
+                    case 0xc0: return null;
+                    case 0xc2: return false;
+                    case 0xc3: return true;
+                    case 0xc4: return bin(bytes[pos++]);
+                    case 0xc5: v = view.getUint16(pos); pos += 2; return bin(v);
+                    case 0xc6: v = view.getUint32(pos); pos += 4; return bin(v);
+                    case 0xca: v = view.getFloat32(pos); pos += 4; return v;
+                    case 0xcb: v = view.getFloat64(pos); pos += 8; return v;
+                    case 0xcc: return bytes[pos++];
+                    case 0xcd: v = view.getUint16(pos); pos += 2; return v;
+                    case 0xce: v = view.getUint32(pos); pos += 4; return v;
+                    case 0xcf: v = Number(view.getBigUint64(pos)); pos += 8; return v;
+                    case 0xd0: return view.getInt8(pos++);
+                    case 0xd1: v = view.getInt16(pos); pos += 2; return v;
+                    case 0xd2: v = view.getInt32(pos); pos += 4; return v;
+                    case 0xd3: v = Number(view.getBigInt64(pos)); pos += 8; return v;
+                    case 0xd9: return str(bytes[pos++]);
+                    case 0xda: v = view.getUint16(pos); pos += 2; return str(v);
+                    case 0xdb: v = view.getUint32(pos); pos += 4; return str(v);
+                    case 0xdc: v = view.getUint16(pos); pos += 2; return arr(v);
+                    case 0xdd: v = view.getUint32(pos); pos += 4; return arr(v);
+                    case 0xde: v = view.getUint16(pos); pos += 2; return map(v);
+                    case 0xdf: v = view.getUint32(pos); pos += 4; return map(v);
+                }
+                throw new Error('Unsupported MessagePack type 0x' + t.toString(16));
+            }
+            return read();
+        }
+
+        // Reconnect backoff: fast retry for blips, doubling with jitter up to
+        // WS_MAX_RETRY_MS, giving up after WS_MAX_RETRIES until clicked
+        const WS_MIN_RETRY_MS = 200;
+        const WS_MAX_RETRY_MS = 5000;
+        const WS_MAX_RETRIES = 20;
+        let wsRetryMs = WS_MIN_RETRY_MS;
+        let wsRetries = 0;
+        
         function connectWebSocket() {
             const wsUrl = `ws://${window.location.host}/ws`;
+            const status = document.getElementById('wsStatus');
+            status.classList.remove('gave-up');
+            status.title = 'Connecting...';
+            status.onclick = null;
             ws = new WebSocket(wsUrl);
+            ws.binaryType = 'arraybuffer';
             
             ws.onopen = () => {
-                document.getElementById('wsStatus').classList.add('connected');
+                status.classList.add('connected');
+                status.title = 'Connected';
+                wsRetryMs = WS_MIN_RETRY_MS;
+                wsRetries = 0;
+                lastSeq = 0;
                 console.log('WebSocket connected');
             };
             
             ws.onclose = () => {
-                document.getElementById('wsStatus').classList.remove('connected');
+                status.classList.remove('connected');
+                if (++wsRetries > WS_MAX_RETRIES) {
+                    console.log('WebSocket disconnected, giving up');
+                    status.classList.add('gave-up');
+                    status.title = 'Disconnected - click to reconnect';
+                    status.onclick = () => {
+                        wsRetryMs = WS_MIN_RETRY_MS;
+                        wsRetries = 0;
+                        connectWebSocket();
+                    };
+                    return;
+                }
+                const delay = wsRetryMs + Math.random() * 100;
+                wsRetryMs = Math.min(wsRetryMs * 2, WS_MAX_RETRY_MS);
+                status.title = `Disconnected - retrying in ${(delay / 1000).toFixed(1)}s`;
                 console.log('WebSocket disconnected, reconnecting...');
-                setTimeout(connectWebSocket, 3000);
+                setTimeout(connectWebSocket, delay);
             };
             
             ws.onmessage = (event) => {
-                const data = JSON.parse(event.data);
-                latestData = data;
-                updateDashboard(data);
+                const data = typeof event.data === 'string'
+                    ? JSON.parse(event.data)
+                    : decodeMsgpack(event.data);
+                // Bursts arrive as a single {batch: [...]} frame; each update is
+                // a full snapshot, so only the newest one needs rendering
+                const items = data.batch || [data];
+                for (const item of items) {
+                    // The server drops its oldest queued updates when we fall
+                    // behind; any newer snapshot already carries full state
+                    if (item.seq > lastSeq + 1) {
+                        droppedUpdates += item.seq - lastSeq - 1;
+                        console.warn(`Dropped ${item.seq - lastSeq - 1} dashboard update(s), ${droppedUpdates} total`);
+                    }
+                    lastSeq = item.seq;
+                }
+                latestData = items[items.length - 1];
+                scheduleDashboardUpdate();
             };
         }
         
+        // Render at most once per display frame, always from the newest snapshot
+        function scheduleDashboardUpdate() {
+            if (dashboardFramePending) return;
+            dashboardFramePending = true;
+            requestAnimationFrame(() => {
+                dashboardFramePending = false;
+                updateDashboard(latestData);
+            });
+        }
+        
         function updateDashboard(data) {
             // Update services status
-            const servicesHtml = Object.entries(data.services || {}).map(([name, info]) => {
-                const status = info.status === 'ok' ? 'healthy' : 'down';
-                const badge = info.status === 'ok' ? 'status-ok' : 'status-down';
-                return `
-                    <div class="service-item ${status}">
-                        <div>
-                            <div class="service-name">${name}</div>
-                            <div class="service-port">Port ${info.port}</div>
-                        </div>
-                        <span class="status-badge ${badge}">${info.status.toUpperCase()}</span>
-                    </div>
-                `;
-            }).join('');
-            document.getElementById('servicesContainer').innerHTML = servicesHtml;
+            updateServices(data.services || {});
             
             // Update call metrics
             updateCallMetrics(data.call_metrics || {});
@@ -1032,39 +1590,125 @@ HTML_TEMPLATE = """
             
             // Update logs
             updateLogs(data.logs || []);
+            
+            // The handler bumps this counter whenever a conversation completes;
+            // fetch just the new ones instead of polling the whole list
+            const handler = (data.services || {}).handler;
+            const counters = handler && handler.metrics && handler.metrics.counters;
+            if (counters) {
+                const completed = counters.conversations_completed || 0;
+                if (completed !== convCompletedCount) {
+                    convCompletedCount = completed;
+                    refreshConversations();
+                }
+            }
+        }
+        
+        // Write text only when it changed, so unchanged ticks touch no DOM
+        function setText(el, value) {
+            const text = String(value);
+            if (el.textContent !== text) el.textContent = text;
+        }
+        
+        // Keyed by service name: patches status/port in place, creating rows
+        // only for new services and removing rows for services that vanished
+        function updateServices(services) {
+            const container = els.servicesContainer;
+            for (const name in services) {
+                const info = services[name];
+                let row = serviceRows.get(name);
+                if (!row) {
+                    const fragment = htmlRange.createContextualFragment(`
+                        <div class="service-item">
+                            <div>
+                                <div class="service-name"></div>
+                                <div class="service-port"></div>
+                            </div>
+                            <span class="status-badge"></span>
+                        </div>
+                    `);
+                    const el = fragment.firstElementChild;
+                    el.querySelector('.service-name').textContent = name;
+                    row = {
+                        el,
+                        port: el.querySelector('.service-port'),
+                        badge: el.querySelector('.status-badge'),
+                        status: null
+                    };
+                    serviceRows.set(name, row);
+                    container.appendChild(el);
+                }
+                if (row.status !== info.status) {
+                    const ok = info.status === 'ok';
+                    row.el.className = `service-item ${ok ? 'healthy' : 'down'}`;
+                    row.badge.className = `status-badge ${ok ? 'status-ok' : 'status-down'}`;
+                    row.badge.textContent = info.status.toUpperCase();
+                    row.status = info.status;
+                }
+                setText(row.port, `Port ${info.port}`);
+            }
+            for (const [name, row] of serviceRows) {
+                if (!(name in services)) {
+                    row.el.remove();
+                    serviceRows.delete(name);
+                }
+            }
         }
         
+        // Panel elements updated every tick, looked up once
+        const els = {
+            totalCalls: document.getElementById('totalCalls'),
+            answeredCalls: document.getElementById('answeredCalls'),
+            completedCalls: document.getElementById('completedCalls'),
+            activeCalls: document.getElementById('activeCalls'),
+            userHangups: document.getElementById('userHangups'),
+            systemHangups: document.getElementById('systemHangups'),
+            avgDuration: document.getElementById('avgDuration'),
+            successRate: document.getElementById('successRate'),
+            activeCallsList: document.getElementById('activeCallsList'),
+            healthyServices: document.getElementById('healthyServices'),
+            totalRequests: document.getElementById('totalRequests'),
+            systemActiveCalls: document.getElementById('systemActiveCalls'),
+            smsSent: document.getElementById('smsSent'),
+            servicesContainer: document.getElementById('servicesContainer'),
+            conversationCount: document.getElementById('conversationCount')
+        };
+        
         function updateCallMetrics(metrics) {
             if (Object.keys(metrics).length === 0) {
                 // No metrics available
-                document.getElementById('totalCalls').textContent = '-';
-                document.getElementById('answeredCalls').textContent = '-';
-                document.getElementById('completedCalls').textContent = '-';
-                document.getElementById('activeCalls').textContent = '-';
-                document.getElementById('userHangups').textContent = '-';
-                document.getElementById('systemHangups').textContent = '-';
-                document.getElementById('avgDuration').textContent = '-';
-                document.getElementById('successRate').textContent = '-';
+                setText(els.totalCalls, '-');
+                setText(els.answeredCalls, '-');
+                setText(els.completedCalls, '-');
+                setText(els.activeCalls, '-');
+                setText(els.userHangups, '-');
+                setText(els.systemHangups, '-');
+                setText(els.avgDuration, '-');
+                setText(els.successRate, '-');
                 return;
             }
             
             // Update call metric values
-            document.getElementById('totalCalls').textContent = metrics.totalCalls || 0;
-            document.getElementById('answeredCalls').textContent = metrics.answeredCalls || 0;
-            document.getElementById('completedCalls').textContent = metrics.completedCalls || 0;
-            document.getElementById('activeCalls').textContent = metrics.activeCalls || 0;
-            document.getElementById('userHangups').textContent = metrics.userHangups || 0;
-            document.getElementById('systemHangups').textContent = metrics.systemHangups || 0;
-            document.getElementById('avgDuration').textContent = metrics.averageDuration || '0s';
-            document.getElementById('successRate').textContent = metrics.successRate || '0%';
+            setText(els.totalCalls, metrics.totalCalls || 0);
+            setText(els.answeredCalls, metrics.answeredCalls || 0);
+            setText(els.completedCalls, metrics.completedCalls || 0);
+            setText(els.activeCalls, metrics.activeCalls || 0);
+            setText(els.userHangups, metrics.userHangups || 0);
+            setText(els.systemHangups, metrics.systemHangups || 0);
+            setText(els.avgDuration, metrics.averageDuration || '0s');
+            setText(els.successRate, metrics.successRate || '0%');
             
             // Update active calls list
-            const activeCallsList = document.getElementById('activeCallsList');
-            if (metrics.active_calls_list && metrics.active_calls_list.length > 0) {
-                const callsHtml = metrics.active_calls_list.map(call => {
+            const activeCallsList = els.activeCallsList;
+            const calls = metrics.active_calls_list;
+            if (calls && calls.length > 0) {
+                const nowSec = Date.now() / 1000;
+                let callsHtml = '';
+                for (let i = 0; i < calls.length; i++) {
+                    const call = calls[i];
                     const startTime = new Date(call.started_at * 1000).toLocaleTimeString();
-                    const duration = Math.floor((Date.now() / 1000) - call.started_at);
-                    return `
+                    const duration = Math.floor(nowSec - call.started_at);
+                    callsHtml += `
                         <div style="padding: 8px; margin: 4px 0; background: #161b22; border-radius: 4px; border-left: 3px solid #58a6ff;">
                             <div style="font-weight: bold; color: #c9d1d9;">📞 ${escapeHtml(call.phone)}</div>
                             <div style="font-size: 12px; color: #8b949e; margin-top: 4px;">
@@ -1073,76 +1717,97 @@ HTML_TEMPLATE = """
                             ${call.transcript ? `<div style="font-size: 12px; color: #c9d1d9; margin-top: 4px; font-style: italic;">"${escapeHtml(call.transcript)}"</div>` : ''}
                         </div>
                     `;
-                }).join('');
-                activeCallsList.innerHTML = callsHtml;
+                }
+                replaceHtml(activeCallsList, callsHtml);
             } else {
-                activeCallsList.innerHTML = '<em style="color: #8b949e;">No active calls</em>';
+                replaceHtml(activeCallsList, '<em style="color: #8b949e;">No active calls</em>');
             }
         }
         
+        // Which totals a counter name feeds, as a bitmask; a name can feed
+        // several. Classified once per distinct name, then looked up.
+        const COUNTS_REQUESTS = 1;
+        const COUNTS_CALLS = 2;
+        const COUNTS_SMS = 4;
+        const counterBuckets = new Map();
+        
+        function counterBucket(key) {
+            let bucket = counterBuckets.get(key);
+            if (bucket === undefined) {
+                bucket = (key.includes('request') ? COUNTS_REQUESTS : 0) |
+                    (key.includes('call') ? COUNTS_CALLS : 0) |
+                    (key.includes('sms') || key.includes('message') ? COUNTS_SMS : 0);
+                counterBuckets.set(key, bucket);
+            }
+            return bucket;
+        }
+        
         function updateSystemMetrics(data) {
-            const metrics = {};
+            const services = data.services || {};
             let totalRequests = 0;
             let totalCalls = 0;
             let totalSMS = 0;
+            let healthyServices = 0;
+            let totalServices = 0;
             
-            Object.values(data.services || {}).forEach(service => {
-                if (service.metrics && service.metrics.counters) {
-                    Object.entries(service.metrics.counters).forEach(([key, value]) => {
-                        if (key.includes('request')) totalRequests += value;
-                        if (key.includes('call')) totalCalls += value;
-                        if (key.includes('sms') || key.includes('message')) totalSMS += value;
-                    });
+            for (const name in services) {
+                const service = services[name];
+                totalServices++;
+                if (service.status === 'ok') healthyServices++;
+                const counters = service.metrics && service.metrics.counters;
+                if (!counters) continue;
+                for (const key in counters) {
+                    const bucket = counterBucket(key);
+                    if (bucket === 0) continue;
+                    const value = counters[key];
+                    if (bucket & COUNTS_REQUESTS) totalRequests += value;
+                    if (bucket & COUNTS_CALLS) totalCalls += value;
+                    if (bucket & COUNTS_SMS) totalSMS += value;
                 }
-            });
-            
-            const healthyServices = Object.values(data.services || {}).filter(s => s.status === 'ok').length;
-            const totalServices = Object.keys(data.services || {}).length;
+            }
             
-            const metricsHtml = `
-                <div class="metric-box">
-                    <div class="metric-label">Healthy Services</div>
-                    <div class="metric-value">${healthyServices}/${totalServices}</div>
-                </div>
-                <div class="metric-box">
-                    <div class="metric-label">Total Requests</div>
-                    <div class="metric-value">${totalRequests}</div>
-                </div>
-                <div class="metric-box">
-                    <div class="metric-label">Active Calls</div>
-                    <div class="metric-value">${totalCalls}</div>
-                </div>
-                <div class="metric-box">
-                    <div class="metric-label">SMS Sent</div>
-                    <div class="metric-value">${totalSMS}</div>
-                </div>
-            `;
-            document.getElementById('systemMetrics').innerHTML = metricsHtml;
+            setText(els.healthyServices, `${healthyServices}/${totalServices}`);
+            setText(els.totalRequests, totalRequests);
+            setText(els.systemActiveCalls, totalCalls);
+            setText(els.smsSent, totalSMS);
         }
         
         function updateLogs(logs) {
-            const logsHtml = logs.slice(0, 50).map(log => {
-                const level = log.level || 'INFO';
-                return `
-                    <div class="log-entry ${level}">
-                        <span class="log-timestamp">${new Date(log.timestamp).toLocaleTimeString()}</span>
-                        <span class="log-service">[${log.service}]</span>
-                        <div class="log-message">${log.message}</div>
-                    </div>
-                `;
-            }).join('');
-            document.getElementById('logsContainer').innerHTML = logsHtml;
+            const shown = logs.slice(0, 50);
+            const prev = logsList.items;
+            // Skip the re-render when the visible entries are unchanged
+            if (shown.length === prev.length &&
+                shown.every((log, i) => logsList.keyOf(log) === logsList.keyOf(prev[i]))) {
+                return;
+            }
+            logsList.setItems(shown);
         }
         
+        function renderLogEntry(log) {
+            const level = log.level || 'INFO';
+            return `
+                <div class="log-entry ${level}">
+                    <span class="log-timestamp">${new Date(log.timestamp).toLocaleTimeString()}</span>
+                    <span class="log-service">[${log.service}]</span>
+                    <div class="log-message">${log.message}</div>
+                </div>
+            `;
+        }
+        
+        // Fixed-size chart buffers, allocated once and shifted in place
+        const CHART_POINTS = 20;
+        const chartLabels = Array.from({length: CHART_POINTS}, (_, i) => `-${CHART_POINTS - i}m`);
+        const chartSeries = new Array(CHART_POINTS).fill(0);
+        
         function initChart() {
             const ctx = document.getElementById('metricsChart').getContext('2d');
             chart = new Chart(ctx, {
                 type: 'line',
                 data: {
-                    labels: [],
+                    labels: chartLabels,
                     datasets: [{
                         label: 'Metric Value',
-                        data: [],
+                        data: chartSeries,
                         borderColor: '#58a6ff',
                         backgroundColor: 'rgba(88, 166, 255, 0.1)',
                         tension: 0.4,
@@ -1174,96 +1839,164 @@ HTML_TEMPLATE = """
         function refreshChart() {
             // In a real implementation, this would fetch time-series data
             // For now, we'll show a placeholder
-            const labels = Array.from({length: 20}, (_, i) => `-${20-i}m`);
-            const data = Array.from({length: 20}, () => Math.floor(Math.random() * 100));
-            
-            chart.data.labels = labels;
-            chart.data.datasets[0].data = data;
-            chart.update();
+            for (let i = 0; i < CHART_POINTS; i++) {
+                chartSeries[i] = Math.floor(Math.random() * 100);
+            }
+            requestAnimationFrame(() => chart.update('none'));
         }
+
         
         // Conversations Functions
-        async function refreshConversations() {
+        // ended_at of the newest conversation shown: later fetches ask only for
+        // conversations that finished after it and prepend them
+        const MAX_CONVERSATIONS = 50;
+        let convLastSeen = 0;
+        let convCompletedCount = null;
+        // Until the handler's conversations_completed counter has arrived in a
+        // snapshot, look for new conversations on a slow timer instead
+        const CONV_FALLBACK_POLL_MS = 30000;
+        
+        // Refreshes run one at a time so overlapping triggers cannot prepend
+        // the same conversations twice
+        let convRefresh = Promise.resolve();
+        
+        function refreshConversations(full = false) {
+            convRefresh = convRefresh.then(() => loadConversations(full));
+            return convRefresh;
+        }
+        
+        // Reads the NDJSON stream, showing conversations as their lines arrive
+        async function loadConversations(full) {
+            if (full) convLastSeen = 0;
             try {
-                const response = await fetch('/api/conversations/completed');
-                const data = await response.json();
-                
-                const container = document.getElementById('conversationsContainer');
-                const countSpan = document.getElementById('conversationCount');
+                const since = convLastSeen;
+                const response = await fetch(`/api/conversations/completed/stream?since=${since}`);
+                if (!response.ok) {
+                    const data = await response.json();
+                    throw new Error(data.error || `HTTP ${response.status}`);
+                }
                 
-                countSpan.textContent = `${data.count} completed conversation(s)`;
+                setText(els.conversationCount,
+                    `${response.headers.get('X-Total-Count')} completed conversation(s)`);
+                conversationsList.emptyHtml = '<em style="color: #8b949e;">No completed conversations yet</em>';
                 
-                if (data.completed_conversations && data.completed_conversations.length > 0) {
-                    const conversationsHtml = data.completed_conversations.map((conv, index) => {
-                        const startTime = new Date(conv.started_at * 1000).toLocaleString();
-                        const duration = conv.ended_at ? ((conv.ended_at - conv.started_at).toFixed(1)) : 'N/A';
-                        const messageCount = conv.messages.length;
-                        
-                        const messagesHtml = conv.messages.map(msg => {
-                            const role = msg.role === 'user' ? 'USER' : 'ASSISTANT';
-                            const roleClass = msg.role === 'user' ? 'user' : 'assistant';
-                            const icon = msg.role === 'user' ? '👤' : '🤖';
-                            const timestamp = new Date(msg.timestamp * 1000).toLocaleTimeString();
-                            
-                            return `
-                                <div class="chat-message ${roleClass}" style="margin: 8px 0;">
-                                    <div class="chat-label">${icon} ${role} <span style="color: #8b949e; font-weight: normal; font-size: 11px;">[${timestamp}]</span></div>
-                                    <div>${escapeHtml(msg.text)}</div>
-                                </div>
-                            `;
-                        }).join('');
-                        
-                        return `
-                            <div style="background: #161b22; border: 1px solid #30363d; border-radius: 8px; padding: 15px; margin: 10px 0;">
-                                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px; padding-bottom: 10px; border-bottom: 1px solid #30363d;">
-                                    <div>
-                                        <div style="font-weight: bold; color: #58a6ff; font-size: 16px;">
-                                            📞 Call ${index + 1}
-                                        </div>
-                                        <div style="color: #8b949e; font-size: 13px; margin-top: 4px;">
-                                            ${escapeHtml(conv.phone)} • ${startTime}
-                                        </div>
-                                    </div>
-                                    <div style="text-align: right;">
-                                        <div style="color: #238636; font-weight: bold;">${duration}s</div>
-                                        <div style="color: #8b949e; font-size: 12px;">${messageCount} messages</div>
-                                    </div>
-                                </div>
-                                <div style="max-height: 300px; overflow-y: auto;">
-                                    ${messagesHtml}
-                                </div>
-                            </div>
-                        `;
-                    }).join('');
-                    
-                    container.innerHTML = conversationsHtml;
-                } else {
-                    container.innerHTML = '<em style="color: #8b949e;">No completed conversations yet</em>';
+                const previous = since === 0 ? [] : conversationsList.items;
+                const fresh = [];
+                const show = () => conversationsList.setItems(fresh.concat(previous).slice(0, MAX_CONVERSATIONS));
+                const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+                let buffered = '';
+                while (true) {
+                    const { value, done } = await reader.read();
+                    if (done) break;
+                    const lines = (buffered + value).split('\\n');
+                    buffered = lines.pop();
+                    const before = fresh.length;
+                    for (const line of lines) {
+                        if (line) fresh.push(JSON.parse(line));
+                    }
+                    if (fresh.length > before) show();
                 }
+                if (buffered) fresh.push(JSON.parse(buffered));
+                if (since === 0 || fresh.length > 0) show();
+                if (fresh.length > 0) convLastSeen = fresh[0].ended_at;
             } catch (error) {
                 console.error('Error fetching conversations:', error);
-                document.getElementById('conversationsContainer').innerHTML = 
+                convLastSeen = 0;
+                conversationsList.emptyHtml =
                     `<span style="color: #da3633;">❌ Error loading conversations: ${error.message}</span>`;
+                conversationsList.setItems([]);
+            }
+        }
+        
+        // Conversation cards are cloned from <template>s and filled through
+        // textContent, so rows need no HTML parsing or escaping
+        const convCardTpl = document.getElementById('convCardTpl').content.firstElementChild;
+        const convMsgTpl = document.getElementById('convMsgTpl').content.firstElementChild;
+        
+        function renderConversation(conv, index) {
+            const startTime = new Date(conv.started_at * 1000).toLocaleString();
+            const duration = conv.ended_at ? ((conv.ended_at - conv.started_at).toFixed(1)) : 'N/A';
+            
+            const card = convCardTpl.cloneNode(true);
+            card.querySelector('.conv-title').textContent = `📞 Call ${index + 1}`;
+            card.querySelector('.conv-meta').textContent = `${conv.phone} • ${startTime}`;
+            card.querySelector('.conv-duration').textContent = `${duration}s`;
+            card.querySelector('.conv-count').textContent = `${conv.messages.length} messages`;
+            
+            const messages = card.querySelector('.conv-messages');
+            for (const msg of conv.messages) {
+                const isUser = msg.role === 'user';
+                const timestamp = new Date(msg.timestamp * 1000).toLocaleTimeString();
+                const node = convMsgTpl.cloneNode(true);
+                node.classList.add(isUser ? 'user' : 'assistant');
+                node.querySelector('.conv-who').textContent = isUser ? '👤 USER' : '🤖 ASSISTANT';
+                node.querySelector('.conv-ts').textContent = `[${timestamp}]`;
+                node.querySelector('.conv-text').textContent = msg.text;
+                messages.appendChild(node);
             }
+            return card;
         }
         
         // Initialize
+        logsList = new VirtualList(
+            document.getElementById('logsContainer'), renderLogEntry,
+            log => `${log.timestamp}|${log.service}|${log.message}`, 70
+        );
+        chatList = new VirtualList(
+            document.getElementById('chatMessages'), renderChatMessage, msg => msg, 70
+        );
+        chatList.setItems([CHAT_GREETING]);
+        conversationsList = new VirtualList(
+            document.getElementById('conversationsContainer'), renderConversation,
+            (conv, index) => conv.call_sid || index, 400, 2
+        );
+        conversationsList.nodeRows = true;
         connectWebSocket();
         initChart();
         refreshChart();
         refreshConversations();
-        
-        // Auto-refresh conversations every 30 seconds
-        setInterval(refreshConversations, 30000);
+        setInterval(() => {
+            if (convCompletedCount === null) refreshConversations();
+        }, CONV_FALLBACK_POLL_MS);
     </script>
 </body>
 </html>
 """
 
 
-@app.get("/health")
-def health():
-    return {"status": "ok", "service": "dashboard_ui"}
+_SCRIPT_RE = re.compile(r"(<script\b.*?</script>)", re.S | re.I)
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_WS_RE = re.compile(r"\s+")
+_INDENT_RE = re.compile(r"^[ \t]+|[ \t]+$", re.M)
+_BLANK_LINES_RE = re.compile(r"\n{2,}")
+
+
+def _minify_html(html: str) -> str:
+    """Strip comments and redundant whitespace from the dashboard markup.
+
+    Markup and CSS whitespace is collapsed to single spaces (which renders
+    identically); inside <script> only indentation and blank lines are
+    dropped so newline-sensitive JS is left intact.
+    """
+    parts = _SCRIPT_RE.split(html)
+    for i, part in enumerate(parts):
+        if i % 2:
+            parts[i] = _BLANK_LINES_RE.sub("\n", _INDENT_RE.sub("", part))
+        else:
+            parts[i] = _WS_RE.sub(" ", _COMMENT_RE.sub("", part))
+    return "".join(parts).strip()
+
+
+# Minified once at import; served as-is on every dashboard load
+_HTML_MIN_BYTES = _minify_html(HTML_TEMPLATE).encode("utf-8")
+_HTML_HASH = hashlib.blake2b(_HTML_MIN_BYTES, digest_size=8).hexdigest()
+
+# Compressed once at import too, best encoding first: (content-coding, body, etag)
+_HTML_VARIANTS = []
+if brotli is not None:
+    _HTML_VARIANTS.append(("br", brotli.compress(_HTML_MIN_BYTES, quality=11), f'"{_HTML_HASH}-br"'))
+_HTML_VARIANTS.append(("gzip", gzip.compress(_HTML_MIN_BYTES, compresslevel=9, mtime=0), f'"{_HTML_HASH}-gzip"'))
+_HTML_VARIANTS.append((None, _HTML_MIN_BYTES, f'"{_HTML_HASH}"'))
 
 
 if __name__ == "__main__":
@@ -38,6 +38,65 @@ def test_metrics_endpoint():
     assert "service" in data
 
 
+def test_dashboard_html_is_minified():
+    """Test the dashboard page is served minified."""
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.text.startswith("<!DOCTYPE html>")
+    assert "<!--" not in response.text
+    assert "connectWebSocket();" in response.text
+
+
+def test_dashboard_html_revalidates_with_etag():
+    """Test a matching If-None-Match gets an empty 304."""
+    etag = client.get("/").headers["etag"]
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_update_queue_drops_oldest_and_numbers_updates():
+    """Test the per-connection queue stays bounded and stamps seq."""
+    from services.dashboard_ui.service import UpdateQueue
+
+    queue = UpdateQueue(maxsize=2)
+    for i in range(3):
+        queue.offer({"n": i})
+    assert queue.qsize() == 2
+    assert [queue.get_nowait()["seq"] for _ in range(2)] == [2, 3]
+
+
+def test_failed_send_drops_websocket_connection(monkeypatch):
+    """Test a connection whose sender fails stops being queued for before the client leaves."""
+    import time
+    from services.dashboard_ui import service
+
+    async def broken_sender(websocket, queue):
+        raise RuntimeError("send failed")
+
+    monkeypatch.setattr(service, "_send_batched", broken_sender)
+    with client.websocket_connect("/ws"):
+        deadline = time.monotonic() + 2
+        while service.active_connections and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not service.active_connections
+
+
+def test_dashboard_html_is_precompressed():
+    """Test the page is sent compressed when the client accepts it."""
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text.startswith("<!DOCTYPE html>")
+
+    response = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.text.startswith("<!DOCTYPE html>")
+
+    response = client.get("/", headers={"Accept-Encoding": "br;q=0, gzip;q=0.5"})
+    assert response.headers["content-encoding"] == "gzip"
+
+
 # Add service-specific tests here
 
 if __name__ == "__main__":
@@ -2,22 +2,28 @@
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Run as a script: add the project root to the path. Imported as
+    # services.<name>.service (tests, uvicorn workers) it is already there.
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
 from fastapi import FastAPI
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List
 import time
 from bankassist.services.db import DatabaseService, Transaction
 from shared.utils.logger import ServiceLogger
 from shared.utils.metrics import MetricsCollector
+from shared.utils.bulk import add_bulk_endpoint
+from shared.utils.health import add_health_route
+from shared.utils.json import DefaultResponse
 
 from services.database import config
 
-app = FastAPI(title="Database Service")
+app = FastAPI(title="Database Service", default_response_class=DefaultResponse)
+add_bulk_endpoint(app)
+add_health_route(app, "db")
 db_svc = DatabaseService()
 
 # Initialize logger and metrics
@@ -63,6 +69,12 @@ class ReadTransactionsRequest(BaseModel):
     limit: int = 10
 
 
+class AccountSummaryResponse(BaseModel):
+    account_id: str
+    balance: float
+    transactions: List[TransactionResponse]
+
+
 @app.post("/ensure_account")
 def ensure_account(req: EnsureAccountRequest):
     logger.info(f"Ensuring account '{req.account_id}' with balance ${req.balance:.2f}", account=req.account_id)
@@ -83,7 +95,7 @@ def get_balance(req: BalanceRequest):
     metrics.timing("balance_read_duration", elapsed)
     logger.info(f"Balance for '{req.account_id}': ${balance:.2f}", account=req.account_id, balance=balance)
     
-    return BalanceResponse(account_id=req.account_id, balance=balance)
+    return {"account_id": req.account_id, "balance": balance}
 
 
 @app.post("/write_transaction", response_model=TransactionResponse)
@@ -100,7 +112,8 @@ def write_transaction(req: WriteTransactionRequest):
     metrics.timing("transaction_write_duration", elapsed)
     logger.info(f"Transaction #{tx.id} written successfully", tx_id=tx.id)
     
-    return TransactionResponse(id=tx.id, account_id=tx.account_id, counterparty=tx.counterparty, amount=tx.amount, type=tx.type)
+    # Plain dicts are validated once against response_model
+    return vars(tx)
 
 
 @app.post("/read_transactions", response_model=List[TransactionResponse])
@@ -115,12 +128,25 @@ def read_transactions(req: ReadTransactionsRequest):
     metrics.timing("transaction_read_duration", elapsed)
     logger.info(f"Read {len(txs)} transactions for '{req.account_id}'", account=req.account_id, count=len(txs))
     
-    return [TransactionResponse(id=t.id, account_id=t.account_id, counterparty=t.counterparty, amount=t.amount, type=t.type) for t in txs]
+    return [vars(t) for t in txs]
 
 
-@app.get("/health")
-def health():
-    return {"status": "ok", "service": "db"}
+@app.post("/account_summary", response_model=AccountSummaryResponse)
+def account_summary(req: ReadTransactionsRequest):
+    """Balance and recent transactions in one round trip."""
+    start_time = time.time()
+    logger.debug(f"Reading balance and {req.limit} transactions for '{req.account_id}'", account=req.account_id, limit=req.limit)
+    metrics.increment("balance_reads")
+    metrics.increment("transaction_reads")
+    
+    balance = db_svc.balance_of(req.account_id)
+    txs = db_svc.read_transactions(req.account_id, req.limit)
+    
+    elapsed = time.time() - start_time
+    metrics.timing("account_summary_duration", elapsed)
+    logger.info(f"Summary for '{req.account_id}': ${balance:.2f}, {len(txs)} transactions", account=req.account_id, balance=balance, count=len(txs))
+    
+    return {"account_id": req.account_id, "balance": balance, "transactions": [vars(t) for t in txs]}
 
 
 @app.get("/logs")
@@ -130,11 +156,11 @@ def get_logs(limit: int = 100):
 
 
 @app.get("/metrics")
-def get_metrics(period: Optional[int] = None):
+def get_metrics(period: int = 60):
     """Get metrics from this service."""
     return metrics.get_all_metrics(time_period_minutes=period)
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=config.PORT)
+    uvicorn.run(app, host="0.0.0.0", port=config.PORT, timeout_keep_alive=75)
@@ -38,6 +38,17 @@ def test_metrics_endpoint():
     assert "service" in data
 
 
+def test_bulk_endpoint():
+    """Test batched health/metrics/logs fetch."""
+    response = client.post("/bulk", json={"paths": ["/health", "/logs", "/missing", "/openapi.json"]})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["/health"]["status"] == "ok"
+    assert isinstance(data["/logs"], list)
+    assert "/missing" not in data
+    assert "/openapi.json" not in data  # only monitoring paths are served
+
+
 
 def test_ensure_account():
     """Test account creation."""
@@ -64,5 +75,17 @@ def test_get_balance():
     assert "balance" in data
 
 
+def test_account_summary():
+    """Balance and recent transactions come back together."""
+    client.post("/ensure_account", json={"account_id": "summary_acct", "balance": 250.0})
+    client.post("/write_transaction", json={"account_id": "summary_acct", "counterparty": "bob", "amount": 50.0})
+    response = client.post("/account_summary", json={"account_id": "summary_acct", "limit": 5})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["account_id"] == "summary_acct"
+    assert data["balance"] == client.post("/balance", json={"account_id": "summary_acct"}).json()["balance"]
+    assert [t["counterparty"] for t in data["transactions"]] == ["bob"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
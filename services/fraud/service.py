@@ -2,19 +2,25 @@
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Run as a script: add the project root to the path. Imported as
+    # services.<name>.service (tests, uvicorn workers) it is already there.
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
-from fastapi import FastAPI
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request
+from pydantic import BaseModel, ValidationError
 from typing import Optional, List
 from bankassist.services.fraud import FraudDetectionService, FraudAlert
+from shared.utils.bulk import add_bulk_endpoint
+from shared.utils.health import add_health_route
+from shared.utils.json import DefaultResponse
 
 from services.fraud import config
 
-app = FastAPI(title="Fraud Detection Service")
+app = FastAPI(title="Fraud Detection Service", default_response_class=DefaultResponse)
+add_bulk_endpoint(app)
+add_health_route(app, "fraud")
 fraud_svc = FraudDetectionService(amount_threshold=1000.0)
 
 
@@ -36,28 +42,56 @@ class AlertResponse(BaseModel):
     amount: float
 
 
-@app.post("/consent", response_model=ConsentResponse)
-def consent_for_write(req: ConsentRequest):
+try:
+    import msgspec
+
+    class _ConsentStruct(msgspec.Struct):
+        account_id: str
+        amount: float
+        context: Optional[dict] = None
+
+    _decode_consent = msgspec.json.Decoder(_ConsentStruct).decode
+    _CONSENT_ERRORS = (msgspec.DecodeError,)
+except ImportError:
+    # msgspec not installed, validate with Pydantic's JSON parser instead
+    _decode_consent = ConsentRequest.model_validate_json
+    _CONSENT_ERRORS = (ValidationError,)
+
+
+@app.post(
+    "/consent",
+    responses={200: {"model": ConsentResponse}},
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": ConsentRequest.model_json_schema()}},
+    }},
+)
+async def consent_for_write(request: Request):
+    # Every write path calls this; decode the body directly instead of
+    # going through FastAPI's per-request model validation
+    try:
+        req = _decode_consent(await request.body())
+    except _CONSENT_ERRORS as e:
+        raise HTTPException(status_code=422, detail=str(e))
     ok, reason = fraud_svc.consent_for_write(req.account_id, req.amount, req.context)
-    return ConsentResponse(consented=ok, reason=reason)
+    return DefaultResponse({"consented": ok, "reason": reason})
 
 
-@app.get("/alerts", response_model=List[AlertResponse])
+@app.get("/alerts", responses={200: {"model": List[AlertResponse]}})
 def latest_alerts(limit: int = 5):
+    # Plain dicts serialized directly; AlertResponse only documents the shape
     alerts = fraud_svc.latest_alerts(limit)
-    return [AlertResponse(timestamp=a.timestamp, account_id=a.account_id, reason=a.reason, amount=a.amount) for a in alerts]
+    return DefaultResponse([
+        {"timestamp": a.timestamp, "account_id": a.account_id, "reason": a.reason, "amount": a.amount}
+        for a in alerts
+    ])
 
 
 @app.get("/stats")
 def stats():
-    return fraud_svc.stats()
-
-
-@app.get("/health")
-def health():
-    return {"status": "ok", "service": "fraud"}
+    return DefaultResponse(fraud_svc.stats())
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=config.PORT)
+    uvicorn.run(app, host="0.0.0.0", port=config.PORT, timeout_keep_alive=75)
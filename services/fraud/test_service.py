@@ -40,5 +40,33 @@ def test_metrics_endpoint():
 
 # Add service-specific tests here
 
+def test_consent_endpoint():
+    """Test consent decisions and request validation."""
+    response = client.post("/consent", json={"account_id": "acct_small", "amount": 10.0})
+    assert response.status_code == 200
+    assert response.json() == {"consented": True, "reason": None}
+
+    response = client.post("/consent", json={"account_id": "acct_small"})
+    assert response.status_code == 422
+
+
+def test_alerts_endpoint():
+    """Test alerts are returned as a plain list of alert dicts."""
+    client.post("/consent", json={"account_id": "acct_alerts", "amount": 5000.0})
+    response = client.get("/alerts?limit=1")
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+    assert data[-1]["account_id"] == "acct_alerts"
+    assert set(data[-1]) == {"timestamp", "account_id", "reason", "amount"}
+
+
+def test_stats_endpoint():
+    """Test stats counters."""
+    response = client.get("/stats")
+    assert response.status_code == 200
+    assert "checks" in response.json()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
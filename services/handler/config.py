@@ -18,4 +18,33 @@ PORT = int(os.getenv("PORT", "8012"))
 SERVICE_NAME = os.getenv("SERVICE_NAME", "handler")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+# Session store: Redis when REDIS_URL is set (e.g. redis://localhost:6379/0),
+# otherwise sessions live in this process only
+REDIS_URL = os.getenv("REDIS_URL", "")
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "3600"))
+
+# Downstream calls: HTTP/2 is only useful behind an h2c-capable proxy (uvicorn
+# itself speaks HTTP/1.1) and needs httpx[http2]; measure before enabling
+DOWNSTREAM_HTTP2 = os.getenv("DOWNSTREAM_HTTP2", "").lower() in ("1", "true", "yes")
+DOWNSTREAM_CONNECT_TIMEOUT = float(os.getenv("DOWNSTREAM_CONNECT_TIMEOUT", "0.5"))
+
+# Worker processes. Only raise this with REDIS_URL set so callers' sessions,
+# cached answers and call conversations are shared.
+WORKERS = int(os.getenv("WORKERS", "1"))
+
+# How long identical questions reuse a cached LLM / RAG answer
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+RAG_CACHE_TTL_SECONDS = int(os.getenv("RAG_CACHE_TTL_SECONDS", "300"))
+
+# Cosine similarity at which a paraphrased general question reuses an earlier
+# LLM answer (needs sentence-transformers and hnswlib installed)
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+
+# Active conversations idle this long are finished by a background sweep,
+# which runs every CONVERSATION_SWEEP_SECONDS, or every
+# CONVERSATION_SWEEP_BUSY_SECONDS right after it finished some
+STUCK_CONVERSATION_SECONDS = int(os.getenv("STUCK_CONVERSATION_SECONDS", "300"))
+CONVERSATION_SWEEP_SECONDS = float(os.getenv("CONVERSATION_SWEEP_SECONDS", "60"))
+CONVERSATION_SWEEP_BUSY_SECONDS = float(os.getenv("CONVERSATION_SWEEP_BUSY_SECONDS", "5"))
+
 # Add service-specific config here as needed
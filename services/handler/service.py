@@ -2,30 +2,98 @@
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Run as a script: add the project root to the path. Imported as
+    # services.<name>.service (tests, uvicorn workers) it is already there.
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
-import requests
+from contextlib import asynccontextmanager
+import httpx
 import time
 import asyncio
+import base64
 import json
+import re
+import websockets
 from shared.config import get_service_url
-from shared.utils.intent import classify_intent
+from shared.utils.intent import canonical_text, classify_intent
 from shared.utils.logger import ServiceLogger
-from shared.utils.metrics import MetricsCollector
+from shared.utils.metrics import BatchedMetrics, MetricsCollector
+from shared.utils.bulk import add_bulk_endpoint
+from shared.utils.health import add_health_route
+from shared.utils.session_store import create_session_store
+from shared.utils.conversation_store import create_conversation_store
+from shared.utils.cache import SemanticCache, SingleFlight, TextCache, create_redis_client
+from shared.utils.json import DefaultResponse, dumps as json_dumps, loads as json_loads
 
 from services.handler import config
 
-app = FastAPI(title="Handler Service")
+try:
+    import h2  # noqa: F401
+except ImportError:
+    # h2 not installed (httpx[http2]), downstream calls stay on HTTP/1.1
+    h2 = None
+
+try:
+    import msgpack
+except ImportError:
+    # msgpack not installed, play_audio goes to the call service as base64 JSON
+    msgpack = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled client for every downstream call, so requests reuse
+    # keep-alive connections and never tie up a threadpool worker.
+    # Plain-http services only speak HTTP/2 with prior knowledge (h2c), so
+    # when enabled HTTP/1.1 is switched off rather than negotiated.
+    http2 = config.DOWNSTREAM_HTTP2 and h2 is not None
+
+    # Downstream servers keep idle connections for 75s, so pooled ones
+    # survive the pauses while a caller talks and are dropped before the
+    # server would close them
+    def pool_limits(max_connections: int, max_keepalive: int) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=60.0
+        )
+
+    app.state.http = httpx.AsyncClient(
+        http1=not http2,
+        http2=http2,
+        limits=pool_limits(50, 20),
+        mounts={
+            url: httpx.AsyncHTTPTransport(http1=not http2, http2=http2, limits=pool_limits(*limits))
+            for url, limits in DOWNSTREAM_POOL_LIMITS.items()
+        },
+        timeout=httpx.Timeout(10.0, connect=config.DOWNSTREAM_CONNECT_TIMEOUT)
+    )
+    await sessions.start()
+    metrics_flusher = asyncio.create_task(metrics.run())
+    conversation_sweeper = asyncio.create_task(sweep_stuck_conversations())
+    yield
+    conversation_sweeper.cancel()
+    metrics_flusher.cancel()
+    await app.state.http.aclose()
+    await sessions.close()
+    if redis_client is not None:
+        await redis_client.aclose()
+
+
+app = FastAPI(title="Handler Service", lifespan=lifespan, default_response_class=DefaultResponse)
+add_bulk_endpoint(app)
+add_health_route(app, "handler")
 
 # Initialize logger and metrics
 logger = ServiceLogger("handler")
-metrics = MetricsCollector("handler")
+# Counter increments are buffered and applied every 250ms off the request path
+metrics = BatchedMetrics(MetricsCollector("handler"))
 
 logger.info("Handler service starting up")
 
@@ -40,13 +108,147 @@ WRITEOPS_URL = get_service_url("write_ops")
 COMPLAINT_URL = get_service_url("complaint")
 QR_URL = get_service_url("qr")
 
-# In-memory session store (in production, use Redis or a database)
-sessions = {}
+# Each downstream service gets its own connection pool (max connections, max
+# keep-alive), so a backlog on one - slow LLM answers, say - cannot take the
+# connections another needs, like the SMS calls an OTP is waiting on
+DOWNSTREAM_POOL_LIMITS = {
+    LLM_URL: (50, 20),
+    RAG_URL: (50, 20),
+    READQUERY_URL: (50, 20),
+    WRITEOPS_URL: (50, 20),
+    SMS_URL: (50, 20),
+    VOICE_URL: (50, 20),
+    COMPLAINT_URL: (20, 10),
+    QR_URL: (20, 10),
+    CALL_URL: (20, 10),
+}
+
+# Endpoints hit on every request, built once
+LLM_ANSWER_URL = f"{LLM_URL}/answer"
+RAG_QUERY_URL = f"{RAG_URL}/query"
+READQUERY_QUERY_URL = f"{READQUERY_URL}/query"
+WRITEOPS_TRANSFER_URL = f"{WRITEOPS_URL}/transfer"
+SMS_EXPECT_URL = f"{SMS_URL}/expect"
+SMS_SEND_URL = f"{SMS_URL}/send"
+SMS_RECEIVE_URL = f"{SMS_URL}/receive"
+COMPLAINT_LODGE_URL = f"{COMPLAINT_URL}/lodge"
+QR_CREATE_URL = f"{QR_URL}/create"
+VOICE_SYNTHESIZE_URL = f"{VOICE_URL}/synthesize"
+
+# "transfer 50 to bob": the words "transfer" and "to", each followed by the
+# word after it
+_TRANSFER_RE = re.compile(r"(?<!\S)transfer(?:\s+(?P<amt>\S+))?(?!\S)", re.IGNORECASE)
+_TO_RE = re.compile(r"(?<!\S)to\s+(?P<to>\S+)", re.IGNORECASE)
+_AMT_RE = re.compile(r"\b(\d+(?:\.\d+)?)\b")
+
+# A final transcription containing any of these ends the call
+END_PHRASES = ('goodbye', 'bye', 'thank you goodbye', 'that\'s all', 'hang up', 'end call')
+
+# Final transcriptions that arrive within this window of the first one are
+# answered by a single LLM call, so a burst of short sentences is one question
+LLM_BATCH_SECONDS = 0.3
+
+# LLM requests one call may have in flight at once; further batches wait
+MAX_LLM_REQUESTS_PER_CALL = 3
+
+# Longest wait for the call service to report the goodbye has finished playing
+# (call services that predate play_done acks always take this long)
+PLAYBACK_ACK_TIMEOUT_SECONDS = 5.0
+
+# Streamed LLM answers are spoken a sentence at a time; a run of text this
+# long without sentence punctuation is cut at a word boundary instead
+TTS_CHUNK_MAX_CHARS = 120
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)")
 
-# In-memory conversation history store (in production, use a database)
-# Structure: { call_sid: { phone: str, messages: [...], started_at: timestamp, ended_at: timestamp } }
-conversation_history = {}
-completed_conversations = []  # List of completed conversations
+# Caller sessions and cached answers, shared across workers through Redis when REDIS_URL is set
+redis_client = create_redis_client(config.REDIS_URL)
+sessions = create_session_store(redis_client, config.SESSION_TTL_SECONDS)
+llm_answers = TextCache("llm", redis_client)
+rag_answers = TextCache("rag", redis_client)
+# Falls back to reusing the answer to an earlier paraphrase of the question
+similar_llm_answers = SemanticCache(config.SEMANTIC_CACHE_THRESHOLD)
+# Identical LLM/RAG/read lookups that overlap share one downstream call
+inflight = SingleFlight()
+
+# Call conversations, active and the last MAX_COMPLETED_CONVERSATIONS finished,
+# shared across workers through Redis when REDIS_URL is set
+MAX_COMPLETED_CONVERSATIONS = 50
+conversations = create_conversation_store(redis_client, MAX_COMPLETED_CONVERSATIONS)
+
+
+async def finish_conversation(call_sid: str, ended_at: Optional[float] = None) -> Optional[dict]:
+    """Move a call's conversation to the completed list and return it."""
+    conv = await conversations.finish(call_sid, ended_at)
+    if conv is not None:
+        # Dashboards watch this counter to know when to fetch new conversations
+        metrics.increment("conversations_completed")
+    return conv
+
+
+def log_conversation(conv: dict, title: str, **extra):
+    """Write a finished conversation to the log, one line per message."""
+    logger.info("="*80)
+    logger.info(title)
+    logger.info(f"Call SID: {conv['call_sid']}")
+    logger.info(f"Phone: {conv['phone']}")
+    logger.info(f"Duration: {conv['ended_at'] - conv['started_at']:.2f}s")
+    for label, value in extra.items():
+        logger.info(f"{label}: {value}")
+    logger.info("="*80)
+    for msg in conv['messages']:
+        role_label = "👤 USER" if msg['role'] == 'user' else "🤖 ASSISTANT"
+        timestamp_offset = msg['timestamp'] - conv['started_at']
+        logger.info(f"[{timestamp_offset:6.1f}s] {role_label}: {msg['text']}")
+    logger.info("="*80)
+
+
+async def finish_idle_conversations(max_age_seconds: float) -> list:
+    """Finish conversations idle for over ``max_age_seconds``; returns a summary of each."""
+    current_time = time.time()
+    cleaned_up = []
+    
+    # Find stuck conversations (idle longer than max_age_seconds); the store
+    # keeps calls in activity order, so only the idle ones are visited
+    stuck_calls = await conversations.idle_since(current_time - max_age_seconds)
+    
+    # Move them to completed
+    for call_sid in stuck_calls:
+        conv = await finish_conversation(call_sid, current_time)
+        if conv is None:
+            continue  # ended meanwhile
+        duration = conv['ended_at'] - conv['started_at']
+        
+        logger.info(f"Cleaning up stuck conversation: {call_sid} (duration: {duration:.1f}s)", call_sid=call_sid)
+        cleaned_up.append({
+            "call_sid": call_sid,
+            "phone": conv['phone'],
+            "duration": duration,
+            "message_count": len(conv['messages'])
+        })
+    return cleaned_up
+
+
+async def sweep_stuck_conversations():
+    """Finish stuck conversations on a timer, off the request path, until cancelled."""
+    interval = config.CONVERSATION_SWEEP_SECONDS
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            cleaned_up = await finish_idle_conversations(config.STUCK_CONVERSATION_SECONDS)
+        except Exception as e:
+            logger.error(f"Stuck conversation sweep failed: {e}")
+            cleaned_up = []
+        # Calls tend to get stuck together (e.g. a dropped call service), so
+        # look again soon while there are some
+        interval = config.CONVERSATION_SWEEP_BUSY_SECONDS if cleaned_up else config.CONVERSATION_SWEEP_SECONDS
+
+
+class CallEnded(Exception):
+    """Raised by a call stream forwarder whose side of the call has finished.
+
+    Leaving the task group this way cancels the other forwarder, which may
+    be blocked waiting on a socket that will never deliver again.
+    """
 
 
 class HandleRequest(BaseModel):
@@ -61,209 +263,338 @@ class HandleResponse(BaseModel):
     session_verified: bool
 
 
-def get_or_create_session(phone: str, account_id: str, verified: bool):
-    if phone not in sessions:
-        sessions[phone] = {
-            "phone": phone,
-            "account_id": account_id,
-            "verified": verified,
-            "pending_verification_type": None
-        }
-    return sessions[phone]
+def load_json(resp: httpx.Response):
+    """Decode a downstream JSON body, with orjson when it is available."""
+    return json_loads(resp.content)
 
 
-@app.post("/handle", response_model=HandleResponse)
-def handle_text(req: HandleRequest):
-    start_time = time.time()
-    logger.info(f"Handling request from {req.phone}", phone=req.phone, account=req.account_id)
-    metrics.increment("requests_total")
-    
-    session = get_or_create_session(req.phone, req.account_id, req.verified)
-    text = req.text
-    intent = classify_intent(text)
-    
-    logger.info(f"Classified intent: {intent}", intent=intent, text=text[:50])
-    metrics.increment(f"intent_{intent}")
-    
-    if intent == "general":
-        # Call LLM service
-        resp = requests.post(f"{LLM_URL}/answer", json={"question": text})
+def split_speakable(buffer: str):
+    """Split complete sentences off streamed text; returns (sentences, rest)."""
+    sentences = []
+    while True:
+        m = _SENTENCE_END_RE.search(buffer)
+        if m:
+            cut = m.end()
+        elif len(buffer) >= TTS_CHUNK_MAX_CHARS:
+            cut = buffer.rfind(" ", 1)
+            if cut <= 0:
+                break
+        else:
+            break
+        sentence, buffer = buffer[:cut].strip(), buffer[cut:].lstrip()
+        if sentence:
+            sentences.append(sentence)
+    return sentences, buffer
+
+
+async def iter_llm_answer(question: str, conversation_history: list):
+    """Yield the LLM's answer text as it is generated."""
+    async with app.state.http.stream(
+        "POST",
+        LLM_ANSWER_URL,
+        json={"question": question, "conversation_history": conversation_history},
+        headers={"Accept": "text/event-stream"},
+        timeout=15
+    ) as resp:
         resp.raise_for_status()
-        answer = resp.json()["answer"]
-        return HandleResponse(reply=answer, session_verified=session["verified"])
-    
-    if intent == "offers":
-        # Call RAG service
-        resp = requests.post(f"{RAG_URL}/query", json={"question": text})
+        if not resp.headers.get("content-type", "").startswith("text/event-stream"):
+            # Older LLM service builds only answer with JSON
+            await resp.aread()
+            yield load_json(resp).get("answer", "")
+            return
+        async for line in resp.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = line[len("data: "):]
+            if data == "[DONE]":
+                return
+            event = json_loads(data)
+            if "error" in event:
+                raise RuntimeError(f"LLM stream failed: {event['error']}")
+            yield event["delta"]
+
+
+async def get_or_create_session(phone: str, account_id: str, verified: bool):
+    return await sessions.get_or_create(phone, account_id, verified)
+
+
+async def send_otp(phone: str, message: str, code: str):
+    """Text an OTP to the caller and simulate their reply.
+
+    /expect and /send are independent so they go out together; the simulated
+    /receive has to land after /expect has registered the expectation.
+    Raises ``httpx.HTTPError`` if any step fails, so the caller is never
+    marked verified without the code having gone out.
+    """
+    responses = await asyncio.gather(
+        app.state.http.post(SMS_EXPECT_URL, json={"phone": phone, "purpose": "otp"}),
+        app.state.http.post(SMS_SEND_URL, json={"to": phone, "body": message})
+    )
+    for resp in responses:
         resp.raise_for_status()
-        answer = resp.json()["answer"]
-        return HandleResponse(reply=answer, session_verified=session["verified"])
-    
-    if intent == "read":
-        try:
-            # Call ReadQuery service
-            resp = requests.post(f"{READQUERY_URL}/query", json={
+    resp = await app.state.http.post(SMS_RECEIVE_URL, json={"from_number": phone, "body": code})
+    resp.raise_for_status()
+
+
+OTP_FAILED_REPLY = "We couldn't send a verification code right now. Please try again shortly."
+
+
+async def _handle_general(session: dict, text: str):
+    # Call LLM service, unless the same (or a very similar) question was answered recently
+    answer = await llm_answers.get(text)
+    if answer is not None:
+        metrics.increment("llm_cache_hits")
+    else:
+        answer = await similar_llm_answers.get(text)
+        if answer is not None:
+            metrics.increment("llm_semantic_cache_hits")
+    if answer is None:
+        answer = await inflight.do(llm_answers.key(text), lambda: _fetch_llm_answer(text))
+    return {"reply": answer, "session_verified": session["verified"]}
+
+
+async def _fetch_llm_answer(text: str) -> str:
+    resp = await app.state.http.post(LLM_ANSWER_URL, json={"question": text}, timeout=30)
+    resp.raise_for_status()
+    answer = load_json(resp)["answer"]
+    await llm_answers.set(text, answer, config.LLM_CACHE_TTL_SECONDS)
+    await similar_llm_answers.set(text, answer)
+    return answer
+
+
+async def _handle_offers(session: dict, text: str):
+    # Call RAG service; offers change more often, so they are cached briefly
+    answer = await rag_answers.get(text)
+    if answer is None:
+        answer = await inflight.do(rag_answers.key(text), lambda: _fetch_rag_answer(text))
+    else:
+        metrics.increment("rag_cache_hits")
+    return {"reply": answer, "session_verified": session["verified"]}
+
+
+async def _fetch_rag_answer(text: str) -> str:
+    resp = await app.state.http.post(RAG_QUERY_URL, json={"question": text}, timeout=30)
+    resp.raise_for_status()
+    answer = load_json(resp)["answer"]
+    await rag_answers.set(text, answer, config.RAG_CACHE_TTL_SECONDS)
+    return answer
+
+
+async def _handle_read(session: dict, text: str):
+    try:
+        # Call ReadQuery service; repeats of a query still in flight for this account share it
+        async def query():
+            resp = await app.state.http.post(READQUERY_QUERY_URL, json={
                 "user_text": text,
                 "account_id": session["account_id"],
                 "verified": session["verified"]
             })
             resp.raise_for_status()
-            result = resp.json()
-            
-            if result["type"] == "transactions":
-                n = len(result.get("items", []))
-                return HandleResponse(
-                    reply=f"Your last {n} transactions have been sent to your phone via SMS.",
-                    session_verified=session["verified"]
-                )
-            if result["type"] == "balance":
-                amt = result["amount"]
-                return HandleResponse(
-                    reply=f"Your current balance is ${amt:.2f}.",
-                    session_verified=session["verified"]
-                )
-            return HandleResponse(
-                reply="I couldn't find that information.",
-                session_verified=session["verified"]
-            )
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 403:
-                # Verification required
-                session["pending_verification_type"] = "read"
-                code = "123456"
-                # Send OTP via SMS service
-                requests.post(f"{SMS_URL}/expect", json={"phone": session["phone"], "purpose": "otp"})
-                requests.post(f"{SMS_URL}/send", json={"to": session["phone"], "body": f"Enter OTP to proceed: {code}"})
-                # Simulate receive
-                requests.post(f"{SMS_URL}/receive", json={"from_number": session["phone"], "body": code})
-                session["verified"] = True
-                return HandleResponse(
-                    reply="For your security, we sent you a verification code (OTP). Please reply with the code to continue.",
-                    session_verified=session["verified"]
-                )
-            raise
-    
-    if intent == "write":
+            return load_json(resp)
+
+        key = f"read:{session['account_id']}:{session['verified']}:{canonical_text(text)}"
+        result = await inflight.do(key, query)
+
+        if result["type"] == "balance_and_transactions":
+            n = len(result.get("items", []))
+            amt = result["amount"]
+            return {
+                "reply": f"Your current balance is ${amt:.2f}. Your last {n} transactions have been sent to your phone via SMS.",
+                "session_verified": session["verified"]
+            }
+        if result["type"] == "transactions":
+            n = len(result.get("items", []))
+            return {
+                "reply": f"Your last {n} transactions have been sent to your phone via SMS.",
+                "session_verified": session["verified"]
+            }
+        if result["type"] == "balance":
+            amt = result["amount"]
+            return {
+                "reply": f"Your current balance is ${amt:.2f}.",
+                "session_verified": session["verified"]
+            }
+        return {
+            "reply": "I couldn't find that information.",
+            "session_verified": session["verified"]
+        }
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 403:
+            # Verification required
+            if not await sessions.begin_verification(session, "read"):
+                return {
+                    "reply": "You're already verified. Please ask again.",
+                    "session_verified": session["verified"]
+                }
+            code = "123456"
+            # Send OTP via SMS service
+            try:
+                await send_otp(session["phone"], f"Enter OTP to proceed: {code}", code)
+            except httpx.HTTPError as otp_error:
+                logger.error(f"Failed to send OTP: {otp_error}", phone=session["phone"])
+                return {"reply": OTP_FAILED_REPLY, "session_verified": session["verified"]}
+            await sessions.update(session, verified=True)
+            return {
+                "reply": "For your security, we sent you a verification code (OTP). Please reply with the code to continue.",
+                "session_verified": session["verified"]
+            }
+        raise
+
+
+def parse_transfer(text: str):
+    """Amount and recipient of a simple "transfer 50 to bob" request.
+
+    The amount is 0.0 unless a word follows "transfer", and 10.0 when that
+    word is not a number; the recipient defaults to "merchant".
+    """
+    amt = 0.0
+    m = _TRANSFER_RE.search(text)
+    if m and m["amt"]:
         try:
-            # Parse simple pattern: "transfer 50 to bob"
-            amt = 0.0
-            to = "merchant"
-            tokens = text.lower().split()
-            if "transfer" in tokens:
-                i = tokens.index("transfer")
-                if i + 1 < len(tokens):
-                    try:
-                        amt = float(tokens[i + 1])
-                    except:
-                        amt = 10.0
-            if "to" in tokens:
-                j = tokens.index("to")
-                if j + 1 < len(tokens):
-                    to = tokens[j + 1]
-            
-            # Call WriteOps service
-            resp = requests.post(f"{WRITEOPS_URL}/transfer", json={
-                "from_acct": session["account_id"],
-                "to_acct": to,
-                "amount": amt,
-                "verified": session["verified"],
-                "context": {}
-            })
-            resp.raise_for_status()
-            result = resp.json()
-            
-            if result["status"] == "ok":
-                tx = result["transaction"]
-                return HandleResponse(
-                    reply=f"Transferred ${tx['amount']:.2f} to {tx['counterparty']}.",
-                    session_verified=session["verified"]
-                )
-            return HandleResponse(
-                reply=f"Sorry, this transfer was blocked: {result.get('reason', 'unknown')}",
-                session_verified=session["verified"]
-            )
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 403:
-                # Verification required
-                session["pending_verification_type"] = "write"
-                code = "654321"
-                requests.post(f"{SMS_URL}/expect", json={"phone": session["phone"], "purpose": "otp"})
-                requests.post(f"{SMS_URL}/send", json={"to": session["phone"], "body": f"Enter OTP to confirm transfer: {code}"})
-                requests.post(f"{SMS_URL}/receive", json={"from_number": session["phone"], "body": code})
-                session["verified"] = True
-                return HandleResponse(
-                    reply="We sent a verification code by SMS. Please reply to continue.",
-                    session_verified=session["verified"]
-                )
-            raise
-    
-    if intent == "complaint":
-        # Send link via SMS service
-        link = "https://example.com/upload"
-        requests.post(f"{SMS_URL}/send", json={"to": session["phone"], "body": f"Please upload a photo here: {link}"})
-        
-        # Simulate user replies with image URL
-        image_url = "https://example.com/uploads/photo.jpg"
-        
-        # Lodge complaint
-        resp = requests.post(f"{COMPLAINT_URL}/lodge", json={
-            "phone": session["phone"],
-            "text": text,
-            "image_url": image_url
-        })
-        resp.raise_for_status()
-        complaint = resp.json()
-        
-        return HandleResponse(
-            reply=f"Your complaint #{complaint['id']} has been filed. We'll be in touch.",
-            session_verified=session["verified"]
-        )
-    
-    if intent == "qr":
-        # Parse amount
-        amt = 0.0
-        tokens = text.lower().split()
-        for tok in tokens:
-            if tok.replace('.', '', 1).isdigit():
-                amt = float(tok)
-                break
-        
-        # Call QR service
-        resp = requests.post(f"{QR_URL}/create", json={
-            "account_id": session["account_id"],
+            amt = float(m["amt"])
+        except ValueError:
+            amt = 10.0
+    m = _TO_RE.search(text)
+    to = m["to"].lower() if m else "merchant"
+    return amt, to
+
+
+async def _handle_write(session: dict, text: str):
+    try:
+        amt, to = parse_transfer(text)
+
+        # Call WriteOps service
+        resp = await app.state.http.post(WRITEOPS_TRANSFER_URL, json={
+            "from_acct": session["account_id"],
+            "to_acct": to,
             "amount": amt,
             "verified": session["verified"],
             "context": {}
         })
         resp.raise_for_status()
-        result = resp.json()
-        
+        result = load_json(resp)
+
         if result["status"] == "ok":
-            qr = result["qr_code"]
-            # Send QR via SMS
-            requests.post(f"{SMS_URL}/send", json={
-                "to": session["phone"],
-                "body": "Here is your QR code",
-                "media_url": f"data:qr;base64,{qr}"
-            })
-            return HandleResponse(
-                reply=f"A QR code for ${amt:.2f} was sent via SMS.",
-                session_verified=session["verified"]
-            )
-        return HandleResponse(
-            reply=f"Cannot create QR code: {result.get('reason', 'unknown')}",
-            session_verified=session["verified"]
-        )
-    
-    return HandleResponse(
-        reply="I'm not sure I understood. Could you rephrase?",
-        session_verified=session["verified"]
+            tx = result["transaction"]
+            return {
+                "reply": f"Transferred ${tx['amount']:.2f} to {tx['counterparty']}.",
+                "session_verified": session["verified"]
+            }
+        return {
+            "reply": f"Sorry, this transfer was blocked: {result.get('reason', 'unknown')}",
+            "session_verified": session["verified"]
+        }
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 403:
+            # Verification required
+            if not await sessions.begin_verification(session, "write"):
+                return {
+                    "reply": "You're already verified. Please ask again.",
+                    "session_verified": session["verified"]
+                }
+            code = "654321"
+            try:
+                await send_otp(session["phone"], f"Enter OTP to confirm transfer: {code}", code)
+            except httpx.HTTPError as otp_error:
+                logger.error(f"Failed to send OTP: {otp_error}", phone=session["phone"])
+                return {"reply": OTP_FAILED_REPLY, "session_verified": session["verified"]}
+            await sessions.update(session, verified=True)
+            return {
+                "reply": "We sent a verification code by SMS. Please reply to continue.",
+                "session_verified": session["verified"]
+            }
+        raise
+
+
+async def _handle_complaint(session: dict, text: str):
+    # Send link via SMS service
+    link = "https://example.com/upload"
+
+    # Simulate user replies with image URL
+    image_url = "https://example.com/uploads/photo.jpg"
+
+    # Text the upload link and lodge the complaint concurrently
+    _, resp = await asyncio.gather(
+        app.state.http.post(SMS_SEND_URL, json={"to": session["phone"], "body": f"Please upload a photo here: {link}"}),
+        app.state.http.post(COMPLAINT_LODGE_URL, json={
+            "phone": session["phone"],
+            "text": text,
+            "image_url": image_url
+        })
     )
+    resp.raise_for_status()
+    complaint = load_json(resp)
+
+    return {
+        "reply": f"Your complaint #{complaint['id']} has been filed. We'll be in touch.",
+        "session_verified": session["verified"]
+    }
 
 
-@app.get("/health")
-def health():
-    return {"status": "ok", "service": "handler"}
+async def _handle_qr(session: dict, text: str):
+    # Parse amount
+    m = _AMT_RE.search(text)
+    amt = float(m[1]) if m else 0.0
+
+    # Call QR service
+    resp = await app.state.http.post(QR_CREATE_URL, json={
+        "account_id": session["account_id"],
+        "amount": amt,
+        "verified": session["verified"],
+        "context": {}
+    })
+    resp.raise_for_status()
+    result = load_json(resp)
+
+    if result["status"] == "ok":
+        qr = result["qr_code"]
+        # Send QR via SMS
+        await app.state.http.post(SMS_SEND_URL, json={
+            "to": session["phone"],
+            "body": "Here is your QR code",
+            "media_url": f"data:qr;base64,{qr}"
+        })
+        return {
+            "reply": f"A QR code for ${amt:.2f} was sent via SMS.",
+            "session_verified": session["verified"]
+        }
+    return {
+        "reply": f"Cannot create QR code: {result.get('reason', 'unknown')}",
+        "session_verified": session["verified"]
+    }
+
+
+# Intent -> coroutine that produces the /handle reply for it
+HANDLERS = {
+    "general": _handle_general,
+    "offers": _handle_offers,
+    "read": _handle_read,
+    "write": _handle_write,
+    "complaint": _handle_complaint,
+    "qr": _handle_qr
+}
+
+
+@app.post("/handle", responses={200: {"model": HandleResponse}})
+async def handle_text(req: HandleRequest):
+    logger.info(f"Handling request from {req.phone}", phone=req.phone, account=req.account_id)
+    metrics.increment("requests_total")
+    
+    session = await get_or_create_session(req.phone, req.account_id, req.verified)
+    text = req.text
+    intent = classify_intent(text)
+    
+    logger.info(f"Classified intent: {intent}", intent=intent, text=text[:50])
+    metrics.increment(f"intent_{intent}")
+    
+    handler = HANDLERS.get(intent)
+    if handler is not None:
+        return await handler(session, text)
+    
+    return {
+        "reply": "I'm not sure I understood. Could you rephrase?",
+        "session_verified": session["verified"]
+    }
 
 
 @app.websocket("/call/stream")
@@ -280,12 +611,12 @@ async def call_stream_endpoint(websocket: WebSocket):
     call_sid = None
     phone = None
     conversation_active = True
-    pending_llm_tasks = []  # Track pending LLM responses
+    pending_llm_tasks = set()  # Track pending LLM responses
+    llm_slots = asyncio.Semaphore(MAX_LLM_REQUESTS_PER_CALL)
+    pending_utterances = []  # Finals waiting for the current LLM batch
+    playback_done = {}  # mark -> Event set when the call service has played it
     
     try:
-        # Import websockets library
-        import websockets
-        
         # Connect to voice service
         voice_ws_url = VOICE_URL.replace('http', 'ws') + '/live-transcribe'
         logger.info(f"Connecting to voice service: {voice_ws_url}")
@@ -312,25 +643,24 @@ async def call_stream_endpoint(websocket: WebSocket):
                         await voice_ws.send(data['bytes'])
                     elif 'text' in data:
                         # Control message
-                        msg = json.loads(data['text'])
+                        msg = json_loads(data['text'])
                         if msg.get('type') == 'start':
                             call_sid = msg.get('call_sid')
                             phone = msg.get('phone')
                             logger.info(f"Call stream started for {call_sid}", call_sid=call_sid, phone=phone)
                             
                             # Initialize conversation history for this call
-                            conversation_history[call_sid] = {
-                                'call_sid': call_sid,
-                                'phone': phone,
-                                'messages': [],
-                                'started_at': time.time(),
-                                'ended_at': None
-                            }
+                            await conversations.start(call_sid, phone)
                             
                             # Send welcome message
                             welcome_text = "Hello! I'm your AI banking assistant. How can I help you today?"
                             await send_tts_to_caller(welcome_text)
                             
+                        elif msg.get('type') == 'play_done':
+                            played = playback_done.pop(msg.get('mark'), None)
+                            if played is not None:
+                                played.set()
+                            
                         elif msg.get('type') == 'stop':
                             logger.info(f"Call stream stopped for {call_sid}", call_sid=call_sid)
                             conversation_active = False
@@ -341,45 +671,56 @@ async def call_stream_endpoint(websocket: WebSocket):
             except WebSocketDisconnect:
                 logger.info("Call service disconnected (user hung up)", call_sid=call_sid)
                 conversation_active = False
-                # Break out to trigger cleanup
-            except Exception as e:
-                logger.error(f"Error forwarding to voice: {e}", call_sid=call_sid)
-                conversation_active = False
+            # Stops the transcription loop too, which would otherwise sit on
+            # the voice socket (kept open by pings) until cleanup
+            raise CallEnded()
         
-        async def send_tts_to_caller(text: str):
-            """Generate TTS and instruct call service to play audio to caller"""
+        async def send_tts_to_caller(text: str, record: bool = True, mark: Optional[str] = None):
+            """Generate TTS and instruct call service to play audio to caller.
+
+            With ``mark``, the call service answers with a play_done message
+            carrying it once the audio has finished playing.
+            """
             try:
                 logger.info(f"[ASSISTANT RESPONSE] \"{text}\"", call_sid=call_sid, phone=phone)
                 
                 # Store assistant message in conversation history
-                if call_sid in conversation_history:
-                    conversation_history[call_sid]['messages'].append({
-                        'role': 'assistant',
-                        'text': text,
-                        'timestamp': time.time()
-                    })
+                if call_sid and record:
+                    await conversations.add_message(call_sid, 'assistant', text)
                 
-                # Generate TTS using voice service
-                tts_response = requests.post(
-                    f"{VOICE_URL}/synthesize",
+                # Generate TTS using voice service, as raw WAV when it supports that
+                tts_response = await app.state.http.post(
+                    VOICE_SYNTHESIZE_URL,
                     json={"text": text},
+                    headers={"Accept": "audio/wav"},
                     timeout=10
                 )
                 tts_response.raise_for_status()
-                tts_data = tts_response.json()
+                if tts_response.headers.get("content-type", "").startswith("audio/"):
+                    audio = tts_response.content
+                else:
+                    # Older voice service builds only speak JSON
+                    audio_base64 = load_json(tts_response).get('audio_bytes')
+                    audio = base64.b64decode(audio_base64) if audio_base64 else None
                 
-                if 'audio_bytes' in tts_data:
-                    audio_base64 = tts_data['audio_bytes']
-                    
+                if audio:
                     logger.info(f"TTS generated, instructing call service to play audio", call_sid=call_sid)
                     
-                    # Instruct call service to play this audio (with text for reference)
-                    await websocket.send_json({
+                    # Instruct call service to play this audio (with text for reference).
+                    # MessagePack carries the WAV as raw bytes instead of base64.
+                    instruction = {
                         'type': 'play_audio',
-                        'audio': audio_base64,
+                        'audio': audio,
                         'text': text,  # Include text for logging/debugging
                         'format': 'wav'
-                    })
+                    }
+                    if mark:
+                        instruction['mark'] = mark
+                    if msgpack is not None:
+                        await websocket.send_bytes(msgpack.packb(instruction))
+                    else:
+                        instruction['audio'] = base64.b64encode(audio).decode('ascii')
+                        await websocket.send_json(instruction)
                     
                     metrics.increment("tts_responses_sent")
                 else:
@@ -396,8 +737,9 @@ async def call_stream_endpoint(websocket: WebSocket):
                 
                 # Build conversation context from history
                 conversation_context = []
-                if call_sid in conversation_history:
-                    for msg in conversation_history[call_sid]['messages']:
+                conv = await conversations.get_active(call_sid) if call_sid else None
+                if conv is not None:
+                    for msg in conv['messages']:
                         conversation_context.append({
                             'role': msg['role'],
                             'content': msg['text']
@@ -409,30 +751,57 @@ async def call_stream_endpoint(websocket: WebSocket):
                     'content': user_text
                 })
                 
-                # Get response from LLM service with full context
-                llm_response = requests.post(
-                    f"{LLM_URL}/answer",
-                    json={"question": user_text, "conversation_history": conversation_context[:-1]}, # Exclude current user message
-                    timeout=15
-                )
-                llm_response.raise_for_status()
-                llm_data = llm_response.json()
-                
-                answer = llm_data.get('answer', "I'm sorry, I didn't understand that.")
-                
-                # Instruct call service to play TTS response
-                await send_tts_to_caller(answer)
-                
+                # Stream the response from LLM service with full context and
+                # speak each sentence as soon as it is complete; one speaker
+                # task keeps the sentences in order
+                speech = asyncio.Queue()
+
+                async def speak():
+                    while (sentence := await speech.get()) is not None:
+                        await send_tts_to_caller(sentence, record=False)
+
+                speaker = asyncio.create_task(speak())
+                answer = ''
+                try:
+                    buffer = ''
+                    async with llm_slots:
+                        async for delta in iter_llm_answer(user_text, conversation_context[:-1]): # Exclude current user message
+                            answer += delta
+                            sentences, buffer = split_speakable(buffer + delta)
+                            for sentence in sentences:
+                                speech.put_nowait(sentence)
+                    if not answer.strip():
+                        answer = buffer = "I'm sorry, I didn't understand that."
+                    if buffer.strip():
+                        speech.put_nowait(buffer.strip())
+                except BaseException:
+                    # Cancelled because the caller hung up, or the stream
+                    # failed: drop the sentences nobody will hear
+                    speaker.cancel()
+                    raise
+                speech.put_nowait(None)
+                await speaker
+
+                # Store the whole answer as one assistant message
+                if call_sid:
+                    await conversations.add_message(call_sid, 'assistant', answer)
+
             except Exception as e:
                 logger.error(f"Error processing with LLM: {e}", call_sid=call_sid)
                 # Send error response
                 await send_tts_to_caller("I'm sorry, I'm having trouble processing that. Could you please try again?")
-            finally:
-                # Remove this task from pending list
-                current_task = asyncio.current_task()
-                if current_task in pending_llm_tasks:
-                    pending_llm_tasks.remove(current_task)
-                    logger.info(f"LLM task completed, {len(pending_llm_tasks)} tasks remaining", call_sid=call_sid)
+        
+        def llm_task_done(task: asyncio.Task):
+            """Remove a finished task from the pending set"""
+            pending_llm_tasks.discard(task)
+            logger.info(f"LLM task completed, {len(pending_llm_tasks)} tasks remaining", call_sid=call_sid)
+        
+        async def process_batch():
+            """Answer every final heard during the batch window with one LLM call"""
+            await asyncio.sleep(LLM_BATCH_SECONDS)
+            user_text = '. '.join(pending_utterances)
+            pending_utterances.clear()
+            await process_with_llm(user_text)
         
         async def forward_from_voice_to_call():
             """Forward transcription results from voice service and process with LLM"""
@@ -444,7 +813,7 @@ async def call_stream_endpoint(websocket: WebSocket):
                         logger.info("Conversation marked inactive, exiting transcription loop", call_sid=call_sid)
                         break
                         
-                    data = json.loads(message)
+                    data = json_loads(message)
                     
                     if data.get('type') == 'partial':
                         # Log partial transcription (handler only - call service doesn't need to know)
@@ -457,17 +826,13 @@ async def call_stream_endpoint(websocket: WebSocket):
                         metrics.increment("transcriptions_completed")
                         
                         # Store user message in conversation history
-                        if call_sid in conversation_history:
-                            conversation_history[call_sid]['messages'].append({
-                                'role': 'user',
-                                'text': user_text,
-                                'timestamp': time.time()
-                            })
+                        if call_sid:
+                            await conversations.add_message(call_sid, 'user', user_text)
                         
                         if user_text:
                             # Check if user wants to end call
-                            end_phrases = ['goodbye', 'bye', 'thank you goodbye', 'that\'s all', 'hang up', 'end call']
-                            if any(phrase in user_text.lower() for phrase in end_phrases):
+                            lowered = user_text.lower()
+                            if any(phrase in lowered for phrase in END_PHRASES):
                                 logger.info("User requested call end", call_sid=call_sid)
                                 
                                 # Wait for all pending LLM responses to complete
@@ -476,10 +841,14 @@ async def call_stream_endpoint(websocket: WebSocket):
                                     await asyncio.gather(*pending_llm_tasks, return_exceptions=True)
                                     logger.info("All pending LLM responses completed", call_sid=call_sid)
                                 
-                                await send_tts_to_caller("Thank you for calling. Goodbye!")
+                                goodbye_played = playback_done['goodbye'] = asyncio.Event()
+                                await send_tts_to_caller("Thank you for calling. Goodbye!", mark='goodbye')
                                 
                                 # Wait for audio to play
-                                await asyncio.sleep(5)
+                                try:
+                                    await asyncio.wait_for(goodbye_played.wait(), PLAYBACK_ACK_TIMEOUT_SECONDS)
+                                except asyncio.TimeoutError:
+                                    logger.info("No playback ack for goodbye, ending call anyway", call_sid=call_sid)
                                 
                                 # Instruct call service to end the call
                                 await websocket.send_json({
@@ -489,10 +858,14 @@ async def call_stream_endpoint(websocket: WebSocket):
                                 conversation_active = False
                                 break
                             
-                            # Process with LLM (async - continue transcribing)
-                            logger.info("Spawning LLM task, continuing to listen for more speech", call_sid=call_sid)
-                            task = asyncio.create_task(process_with_llm(user_text))
-                            pending_llm_tasks.append(task)  # Track this task
+                            # Process with LLM (async - continue transcribing); finals
+                            # arriving during the batch window join this task
+                            pending_utterances.append(user_text)
+                            if len(pending_utterances) == 1:
+                                logger.info("Spawning LLM task, continuing to listen for more speech", call_sid=call_sid)
+                                task = asyncio.create_task(process_batch())
+                                pending_llm_tasks.add(task)  # Track this task
+                                task.add_done_callback(llm_task_done)
                             # Loop continues - keep listening for more speech
                     
                     elif data.get('type') == 'error':
@@ -500,60 +873,43 @@ async def call_stream_endpoint(websocket: WebSocket):
                 
                 # If we reach here, the voice_ws loop has ended
                 logger.info("Voice WebSocket stream ended (voice service closed connection or no more messages)", call_sid=call_sid)
-                        
-            except Exception as e:
-                logger.error(f"Error in transcription loop: {e}", call_sid=call_sid)
-                conversation_active = False
+            except websockets.ConnectionClosed:
+                logger.info("Voice WebSocket closed", call_sid=call_sid)
+            raise CallEnded()
         
-        # Run both forwarding tasks concurrently
-        # Use return_exceptions=True to prevent one task's error from canceling the other
+        # Run both forwarding tasks concurrently. Whichever side finishes
+        # first (e.g. the caller hanging up) raises CallEnded, and the task
+        # group cancels the other; any other error cancels both and is
+        # logged below
         logger.info("Starting concurrent audio and transcription tasks", call_sid=call_sid)
-        results = await asyncio.gather(
-            forward_from_call_to_voice(),
-            forward_from_voice_to_call(),
-            return_exceptions=True
-        )
-        
-        # Log task completion
-        for i, result in enumerate(results):
-            task_name = ['forward_from_call_to_voice', 'forward_from_voice_to_call'][i]
-            if isinstance(result, Exception):
-                logger.error(f"Task {task_name} ended with exception: {result}", call_sid=call_sid)
-            else:
-                logger.info(f"Task {task_name} completed normally", call_sid=call_sid)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(forward_from_call_to_voice())
+                tg.create_task(forward_from_voice_to_call())
+        except* CallEnded:
+            pass
+        logger.info("Audio and transcription tasks completed", call_sid=call_sid)
         
     except Exception as e:
+        if isinstance(e, ExceptionGroup):
+            e = e.exceptions[0]
         logger.error(f"Call stream error: {e}", call_sid=call_sid)
+        conversation_active = False
     finally:
         # Ensure conversation cleanup happens even if tasks fail
         logger.info(f"Cleaning up call stream for {call_sid}", call_sid=call_sid)
         
+        # Nobody is left to hear answers still being generated
+        for task in list(pending_llm_tasks):
+            task.cancel()
+        
         # Mark conversation as ended and save to completed conversations
-        if call_sid and call_sid in conversation_history:
-            conversation_history[call_sid]['ended_at'] = time.time()
-            duration = conversation_history[call_sid]['ended_at'] - conversation_history[call_sid]['started_at']
-            
-            # Log full conversation
-            logger.info("="*80)
-            logger.info(f"CALL ENDED - Full Conversation Log")
-            logger.info(f"Call SID: {call_sid}")
-            logger.info(f"Phone: {phone}")
-            logger.info(f"Duration: {duration:.2f}s")
-            logger.info(f"End Reason: {'User hung up' if not conversation_active else 'Normal completion'}")
-            logger.info("="*80)
-            for i, msg in enumerate(conversation_history[call_sid]['messages'], 1):
-                role_label = "👤 USER" if msg['role'] == 'user' else "🤖 ASSISTANT"
-                timestamp_offset = msg['timestamp'] - conversation_history[call_sid]['started_at']
-                logger.info(f"[{timestamp_offset:6.1f}s] {role_label}: {msg['text']}")
-            logger.info("="*80)
-            
-            # Save to completed conversations (keep last 50)
-            completed_conversations.insert(0, conversation_history[call_sid].copy())
-            if len(completed_conversations) > 50:
-                completed_conversations.pop()
-            
-            # Remove from active conversations
-            del conversation_history[call_sid]
+        conv = await finish_conversation(call_sid) if call_sid else None
+        if conv is not None:
+            log_conversation(
+                conv, "CALL ENDED - Full Conversation Log",
+                **{"End Reason": 'User hung up' if not conversation_active else 'Normal completion'}
+            )
             logger.info(f"Conversation moved to completed list", call_sid=call_sid)
         else:
             logger.warning(f"No conversation history found for cleanup", call_sid=call_sid)
@@ -570,63 +926,42 @@ async def call_stream_endpoint(websocket: WebSocket):
 
 
 @app.post("/call/initiate")
-def initiate_call(phone: str):
+async def initiate_call(phone: str):
     """Initiate an outbound call to a customer."""
-    resp = requests.post(f"{CALL_URL}/initiate", json={"phone": phone})
+    resp = await app.state.http.post(f"{CALL_URL}/initiate", json={"phone": phone})
     resp.raise_for_status()
     return resp.json()
 
 
 @app.post("/call/receive")
-def receive_call(phone: str):
+async def receive_call(phone: str):
     """Receive an inbound call from a customer."""
-    resp = requests.post(f"{CALL_URL}/receive", json={"phone": phone})
+    resp = await app.state.http.post(f"{CALL_URL}/receive", json={"phone": phone})
     resp.raise_for_status()
     call = resp.json()
     # Auto-answer the call
-    requests.post(f"{CALL_URL}/answer", json={"call_id": call["call_id"]})
+    await app.state.http.post(f"{CALL_URL}/answer", json={"call_id": call["call_id"]})
     return call
 
 
 @app.post("/call/end")
-def end_call(call_id: str, transcript: str = ""):
+async def end_call(call_id: str, transcript: str = ""):
     """End a call and store transcript. Called by call service when call ends."""
     logger.info(f"Received call end notification for {call_id}", call_id=call_id)
     metrics.increment("calls_ended")
     
     # If conversation is still in active state, move it to completed
-    if call_id in conversation_history:
-        logger.info(f"Moving conversation {call_id} from active to completed", call_id=call_id)
-        conversation_history[call_id]['ended_at'] = time.time()
-        duration = conversation_history[call_id]['ended_at'] - conversation_history[call_id]['started_at']
-        
-        # Log full conversation
-        logger.info("="*80)
-        logger.info(f"CALL ENDED - Full Conversation Log (via /call/end)")
-        logger.info(f"Call SID: {call_id}")
-        logger.info(f"Phone: {conversation_history[call_id]['phone']}")
-        logger.info(f"Duration: {duration:.2f}s")
-        logger.info("="*80)
-        for i, msg in enumerate(conversation_history[call_id]['messages'], 1):
-            role_label = "👤 USER" if msg['role'] == 'user' else "🤖 ASSISTANT"
-            timestamp_offset = msg['timestamp'] - conversation_history[call_id]['started_at']
-            logger.info(f"[{timestamp_offset:6.1f}s] {role_label}: {msg['text']}")
-        logger.info("="*80)
-        
-        # Save to completed conversations
-        completed_conversations.insert(0, conversation_history[call_id].copy())
-        if len(completed_conversations) > 50:
-            completed_conversations.pop()
-        
-        # Remove from active
-        del conversation_history[call_id]
+    conv = await finish_conversation(call_id)
+    if conv is not None:
+        logger.info(f"Moved conversation {call_id} from active to completed", call_id=call_id)
+        log_conversation(conv, "CALL ENDED - Full Conversation Log (via /call/end)")
         logger.info(f"Conversation cleanup completed", call_id=call_id)
     else:
         logger.info(f"Conversation {call_id} already cleaned up or not found", call_id=call_id)
     
     # Forward to call service if needed
     try:
-        resp = requests.post(f"{CALL_URL}/end", json={"call_id": call_id, "transcript": transcript}, timeout=2)
+        resp = await app.state.http.post(f"{CALL_URL}/end", json={"call_id": call_id, "transcript": transcript}, timeout=2)
         return resp.json() if resp.status_code == 200 else {"status": "ok"}
     except:
         return {"status": "ok", "message": "Call ended, conversation saved"}
@@ -639,90 +974,62 @@ def get_logs(limit: int = 100):
 
 
 @app.get("/metrics")
-def get_metrics(period: Optional[int] = None):
+def get_metrics(period: int = 60):
     """Get metrics from this service."""
     return metrics.get_all_metrics(time_period_minutes=period)
 
 
 @app.get("/conversations/active")
-def get_active_conversations():
+async def get_active_conversations():
     """Get all active conversation histories."""
+    active = await conversations.list_active()
     return {
-        "active_conversations": list(conversation_history.values()),
-        "count": len(conversation_history)
+        "active_conversations": active,
+        "count": len(active)
     }
 
 
 @app.get("/conversations/completed")
-def get_completed_conversations(limit: int = 50):
-    """Get completed conversation histories."""
+async def get_completed_conversations(limit: int = 50, since: float = 0):
+    """Get completed conversation histories, newest first.
+
+    Pass ``since`` (an ``ended_at`` timestamp) to get only conversations that
+    finished after it, so pollers fetch just what is new.
+    """
+    page, total = await conversations.list_completed(limit, since)
     return {
-        "completed_conversations": completed_conversations[:limit],
-        "count": len(completed_conversations),
-        "total_completed": len(completed_conversations)
+        "completed_conversations": page,
+        "count": total,
+        "total_completed": total
     }
 
 
-@app.get("/conversations/{call_sid}")
-def get_conversation(call_sid: str):
-    """Get conversation history for a specific call."""
-    # Check active conversations first
-    if call_sid in conversation_history:
-        return {
-            "status": "active",
-            "conversation": conversation_history[call_sid]
-        }
-    
-    # Check completed conversations
-    for conv in completed_conversations:
-        if conv['call_sid'] == call_sid:
-            return {
-                "status": "completed",
-                "conversation": conv
-            }
-    
-    return {"error": "Conversation not found"}, 404
+@app.get("/conversations/completed/stream")
+async def stream_completed_conversations(limit: int = 50, since: float = 0):
+    """Stream completed conversations as NDJSON, one per line, newest first.
+
+    Takes the same ``limit``/``since`` as /conversations/completed; the total
+    count is sent in the X-Total-Count header so clients can render each
+    conversation as soon as its line arrives.
+    """
+    page, total = await conversations.list_completed(limit, since)
+    return StreamingResponse(
+        (json_dumps(conv) + b"\n" for conv in page),
+        media_type="application/x-ndjson",
+        headers={"X-Total-Count": str(total)}
+    )
 
 
 @app.post("/conversations/cleanup")
 @app.get("/conversations/cleanup")
-def cleanup_stuck_conversations(max_age_seconds: int = 300):
+async def cleanup_stuck_conversations(max_age_seconds: int = 300):
     """
     Manually cleanup conversations that are stuck in active state.
-    Moves conversations older than max_age_seconds to completed.
-    Can be called via POST /conversations/cleanup or GET /conversations/cleanup?max_age_seconds=300
+    Moves conversations with no activity for max_age_seconds to completed.
+    Can be called via POST /conversations/cleanup or GET /conversations/cleanup?max_age_seconds=300.
+    The handler also does this on its own every CONVERSATION_SWEEP_SECONDS.
     """
-    current_time = time.time()
-    cleaned_up = []
-    
-    # Find stuck conversations (older than max_age_seconds)
-    stuck_calls = []
-    for call_sid, conv in conversation_history.items():
-        age = current_time - conv['started_at']
-        if age > max_age_seconds:
-            stuck_calls.append(call_sid)
-    
-    # Move them to completed
-    for call_sid in stuck_calls:
-        conv = conversation_history[call_sid]
-        conv['ended_at'] = current_time
-        duration = conv['ended_at'] - conv['started_at']
-        
-        logger.info(f"Cleaning up stuck conversation: {call_sid} (duration: {duration:.1f}s)", call_sid=call_sid)
-        
-        # Save to completed
-        completed_conversations.insert(0, conv.copy())
-        if len(completed_conversations) > 50:
-            completed_conversations.pop()
-        
-        # Remove from active
-        del conversation_history[call_sid]
-        cleaned_up.append({
-            "call_sid": call_sid,
-            "phone": conv['phone'],
-            "duration": duration,
-            "message_count": len(conv['messages'])
-        })
+    cleaned_up = await finish_idle_conversations(max_age_seconds)
     
     return {
         "status": "ok",
@@ -731,6 +1038,38 @@ def cleanup_stuck_conversations(max_age_seconds: int = 300):
     }
 
 
+
+@app.get("/conversations/{call_sid}")
+async def get_conversation(call_sid: str):
+    """Get conversation history for a specific call."""
+    # Check active conversations first
+    conv = await conversations.get_active(call_sid)
+    if conv is not None:
+        return {
+            "status": "active",
+            "conversation": conv
+        }
+    
+    # Check completed conversations
+    conv = await conversations.find_completed(call_sid)
+    if conv is not None:
+        return {
+            "status": "completed",
+            "conversation": conv
+        }
+    
+    return {"error": "Conversation not found"}, 404
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=config.PORT)
+    # uvloop and httptools are used automatically when installed
+    # (uvicorn[standard]); extra workers need an import string to spawn
+    uvicorn.run(
+        "services.handler.service:app" if config.WORKERS > 1 else app,
+        host="0.0.0.0",
+        port=config.PORT,
+        workers=config.WORKERS,
+        timeout_keep_alive=75,
+        log_level="warning"
+    )
@@ -1,4 +1,7 @@
 """Tests for Handler Service."""
+import asyncio
+import json
+import time
 import pytest
 import sys
 from pathlib import Path
@@ -7,13 +10,37 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+import httpx
 from fastapi.testclient import TestClient
+from services.handler import service
 from services.handler.service import app
+from shared.utils.cache import SingleFlight
+from shared.utils.conversation_store import ConversationStore
 
-client = TestClient(app)
 
+@pytest.fixture(scope="module")
+def client():
+    """Client with the app's lifespan run, so app.state.http exists."""
+    with TestClient(app) as test_client:
+        yield test_client
 
-def test_health_check():
+
+@pytest.fixture
+def downstream(client, monkeypatch):
+    """Stand-in downstream services: requests made are recorded, answers canned."""
+    requests = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if str(request.url) == service.LLM_ANSWER_URL:
+            return httpx.Response(200, json={"answer": "Happy to help."})
+        return httpx.Response(404)
+
+    monkeypatch.setattr(app.state, "http", httpx.AsyncClient(transport=httpx.MockTransport(respond)))
+    return requests
+
+
+def test_health_check(client):
     """Test the health endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
@@ -22,7 +49,7 @@ def test_health_check():
     assert data["service"] in ["handler", "handler"]
 
 
-def test_logs_endpoint():
+def test_logs_endpoint(client):
     """Test logs endpoint."""
     response = client.get("/logs?limit=10")
     assert response.status_code == 200
@@ -30,7 +57,7 @@ def test_logs_endpoint():
     assert isinstance(data, list)
 
 
-def test_metrics_endpoint():
+def test_metrics_endpoint(client):
     """Test metrics endpoint."""
     response = client.get("/metrics?period=60")
     assert response.status_code == 200
@@ -38,8 +65,214 @@ def test_metrics_endpoint():
     assert "service" in data
 
 
+def test_metrics_include_buffered_increments(client):
+    """Test counters buffered between flushes still show up in /metrics."""
+    service.metrics.increment("test_buffered_counter", 3)
+    response = client.get("/metrics?period=60")
+    assert response.json()["counters"]["test_buffered_counter"] == 3
+
+
+
+def test_bulk_returns_metrics_after_increment(client):
+    """Test /bulk keeps answering /metrics, with counters, once datapoints exist."""
+    service.metrics.increment("test_bulk_counter")
+    data = client.post("/bulk", json={"paths": ["/health", "/metrics", "/logs"]}).json()
+    assert set(data) == {"/health", "/metrics", "/logs"}
+    assert data["/metrics"]["counters"]["test_bulk_counter"] == 1
+
+
+def test_completed_conversations_since(client):
+    """Test ?since= returns only conversations that ended after it."""
+    async def record(sid, ended_at):
+        await service.conversations.start(sid, "+1234567890", started_at=ended_at - 10)
+        await service.conversations.finish(sid, ended_at=ended_at)
+
+    for sid, ended_at in (("conv_old", 100.0), ("conv_new", 200.0)):
+        asyncio.run(record(sid, ended_at))
+
+    data = client.get("/conversations/completed?since=150").json()
+    assert [c["call_sid"] for c in data["completed_conversations"]] == ["conv_new"]
+    data = client.get("/conversations/completed?since=200").json()
+    assert data["completed_conversations"] == []
+    assert data["count"] >= 2
+    data = client.get("/conversations/conv_old").json()
+    assert data["status"] == "completed"
+    assert data["conversation"]["ended_at"] == 100.0
+
+
+def test_cleanup_moves_idle_conversations(client):
+    """Test cleanup completes calls idle past max_age_seconds, and only those."""
+    async def setup():
+        await service.conversations.start("conv_idle", "+1234567890", started_at=time.time() - 600)
+        await service.conversations.start("conv_live", "+1234567890", started_at=time.time() - 600)
+        await service.conversations.add_message("conv_live", "user", "still talking")
+
+    asyncio.run(setup())
+    data = client.get("/conversations/cleanup?max_age_seconds=300").json()
+    assert [c["call_sid"] for c in data["conversations"]] == ["conv_idle"]
+    assert client.get("/conversations/conv_live").json()["status"] == "active"
+
+
+def test_looked_up_conversations_outlive_new_ones():
+    """Test completed conversations that are looked up are kept over newer unread ones."""
+    async def run():
+        store = ConversationStore(max_completed=3, hot_completed=1)
+        for i in range(3):
+            await store.start(f"conv_{i}", "+1234567890")
+            await store.finish(f"conv_{i}", ended_at=100.0 + i)
+        await store.find_completed("conv_0")
+        for i in range(3, 5):
+            await store.start(f"conv_{i}", "+1234567890")
+            await store.finish(f"conv_{i}", ended_at=100.0 + i)
+        return await store.list_completed(limit=10)
+
+    page, total = asyncio.run(run())
+    assert [c["call_sid"] for c in page] == ["conv_4", "conv_3", "conv_0"]
+    assert total == 3
+
+
+def test_sweep_finishes_stuck_conversations(monkeypatch):
+    """Test the background sweep finishes idle calls without a request."""
+    monkeypatch.setattr(service.config, "CONVERSATION_SWEEP_SECONDS", 0.01)
+    monkeypatch.setattr(service.config, "STUCK_CONVERSATION_SECONDS", 0)
+    # A store of its own, so the sweep cannot finish other tests' calls
+    monkeypatch.setattr(service, "conversations", ConversationStore())
+
+    async def run_sweep():
+        await service.conversations.start("conv_swept", "+1234567890")
+        sweeper = asyncio.create_task(service.sweep_stuck_conversations())
+        await asyncio.sleep(0.1)
+        sweeper.cancel()
+        return await service.conversations.find_completed("conv_swept")
+
+    assert asyncio.run(run_sweep()) is not None
+
+
+def test_completed_conversations_stream(client):
+    """Test completed conversations stream as one JSON object per line."""
+    response = client.get("/conversations/completed/stream?limit=2")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert len(lines) <= 2
+    assert int(response.headers["x-total-count"]) >= len(lines)
+    for line in lines:
+        assert "call_sid" in json.loads(line)
+
+
+def test_session_updates_persist():
+    """Test session verification state survives a fresh lookup."""
+    async def verify_and_reload():
+        session = await service.get_or_create_session("+15550001111", "acct_sess", False)
+        await service.sessions.update(session, verified=True)
+        return await service.get_or_create_session("+15550001111", "ignored", False)
+
+    session = asyncio.run(verify_and_reload())
+    assert session["verified"] is True
+    assert session["account_id"] == "acct_sess"
+
+
+def test_answer_cache_ignores_case_and_spacing():
+    """Test cached answers are keyed on canonicalized question text."""
+    async def store_and_lookup():
+        await service.llm_answers.set("What are  your hours?", "9 to 5", 60)
+        return await service.llm_answers.get("what are your HOURS?")
+
+    assert asyncio.run(store_and_lookup()) == "9 to 5"
+    assert service.classify_intent("CHECK my Balance") == service.classify_intent("check my balance")
+
+
+def test_concurrent_identical_lookups_share_one_call():
+    """Test overlapping lookups with the same key make one downstream call."""
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    async def ask_many():
+        inflight = SingleFlight()
+        return await asyncio.gather(*(inflight.do("same", fetch) for _ in range(5)))
+
+    assert asyncio.run(ask_many()) == ["answer"] * 5
+    assert len(calls) == 1
+
+
+def test_cancelled_lookup_leader_hands_over_to_waiters():
+    """Test waiters retry, rather than fail, when the caller running the lookup is cancelled."""
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    async def cancel_leader():
+        inflight = SingleFlight()
+        leader = asyncio.create_task(inflight.do("same", fetch))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(inflight.do("same", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await asyncio.gather(*waiters)
+
+    assert asyncio.run(cancel_leader()) == ["answer"] * 3
+    assert len(calls) == 2
+
+
+class FakeVoiceSocket:
+    """Voice service socket that never sends a transcript, like an idle one kept open by pings."""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    async def close(self):
+        self.closed = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.Event().wait()
+
+
+def test_call_stop_ends_transcription_loop(client, monkeypatch):
+    """Test a stopped call stream tears down the voice side instead of waiting on it."""
+    voice = FakeVoiceSocket()
+
+    async def connect(*args, **kwargs):
+        return voice
+
+    monkeypatch.setattr(service.websockets, "connect", connect)
+    with client.websocket_connect("/call/stream") as ws:
+        ws.send_text(json.dumps({"type": "stop"}))
+    assert json.loads(voice.sent[-1]) == {"type": "stop"}
+    assert voice.closed
+
+
+def test_streamed_answer_splits_into_sentences():
+    """Test streamed LLM text is spoken sentence by sentence."""
+    sentences, rest = service.split_speakable("Savings earn 3.5% APY. No fees apply! Would you")
+    assert sentences == ["Savings earn 3.5% APY.", "No fees apply!"]
+    assert rest == "Would you"
+    assert service.split_speakable("Hello.") == ([], "Hello.")
+
+
+def test_transfer_parsing_defaults():
+    """Test transfer amounts fall back to 0.0 with no amount and 10.0 with an unreadable one."""
+    assert service.parse_transfer("transfer 50 to Bob") == (50.0, "bob")
+    assert service.parse_transfer("please transfer") == (0.0, "merchant")
+    assert service.parse_transfer("transfer 50,000 to bob") == (10.0, "bob")
+    assert service.parse_transfer("transfer money to alice") == (10.0, "alice")
+    assert service.parse_transfer("send 20 to") == (0.0, "merchant")
+
 
-def test_handle_general_query():
+def test_handle_general_query(client, downstream):
     """Test handling a general query."""
     response = client.post("/handle", json={
         "phone": "+1234567890",
@@ -49,8 +282,8 @@ def test_handle_general_query():
     })
     assert response.status_code == 200
     data = response.json()
-    assert "reply" in data
-    assert "session_verified" in data
+    assert data == {"reply": "Happy to help.", "session_verified": False}
+    assert [str(r.url) for r in downstream] == [service.LLM_ANSWER_URL]
 
 
 if __name__ == "__main__":
@@ -89,7 +89,7 @@ class AzureOpenAIService {
     this.deployment = AZURE_OPENAI_DEPLOYMENT;
   }
 
-  async generateAnswer(question, context = {}, conversationHistory = []) {
+  buildRequest(question, context = {}, conversationHistory = []) {
     const messages = [
       {
         role: 'system',
@@ -115,12 +115,16 @@ class AzureOpenAIService {
     }
 
     // Prepare request parameters
-    const requestParams = {
+    return {
       model: this.deployment,
       messages: messages,
       max_tokens: 150,
       temperature: 0.7,
     };
+  }
+
+  async generateAnswer(question, context = {}, conversationHistory = []) {
+    const requestParams = this.buildRequest(question, context, conversationHistory);
 
     // Log the full request
     log('INFO', '🔵 AZURE OPENAI API REQUEST', {
@@ -143,6 +147,36 @@ class AzureOpenAIService {
 
     return result.choices[0].message.content;
   }
+
+  // Yields the answer text piece by piece as the model generates it; aborting
+  // `signal` stops the completion so no more of it is generated (or billed)
+  async *streamAnswer(question, context = {}, conversationHistory = [], signal = undefined) {
+    const requestParams = { ...this.buildRequest(question, context, conversationHistory), stream: true };
+
+    log('INFO', '🔵 AZURE OPENAI API STREAMING REQUEST', {
+      request: JSON.stringify(requestParams, null, 2)
+    });
+
+    const stream = await this.client.chat.completions.create(requestParams);
+    const abort = () => stream.controller.abort();
+    if (signal) {
+      if (signal.aborted) {
+        abort();
+        return;
+      }
+      signal.addEventListener('abort', abort, { once: true });
+    }
+    try {
+      for await (const chunk of stream) {
+        const delta = chunk.choices[0]?.delta?.content;
+        if (delta) {
+          yield delta;
+        }
+      }
+    } finally {
+      signal?.removeEventListener('abort', abort);
+    }
+  }
 }
 
 const llmService = new AzureOpenAIService();
@@ -151,8 +185,11 @@ log('INFO', `LLM service starting up on port ${PORT} with Azure OpenAI`);
 log('INFO', `Using deployment: ${AZURE_OPENAI_DEPLOYMENT}`);
 
 // Health endpoint
+// Probes get a prebuilt body instead of a JSON.stringify per request
+const HEALTH_BODY = JSON.stringify({ status: 'ok', service: SERVICE_NAME });
+
 app.get('/health', (req, res) => {
-  res.json({ status: 'ok', service: SERVICE_NAME });
+  res.type('json').send(HEALTH_BODY);
 });
 
 // Answer endpoint
@@ -183,6 +220,47 @@ app.post('/answer', async (req, res) => {
   log('INFO', `Answering question: '${question.substring(0, 50)}...'`, { context_keys: Object.keys(context) });
   incrementCounter('questions_total');
   
+  // Callers that accept text/event-stream get the answer as it is generated:
+  // "data: {"delta": ...}" events, then "data: [DONE]"
+  if (req.accepts(['application/json', 'text/event-stream']) === 'text/event-stream') {
+    res.writeHead(200, { 'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache' });
+    // The handler drops the stream on hangup or barge-in; stop generating then.
+    // (res, not req: req emits 'close' as soon as its body has been read)
+    const hangup = new AbortController();
+    res.on('close', () => {
+      if (!res.writableEnded) {
+        hangup.abort();
+      }
+    });
+    let answer = '';
+    try {
+      for await (const delta of llmService.streamAnswer(question, context, conversation_history, hangup.signal)) {
+        if (hangup.signal.aborted) {
+          break;
+        }
+        answer += delta;
+        res.write(`data: ${JSON.stringify({ delta })}\n\n`);
+      }
+      if (hangup.signal.aborted) {
+        log('INFO', `Answer stream abandoned by the caller after '${answer.substring(0, 50)}...'`);
+        return;
+      }
+      res.write('data: [DONE]\n\n');
+
+      const elapsed = (Date.now() - startTime) / 1000;
+      recordTiming('answer_duration', elapsed);
+      log('INFO', `Answer streamed: '${answer.substring(0, 50)}...' (${elapsed.toFixed(2)}s)`, { duration: elapsed });
+    } catch (error) {
+      if (hangup.signal.aborted) {
+        log('INFO', `Answer stream abandoned by the caller after '${answer.substring(0, 50)}...'`);
+        return;
+      }
+      log('ERROR', `Question answering failed: ${error.message}`);
+      res.write(`data: ${JSON.stringify({ error: error.message })}\n\n`);
+    }
+    return res.end();
+  }
+  
   try {
     // Generate answer using Azure OpenAI with conversation history
     const answer = await llmService.generateAnswer(question, context, conversation_history);
@@ -228,7 +306,11 @@ app.get('/metrics', (req, res) => {
 });
 
 // Start server
-app.listen(PORT, '0.0.0.0', () => {
+const server = app.listen(PORT, '0.0.0.0', () => {
   console.log(`🤖 LLM service (Node.js) listening on port ${PORT}`);
   log('INFO', `LLM service ready on port ${PORT}`);
 });
+
+// Keep idle connections from the handler open longer than its pool does
+server.keepAliveTimeout = 75000;
+server.headersTimeout = 76000;
@@ -2,22 +2,28 @@
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Run as a script: add the project root to the path. Imported as
+    # services.<name>.service (tests, uvicorn workers) it is already there.
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import Optional
-import requests
 import json
 import base64
 from shared.config import get_service_url
+from shared.utils.bulk import add_bulk_endpoint
+from shared.utils.health import add_health_route
+from shared.utils.http import session, DEFAULT_TIMEOUT
+from shared.utils.json import DefaultResponse
 
 from services.qr import config
 
-app = FastAPI(title="QR Code Service")
+app = FastAPI(title="QR Code Service", default_response_class=DefaultResponse)
+add_bulk_endpoint(app)
+add_health_route(app, "qr")
 FRAUD_URL = get_service_url("fraud")
 
 
@@ -40,11 +46,11 @@ def create_qr(req: CreateQRRequest):
         return CreateQRResponse(status="rejected", reason="verification required")
     
     # Check fraud consent
-    consent_resp = requests.post(f"{FRAUD_URL}/consent", json={
+    consent_resp = session.post(f"{FRAUD_URL}/consent", json={
         "account_id": req.account_id,
         "amount": req.amount,
         "context": req.context or {}
-    })
+    }, timeout=DEFAULT_TIMEOUT)
     consent_resp.raise_for_status()
     consent_data = consent_resp.json()
     
@@ -58,11 +64,6 @@ def create_qr(req: CreateQRRequest):
     return CreateQRResponse(status="ok", qr_code=qr_code)
 
 
-@app.get("/health")
-def health():
-    return {"status": "ok", "service": "qr"}
-
-
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=config.PORT)
+    uvicorn.run(app, host="0.0.0.0", port=config.PORT, timeout_keep_alive=75)
@@ -18,4 +18,8 @@ PORT = int(os.getenv("PORT", "8005"))
 SERVICE_NAME = os.getenv("SERVICE_NAME", "rag")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+# Worker processes. The service keeps no per-call state; each worker has
+# its own answer cache.
+WORKERS = int(os.getenv("WORKERS", "1"))
+
 # Add service-specific config here as needed
@@ -2,18 +2,26 @@
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Run as a script: add the project root to the path. Imported as
+    # services.<name>.service (tests, uvicorn workers) it is already there.
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
+from functools import lru_cache
 from fastapi import FastAPI
 from pydantic import BaseModel
 from bankassist.services.rag import RAGService
+from shared.utils.bulk import add_bulk_endpoint
+from shared.utils.health import add_health_route
+from shared.utils.intent import canonical_text
+from shared.utils.json import DefaultResponse
 
 from services.rag import config
 
-app = FastAPI(title="RAG Service")
+app = FastAPI(title="RAG Service", default_response_class=DefaultResponse)
+add_bulk_endpoint(app)
+add_health_route(app, "rag")
 rag_svc = RAGService()
 
 
@@ -25,17 +33,37 @@ class QueryResponse(BaseModel):
     answer: str
 
 
+@lru_cache(maxsize=2048)
+def _cached_rag(question: str) -> str:
+    return rag_svc.query(question)
+
+
 @app.post("/query", response_model=QueryResponse)
 def query(req: QueryRequest):
-    ans = rag_svc.query(req.question)
+    # Normalize first so case/whitespace variants of a question share one cache entry
+    ans = _cached_rag(canonical_text(req.question))
     return QueryResponse(answer=ans)
 
 
-@app.get("/health")
-def health():
-    return {"status": "ok", "service": "rag"}
+@app.get("/cache/stats")
+def cache_stats():
+    return _cached_rag.cache_info()._asdict()
+
+
+@app.post("/cache/clear")
+def cache_clear():
+    _cached_rag.cache_clear()
+    return {"status": "cleared"}
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=config.PORT)
+    # uvloop and httptools are used automatically when installed
+    # (uvicorn[standard]); extra workers need an import string to spawn
+    uvicorn.run(
+        "services.rag.service:app" if config.WORKERS > 1 else app,
+        host="0.0.0.0",
+        port=config.PORT,
+        workers=config.WORKERS,
+        timeout_keep_alive=75
+    )
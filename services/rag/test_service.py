@@ -38,6 +38,17 @@ def test_metrics_endpoint():
     assert "service" in data
 
 
+def test_repeat_questions_hit_the_cache():
+    """Case/whitespace variants of a question are answered from the cache."""
+    client.post("/cache/clear")
+    first = client.post("/query", json={"question": "Tell me about savings"})
+    second = client.post("/query", json={"question": "  tell me  about SAVINGS "})
+    assert first.json() == second.json()
+    stats = client.get("/cache/stats").json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
 # Add service-specific tests here
 
 if __name__ == "__main__":
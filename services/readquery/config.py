@@ -18,4 +18,7 @@ PORT = int(os.getenv("PORT", "8008"))
 SERVICE_NAME = os.getenv("SERVICE_NAME", "readquery")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+# Worker processes. The service keeps no state, so any number is safe.
+WORKERS = int(os.getenv("WORKERS", "1"))
+
 # Add service-specific config here as needed
@@ -2,19 +2,43 @@
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Run as a script: add the project root to the path. Imported as
+    # services.<name>.service (tests, uvicorn workers) it is already there.
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+import httpx
 from pydantic import BaseModel
-import requests
 from shared.config import get_service_url
+from shared.utils.bulk import add_bulk_endpoint
+from shared.utils.health import add_health_route
+from shared.utils.json import DefaultResponse
 
 from services.readquery import config
 
-app = FastAPI(title="Read Query Service")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled async client for downstream calls, so requests reuse
+    # keep-alive connections and never tie up a threadpool worker; failed
+    # connection attempts are retried, as the shared requests session did
+    app.state.http = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            retries=2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0)
+        ),
+        timeout=httpx.Timeout(5.0, connect=1.0)
+    )
+    yield
+    await app.state.http.aclose()
+
+
+app = FastAPI(title="Read Query Service", lifespan=lifespan, default_response_class=DefaultResponse)
+add_bulk_endpoint(app)
+add_health_route(app, "readquery")
 DB_URL = get_service_url("database")
 
 
@@ -32,21 +56,31 @@ class QueryResponse(BaseModel):
 
 
 @app.post("/query", response_model=QueryResponse)
-def query(req: QueryRequest):
+async def query(req: QueryRequest):
     if not req.verified:
         raise HTTPException(status_code=403, detail="Additional verification required for account reads")
     
     lt = req.user_text.lower()
-    if "last" in lt and "transaction" in lt:
+    wants_tx = "last" in lt and "transaction" in lt
+    wants_balance = "balance" in lt
+    
+    if wants_tx and wants_balance:
+        # One DB round trip for both, rather than one per part
+        resp = await app.state.http.post(f"{DB_URL}/account_summary", json={"account_id": req.account_id, "limit": 5})
+        resp.raise_for_status()
+        data = resp.json()
+        return QueryResponse(type="balance_and_transactions", items=data["transactions"], amount=data["balance"])
+    
+    if wants_tx:
         # Call DB service
-        resp = requests.post(f"{DB_URL}/read_transactions", json={"account_id": req.account_id, "limit": 5})
+        resp = await app.state.http.post(f"{DB_URL}/read_transactions", json={"account_id": req.account_id, "limit": 5})
         resp.raise_for_status()
         txs = resp.json()
         return QueryResponse(type="transactions", items=txs)
     
-    if "balance" in lt:
+    if wants_balance:
         # Call DB service
-        resp = requests.post(f"{DB_URL}/balance", json={"account_id": req.account_id})
+        resp = await app.state.http.post(f"{DB_URL}/balance", json={"account_id": req.account_id})
         resp.raise_for_status()
         data = resp.json()
         return QueryResponse(type="balance", amount=data["balance"])
@@ -54,11 +88,14 @@ def query(req: QueryRequest):
     return QueryResponse(type="unknown", message="Could not map to SQL query")
 
 
-@app.get("/health")
-def health():
-    return {"status": "ok", "service": "readquery"}
-
-
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=config.PORT)
+    # uvloop and httptools are used automatically when installed
+    # (uvicorn[standard]); extra workers need an import string to spawn
+    uvicorn.run(
+        "services.readquery.service:app" if config.WORKERS > 1 else app,
+        host="0.0.0.0",
+        port=config.PORT,
+        workers=config.WORKERS,
+        timeout_keep_alive=75
+    )
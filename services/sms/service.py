@@ -2,19 +2,25 @@
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Run as a script: add the project root to the path. Imported as
+    # services.<name>.service (tests, uvicorn workers) it is already there.
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
 from fastapi import FastAPI
 from pydantic import BaseModel
 from typing import Optional, List
 from bankassist.services.sms import SMSService, SMS
+from shared.utils.bulk import add_bulk_endpoint
+from shared.utils.health import add_health_route
+from shared.utils.json import DefaultResponse
 
 from services.sms import config
 
-app = FastAPI(title="SMS Service")
+app = FastAPI(title="SMS Service", default_response_class=DefaultResponse)
+add_bulk_endpoint(app)
+add_health_route(app, "sms")
 sms_svc = SMSService()
 
 
@@ -45,7 +51,8 @@ class SMSResponse(BaseModel):
 @app.post("/send", response_model=SMSResponse)
 def send_sms(req: SendSMSRequest):
     sms = sms_svc.send_sms(req.to, req.body, req.media_url)
-    return SMSResponse(to=sms.to, body=sms.body, media_url=sms.media_url, timestamp=sms.timestamp)
+    # Plain dicts are validated once against response_model
+    return vars(sms)
 
 
 @app.post("/receive")
@@ -61,9 +68,11 @@ def expect_message(req: ExpectMessageRequest):
 
 
 @app.get("/inbox/{phone}", response_model=List[SMSResponse])
-def get_inbox(phone: str):
-    messages = sms_svc.get_inbox_for(phone)
-    return [SMSResponse(to=m.to, body=m.body, media_url=m.media_url, timestamp=m.timestamp) for m in messages]
+def get_inbox(phone: str, limit: Optional[int] = None):
+    messages = sms_svc.get_inbox_for(phone, limit)
+    # Plain dicts are validated once against response_model; building
+    # SMSResponse objects here would validate every message twice
+    return [vars(m) for m in messages]
 
 
 @app.get("/stats")
@@ -71,11 +80,6 @@ def stats():
     return sms_svc.stats()
 
 
-@app.get("/health")
-def health():
-    return {"status": "ok", "service": "sms"}
-
-
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=config.PORT)
+    uvicorn.run(app, host="0.0.0.0", port=config.PORT, timeout_keep_alive=75)
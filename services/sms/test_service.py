@@ -38,6 +38,21 @@ def test_metrics_endpoint():
     assert "service" in data
 
 
+def test_inbox_keeps_newest_messages_per_phone():
+    """Each phone's inbox is bounded and can return just the newest messages."""
+    from services.sms.service import sms_svc
+    for i in range(sms_svc.max_per_phone + 5):
+        client.post("/expect", json={"phone": "+15550001111", "purpose": "test"})
+        client.post("/receive", json={"from_number": "+15550001111", "body": f"msg {i}"})
+    inbox = client.get("/inbox/+15550001111").json()
+    assert len(inbox) == sms_svc.max_per_phone
+    assert inbox[-1]["body"] == f"msg {sms_svc.max_per_phone + 4}"
+    newest = client.get("/inbox/+15550001111?limit=2").json()
+    assert [m["body"] for m in newest] == [f"msg {sms_svc.max_per_phone + 3}", f"msg {sms_svc.max_per_phone + 4}"]
+    assert client.get("/inbox/+15550001111?limit=0").json() == []
+    assert client.get("/inbox/+15550001111?limit=-1").json() == []
+
+
 # Add service-specific tests here
 
 if __name__ == "__main__":
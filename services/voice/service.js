@@ -166,8 +166,11 @@ log('INFO', `Voice service starting up on port ${PORT} with Azure Speech`);
 log('INFO', `Using voice: ${VOICE_NAME}, region: ${SPEECH_REGION}`);
 
 // Health endpoint
+// Probes get a prebuilt body instead of a JSON.stringify per request
+const HEALTH_BODY = JSON.stringify({ status: 'ok', service: SERVICE_NAME });
+
 app.get('/health', (req, res) => {
-  res.json({ status: 'ok', service: SERVICE_NAME });
+  res.type('json').send(HEALTH_BODY);
 });
 
 // Transcribe endpoint (STT)
@@ -221,15 +224,19 @@ app.post('/synthesize', async (req, res) => {
   try {
     // Perform synthesis using Azure Speech SDK
     const audio = await voiceService.synthesize(text);
-    const audioB64 = audio.content.toString('base64');
     
     const elapsed = (Date.now() - startTime) / 1000;
     recordTiming('synthesis_duration', elapsed);
     
     log('INFO', `Synthesis complete (${audio.content.length} bytes, ${elapsed.toFixed(2)}s)`, { duration: elapsed });
     
+    // Browsers can play the raw bytes from a Blob URL; skip base64 for them.
+    if (req.accepts(['application/json', 'audio/wav']) === 'audio/wav') {
+      return res.type('audio/wav').send(audio.content);
+    }
+    
     res.json({
-      audio_bytes: audioB64,
+      audio_bytes: audio.content.toString('base64'),
       format: audio.format
     });
   } catch (error) {
@@ -265,11 +272,15 @@ app.get('/metrics', (req, res) => {
 });
 
 // Start server
-app.listen(PORT, '0.0.0.0', () => {
+const server = app.listen(PORT, '0.0.0.0', () => {
   console.log(`🎤 Voice service (Node.js) listening on port ${PORT}`);
   log('INFO', `Voice service ready on port ${PORT}`);
 });
 
+// Keep idle connections from the handler open longer than its pool does
+server.keepAliveTimeout = 75000;
+server.headersTimeout = 76000;
+
 // WebSocket endpoint for live transcription
 app.ws('/live-transcribe', (ws, req) => {
   log('INFO', 'Live transcription WebSocket connected');
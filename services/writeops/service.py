@@ -2,20 +2,44 @@
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if __name__ == "__main__":
+    # Run as a script: add the project root to the path. Imported as
+    # services.<name>.service (tests, uvicorn workers) it is already there.
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+import httpx
 from pydantic import BaseModel
 from typing import Optional
-import requests
 from shared.config import get_service_url
+from shared.utils.bulk import add_bulk_endpoint
+from shared.utils.health import add_health_route
+from shared.utils.json import DefaultResponse
 
 from services.writeops import config
 
-app = FastAPI(title="Write Operation Service")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled async client for downstream calls, so requests reuse
+    # keep-alive connections and never tie up a threadpool worker; failed
+    # connection attempts are retried, as the shared requests session did
+    app.state.http = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            retries=2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0)
+        ),
+        timeout=httpx.Timeout(5.0, connect=1.0)
+    )
+    yield
+    await app.state.http.aclose()
+
+
+app = FastAPI(title="Write Operation Service", lifespan=lifespan, default_response_class=DefaultResponse)
+add_bulk_endpoint(app)
+add_health_route(app, "writeops")
 FRAUD_URL = get_service_url("fraud")
 DB_URL = get_service_url("database")
 
@@ -35,12 +59,12 @@ class TransferResponse(BaseModel):
 
 
 @app.post("/transfer", response_model=TransferResponse)
-def transfer(req: TransferRequest):
+async def transfer(req: TransferRequest):
     if not req.verified:
         raise HTTPException(status_code=403, detail="Additional verification required for write operations")
     
     # Check fraud consent
-    consent_resp = requests.post(f"{FRAUD_URL}/consent", json={
+    consent_resp = await app.state.http.post(f"{FRAUD_URL}/consent", json={
         "account_id": req.from_acct,
         "amount": req.amount,
         "context": req.context or {}
@@ -52,10 +76,10 @@ def transfer(req: TransferRequest):
         return TransferResponse(status="rejected", reason=consent_data.get("reason"))
     
     # Ensure to_acct exists
-    requests.post(f"{DB_URL}/ensure_account", json={"account_id": req.to_acct, "balance": 0.0})
+    await app.state.http.post(f"{DB_URL}/ensure_account", json={"account_id": req.to_acct, "balance": 0.0})
     
     # Perform write
-    tx_resp = requests.post(f"{DB_URL}/write_transaction", json={
+    tx_resp = await app.state.http.post(f"{DB_URL}/write_transaction", json={
         "account_id": req.from_acct,
         "counterparty": req.to_acct,
         "amount": req.amount
@@ -66,11 +90,14 @@ def transfer(req: TransferRequest):
     return TransferResponse(status="ok", transaction=tx_data)
 
 
-@app.get("/health")
-def health():
-    return {"status": "ok", "service": "writeops"}
-
-
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=config.PORT)
+    # uvloop and httptools are used automatically when installed
+    # (uvicorn[standard]); extra workers need an import string to spawn
+    uvicorn.run(
+        "services.writeops.service:app" if config.WORKERS > 1 else app,
+        host="0.0.0.0",
+        port=config.PORT,
+        workers=config.WORKERS,
+        timeout_keep_alive=75
+    )
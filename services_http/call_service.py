@@ -3,8 +3,9 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import Optional, List
 from bankassist.services.call import CallService, Call
+from shared.utils.json import DefaultResponse
 
-app = FastAPI(title="Call Service")
+app = FastAPI(title="Call Service", default_response_class=DefaultResponse)
 call_svc = CallService()
 
 
@@ -108,32 +109,15 @@ def get_call(call_id: str):
 def get_active_calls():
     """Get all active calls."""
     calls = call_svc.get_active_calls()
-    return [CallResponse(
-        call_id=c.call_id,
-        phone=c.phone,
-        direction=c.direction,
-        status=c.status,
-        started_at=c.started_at,
-        ended_at=c.ended_at,
-        duration=c.duration,
-        transcript=c.transcript
-    ) for c in calls]
+    # Plain dicts are validated once against response_model
+    return [vars(c) for c in calls]
 
 
 @app.get("/history", response_model=List[CallResponse])
 def get_call_history(phone: Optional[str] = None, limit: int = 10):
     """Get call history."""
     calls = call_svc.get_call_history(phone, limit)
-    return [CallResponse(
-        call_id=c.call_id,
-        phone=c.phone,
-        direction=c.direction,
-        status=c.status,
-        started_at=c.started_at,
-        ended_at=c.ended_at,
-        duration=c.duration,
-        transcript=c.transcript
-    ) for c in calls]
+    return [vars(c) for c in calls]
 
 
 @app.get("/stats")
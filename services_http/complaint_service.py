@@ -3,8 +3,9 @@ from fastapi import FastAPI
 from pydantic import BaseModel
 from typing import Optional, List
 from bankassist.services.complaint import ComplaintService, Complaint
+from shared.utils.json import DefaultResponse
 
-app = FastAPI(title="Complaint Service")
+app = FastAPI(title="Complaint Service", default_response_class=DefaultResponse)
 complaint_svc = ComplaintService()
 
 
@@ -31,7 +32,8 @@ def lodge(req: LodgeRequest):
 @app.get("/recent", response_model=List[ComplaintResponse])
 def recent(limit: int = 5):
     complaints = complaint_svc.list_recent(limit)
-    return [ComplaintResponse(id=c.id, phone=c.phone, text=c.text, image_url=c.image_url, timestamp=c.timestamp) for c in complaints]
+    # Plain dicts are validated once against response_model
+    return [vars(c) for c in complaints]
 
 
 @app.get("/health")
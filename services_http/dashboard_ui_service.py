@@ -1,45 +1,135 @@
 """Dashboard UI Service - Real-time monitoring web interface."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
-import requests
 import asyncio
-import json
-from typing import List
+import httpx
+from typing import Set
 from bankassist.config import get_service_url, SERVICE_PORTS
+from shared.utils.json import DefaultResponse, dumps
 
-app = FastAPI(title="Dashboard UI Service")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled async client for polling services, so probes reuse
+    # keep-alive connections and never block the event loop
+    app.state.http = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0),
+        timeout=1.0
+    )
+    publisher = asyncio.create_task(_publish_updates())
+    yield
+    publisher.cancel()
+    await app.state.http.aclose()
+
+
+app = FastAPI(title="Dashboard UI Service", lifespan=lifespan, default_response_class=DefaultResponse)
 
 # WebSocket connections for live updates
-active_connections: List[WebSocket] = []
+active_connections: Set[WebSocket] = set()
+
+
+def _json_text(data: dict) -> str:
+    """JSON text for a WebSocket frame, encoded with orjson when installed."""
+    return dumps(data).decode()
+
+
+# Sends started together per broadcast round; the event loop gets a turn
+# between rounds, so a large audience never monopolizes it
+BROADCAST_BATCH_SIZE = 50
 
 
 async def broadcast_update(data: dict):
     """Broadcast updates to all connected WebSocket clients."""
-    for connection in active_connections:
+    # Encoded once and the same text sent to everyone
+    payload = _json_text(data)
+    # Snapshot, so connects and disconnects mid-broadcast are safe
+    connections = list(active_connections)
+    failed = []
+    for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+        if start:
+            await asyncio.sleep(0)
+        batch = connections[start:start + BROADCAST_BATCH_SIZE]
+        results = await asyncio.gather(*(c.send_text(payload) for c in batch), return_exceptions=True)
+        failed.extend(c for c, result in zip(batch, results) if isinstance(result, Exception))
+    
+    # Dropped only after the fan-out, never while iterating
+    for connection in failed:
+        active_connections.discard(connection)
+
+
+# Seconds between metrics snapshots
+UPDATE_INTERVAL_SECONDS = 2
+
+
+async def _publish_updates():
+    """Collect one metrics snapshot per interval and broadcast it.
+
+    Services are polled once per tick however many dashboards are open, and
+    not at all while none are.
+    """
+    while True:
+        await asyncio.sleep(UPDATE_INTERVAL_SECONDS)
+        if not active_connections:
+            continue
         try:
-            await connection.send_json(data)
-        except:
-            active_connections.remove(connection)
+            await broadcast_update(await collect_all_metrics())
+        except Exception:
+            pass  # skip this snapshot; the next tick tries again
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for live dashboard updates."""
     await websocket.accept()
-    active_connections.append(websocket)
+    active_connections.add(websocket)
     
     try:
-        while True:
-            # Send updates every 2 seconds
-            await asyncio.sleep(2)
-            
-            # Collect data from all services
-            update_data = await collect_all_metrics()
-            await websocket.send_json(update_data)
-    
+        # Updates are pushed by _publish_updates; here we only wait for the
+        # client to go away
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
+        pass
+    finally:
+        active_connections.discard(websocket)
+
+
+# Longest one service's probe may take before it is reported as an error
+PROBE_TIMEOUT_SECONDS = 1.0
+
+
+async def _get_json(port: int, path: str, default):
+    """GET one endpoint, returning default on a non-200 response."""
+    resp = await app.state.http.get(f"http://localhost:{port}{path}")
+    return resp.json() if resp.status_code == 200 else default
+
+
+async def _probe_service(port: int):
+    """Fetch one service's health, metrics and logs together.
+
+    Returns its dashboard entry and its logs. A failed health check raises;
+    metrics and logs are optional and fall back to empty.
+    """
+    health, metrics, logs = await asyncio.gather(
+        _get_json(port, "/health", {"status": "down"}),
+        _get_json(port, "/metrics", {}),
+        _get_json(port, "/logs", []),
+        return_exceptions=True
+    )
+    if isinstance(health, Exception):
+        raise health
+    if isinstance(metrics, Exception):
+        metrics = {}
+    if isinstance(logs, Exception):
+        logs = []
+    return {
+        "status": health.get("status", "unknown"),
+        "port": port,
+        "metrics": metrics
+    }, logs
 
 
 async def collect_all_metrics():
@@ -50,42 +140,26 @@ async def collect_all_metrics():
         "logs": []
     }
     
-    for service_name, port in SERVICE_PORTS.items():
-        if service_name == "dashboard_ui":
-            continue
-        
-        try:
-            # Get health status
-            health_resp = requests.get(f"http://localhost:{port}/health", timeout=1)
-            health = health_resp.json() if health_resp.status_code == 200 else {"status": "down"}
-            
-            # Get metrics if available
-            try:
-                metrics_resp = requests.get(f"http://localhost:{port}/metrics", timeout=1)
-                metrics = metrics_resp.json() if metrics_resp.status_code == 200 else {}
-            except:
-                metrics = {}
-            
-            # Get logs if available
-            try:
-                logs_resp = requests.get(f"http://localhost:{port}/logs", timeout=1)
-                logs = logs_resp.json() if logs_resp.status_code == 200 else []
-                data["logs"].extend(logs)
-            except:
-                pass
-            
-            data["services"][service_name] = {
-                "status": health.get("status", "unknown"),
-                "port": port,
-                "metrics": metrics
-            }
-        
-        except Exception as e:
+    # Probe every service at once, so a tick takes as long as the slowest
+    # service rather than the sum of all of them; the timeout keeps one
+    # hung service from holding up the rest
+    services = [(name, port) for name, port in SERVICE_PORTS.items() if name != "dashboard_ui"]
+    results = await asyncio.gather(
+        *(asyncio.wait_for(_probe_service(port), PROBE_TIMEOUT_SECONDS) for _, port in services),
+        return_exceptions=True
+    )
+    
+    for (service_name, port), result in zip(services, results):
+        if isinstance(result, Exception):
             data["services"][service_name] = {
                 "status": "error",
                 "port": port,
-                "error": str(e)
+                "error": str(result) or type(result).__name__
             }
+            continue
+        
+        data["services"][service_name], logs = result
+        data["logs"].extend(logs)
     
     # Sort logs by timestamp
     data["logs"].sort(key=lambda x: x.get("timestamp", ""), reverse=True)
@@ -102,9 +176,9 @@ async def get_service_metrics(service_name: str, period: int = 60):
     
     port = SERVICE_PORTS[service_name]
     try:
-        resp = requests.get(f"http://localhost:{port}/metrics?period={period}", timeout=2)
+        resp = await app.state.http.get(f"http://localhost:{port}/metrics?period={period}", timeout=2)
         return resp.json() if resp.status_code == 200 else {"error": "No metrics"}
-    except:
+    except (httpx.HTTPError, ValueError):
         return {"error": "Service unavailable"}
 
 
@@ -1,13 +1,14 @@
 """Database Service - HTTP API."""
 from fastapi import FastAPI
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List
 import time
 from bankassist.services.db import DatabaseService, Transaction
 from bankassist.utils.logger import ServiceLogger
 from bankassist.utils.metrics import MetricsCollector
+from shared.utils.json import DefaultResponse
 
-app = FastAPI(title="Database Service")
+app = FastAPI(title="Database Service", default_response_class=DefaultResponse)
 db_svc = DatabaseService()
 
 # Initialize logger and metrics
@@ -120,7 +121,7 @@ def get_logs(limit: int = 100):
 
 
 @app.get("/metrics")
-def get_metrics(period: Optional[int] = None):
+def get_metrics(period: int = 60):
     """Get metrics from this service."""
     return metrics.get_all_metrics(time_period_minutes=period)
 
@@ -3,8 +3,9 @@ from fastapi import FastAPI
 from pydantic import BaseModel
 from typing import Optional, List
 from bankassist.services.fraud import FraudDetectionService, FraudAlert
+from shared.utils.json import DefaultResponse
 
-app = FastAPI(title="Fraud Detection Service")
+app = FastAPI(title="Fraud Detection Service", default_response_class=DefaultResponse)
 fraud_svc = FraudDetectionService(amount_threshold=1000.0)
 
 
@@ -1,9 +1,12 @@
 """LLM Service - HTTP API for general queries."""
+from functools import lru_cache
 from fastapi import FastAPI
 from pydantic import BaseModel
 from bankassist.services.llm import LLMService
+from shared.utils.intent import canonical_text
+from shared.utils.json import DefaultResponse
 
-app = FastAPI(title="LLM Service")
+app = FastAPI(title="LLM Service", default_response_class=DefaultResponse)
 llm_svc = LLMService({"bank_name": "ElderCare Bank", "hours": "8-6 M-F"})
 
 
@@ -15,12 +18,29 @@ class AnswerResponse(BaseModel):
     answer: str
 
 
+@lru_cache(maxsize=2048)
+def _cached_answer(question: str) -> str:
+    return llm_svc.answer(question)
+
+
 @app.post("/answer", response_model=AnswerResponse)
 def answer(req: AnswerRequest):
-    ans = llm_svc.answer(req.question)
+    # Normalize first so case/whitespace variants of a question share one cache entry
+    ans = _cached_answer(canonical_text(req.question))
     return AnswerResponse(answer=ans)
 
 
+@app.get("/cache/stats")
+def cache_stats():
+    return _cached_answer.cache_info()._asdict()
+
+
+@app.post("/cache/clear")
+def cache_clear():
+    _cached_answer.cache_clear()
+    return {"status": "cleared"}
+
+
 @app.get("/health")
 def health():
     return {"status": "ok", "service": "llm"}
@@ -2,12 +2,13 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import Optional
-import requests
 import json
 import base64
 from bankassist.config import get_service_url
+from shared.utils.http import session, DEFAULT_TIMEOUT
+from shared.utils.json import DefaultResponse
 
-app = FastAPI(title="QR Code Service")
+app = FastAPI(title="QR Code Service", default_response_class=DefaultResponse)
 FRAUD_URL = get_service_url("fraud")
 
 
@@ -30,11 +31,11 @@ def create_qr(req: CreateQRRequest):
         return CreateQRResponse(status="rejected", reason="verification required")
     
     # Check fraud consent
-    consent_resp = requests.post(f"{FRAUD_URL}/consent", json={
+    consent_resp = session.post(f"{FRAUD_URL}/consent", json={
         "account_id": req.account_id,
         "amount": req.amount,
         "context": req.context or {}
-    })
+    }, timeout=DEFAULT_TIMEOUT)
     consent_resp.raise_for_status()
     consent_data = consent_resp.json()
     
@@ -1,9 +1,12 @@
 """RAG Service - HTTP API for product/offers queries."""
+from functools import lru_cache
 from fastapi import FastAPI
 from pydantic import BaseModel
 from bankassist.services.rag import RAGService
+from shared.utils.intent import canonical_text
+from shared.utils.json import DefaultResponse
 
-app = FastAPI(title="RAG Service")
+app = FastAPI(title="RAG Service", default_response_class=DefaultResponse)
 rag_svc = RAGService()
 
 
@@ -15,12 +18,29 @@ class QueryResponse(BaseModel):
     answer: str
 
 
+@lru_cache(maxsize=2048)
+def _cached_rag(question: str) -> str:
+    return rag_svc.query(question)
+
+
 @app.post("/query", response_model=QueryResponse)
 def query(req: QueryRequest):
-    ans = rag_svc.query(req.question)
+    # Normalize first so case/whitespace variants of a question share one cache entry
+    ans = _cached_rag(canonical_text(req.question))
     return QueryResponse(answer=ans)
 
 
+@app.get("/cache/stats")
+def cache_stats():
+    return _cached_rag.cache_info()._asdict()
+
+
+@app.post("/cache/clear")
+def cache_clear():
+    _cached_rag.cache_clear()
+    return {"status": "cleared"}
+
+
 @app.get("/health")
 def health():
     return {"status": "ok", "service": "rag"}
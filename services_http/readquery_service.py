@@ -1,10 +1,11 @@
 """Read Query Service - HTTP API."""
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-import requests
 from bankassist.config import get_service_url
+from shared.utils.http import session, DEFAULT_TIMEOUT
+from shared.utils.json import DefaultResponse
 
-app = FastAPI(title="Read Query Service")
+app = FastAPI(title="Read Query Service", default_response_class=DefaultResponse)
 DB_URL = get_service_url("database")
 
 
@@ -29,14 +30,14 @@ def query(req: QueryRequest):
     lt = req.user_text.lower()
     if "last" in lt and "transaction" in lt:
         # Call DB service
-        resp = requests.post(f"{DB_URL}/read_transactions", json={"account_id": req.account_id, "limit": 5})
+        resp = session.post(f"{DB_URL}/read_transactions", json={"account_id": req.account_id, "limit": 5}, timeout=DEFAULT_TIMEOUT)
         resp.raise_for_status()
         txs = resp.json()
         return QueryResponse(type="transactions", items=txs)
     
     if "balance" in lt:
         # Call DB service
-        resp = requests.post(f"{DB_URL}/balance", json={"account_id": req.account_id})
+        resp = session.post(f"{DB_URL}/balance", json={"account_id": req.account_id}, timeout=DEFAULT_TIMEOUT)
         resp.raise_for_status()
         data = resp.json()
         return QueryResponse(type="balance", amount=data["balance"])
@@ -3,8 +3,9 @@ from fastapi import FastAPI
 from pydantic import BaseModel
 from typing import Optional, List
 from bankassist.services.sms import SMSService, SMS
+from shared.utils.json import DefaultResponse
 
-app = FastAPI(title="SMS Service")
+app = FastAPI(title="SMS Service", default_response_class=DefaultResponse)
 sms_svc = SMSService()
 
 
@@ -51,9 +52,11 @@ def expect_message(req: ExpectMessageRequest):
 
 
 @app.get("/inbox/{phone}", response_model=List[SMSResponse])
-def get_inbox(phone: str):
-    messages = sms_svc.get_inbox_for(phone)
-    return [SMSResponse(to=m.to, body=m.body, media_url=m.media_url, timestamp=m.timestamp) for m in messages]
+def get_inbox(phone: str, limit: Optional[int] = None):
+    messages = sms_svc.get_inbox_for(phone, limit)
+    # Plain dicts are validated once against response_model; building
+    # SMSResponse objects here would validate every message twice
+    return [vars(m) for m in messages]
 
 
 @app.get("/stats")
@@ -1,13 +1,16 @@
 """Voice Service - HTTP API for STT and TTS."""
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from pydantic import BaseModel
-from typing import Optional
+import asyncio
 import time
+from binascii import a2b_base64, b2a_base64
+from concurrent.futures import ThreadPoolExecutor
 from bankassist.services.voice import AzureVoiceService, Audio
 from bankassist.utils.logger import ServiceLogger
 from bankassist.utils.metrics import MetricsCollector
+from shared.utils.json import DefaultResponse
 
-app = FastAPI(title="Voice Service")
+app = FastAPI(title="Voice Service", default_response_class=DefaultResponse)
 voice_svc = AzureVoiceService()
 
 # Initialize logger and metrics
@@ -15,6 +18,11 @@ logger = ServiceLogger("voice")
 metrics = MetricsCollector("voice")
 logger.info("Voice service starting up")
 
+# Base64 and speech work runs on its own threads, so a burst of large audio
+# neither blocks the event loop nor takes the threadpool slots that /health,
+# /logs and /metrics need
+audio_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="voice-audio")
+
 
 class TranscribeRequest(BaseModel):
     audio_bytes: str  # base64 encoded
@@ -34,18 +42,46 @@ class SynthesizeResponse(BaseModel):
     format: str
 
 
+def _transcribe(audio_bytes: str, format: str) -> str:
+    return _transcribe_raw(a2b_base64(audio_bytes), format)
+
+
+def _transcribe_raw(audio_content: bytes, format: str) -> str:
+    logger.debug(f"Decoded {len(audio_content)} bytes of audio")
+    return voice_svc.transcribe(Audio(content=audio_content, format=format))
+
+
+def _synthesize(text: str):
+    audio = voice_svc.synthesize(text)
+    return audio, b2a_base64(audio.content, newline=False).decode("ascii")
+
+
 @app.post("/transcribe", response_model=TranscribeResponse)
-def transcribe(req: TranscribeRequest):
+async def transcribe(req: TranscribeRequest):
     start_time = time.time()
     logger.info(f"Transcribing audio ({req.format} format)")
     metrics.increment("transcriptions_total")
     
-    import base64
-    audio_content = base64.b64decode(req.audio_bytes)
-    logger.debug(f"Decoded {len(audio_content)} bytes of audio")
+    loop = asyncio.get_running_loop()
+    transcript = await loop.run_in_executor(audio_executor, _transcribe, req.audio_bytes, req.format)
+    
+    elapsed = time.time() - start_time
+    metrics.timing("transcription_duration", elapsed)
+    logger.info(f"Transcription complete: '{transcript[:50]}...' ({elapsed:.2f}s)", duration=elapsed)
+    
+    return TranscribeResponse(transcript=transcript)
+
+
+@app.post("/transcribe_raw", response_model=TranscribeResponse)
+async def transcribe_raw(request: Request, format: str = "wav"):
+    """Transcribe an ``application/octet-stream`` body, skipping the base64 round trip."""
+    start_time = time.time()
+    audio_content = await request.body()
+    logger.info(f"Transcribing raw audio ({format} format)")
+    metrics.increment("transcriptions_total")
     
-    audio = Audio(content=audio_content, format=req.format)
-    transcript = voice_svc.transcribe(audio)
+    loop = asyncio.get_running_loop()
+    transcript = await loop.run_in_executor(audio_executor, _transcribe_raw, audio_content, format)
     
     elapsed = time.time() - start_time
     metrics.timing("transcription_duration", elapsed)
@@ -55,14 +91,13 @@ def transcribe(req: TranscribeRequest):
 
 
 @app.post("/synthesize", response_model=SynthesizeResponse)
-def synthesize(req: SynthesizeRequest):
+async def synthesize(req: SynthesizeRequest):
     start_time = time.time()
     logger.info(f"Synthesizing text: '{req.text[:50]}...'")
     metrics.increment("syntheses_total")
     
-    import base64
-    audio = voice_svc.synthesize(req.text)
-    audio_b64 = base64.b64encode(audio.content).decode("ascii")
+    loop = asyncio.get_running_loop()
+    audio, audio_b64 = await loop.run_in_executor(audio_executor, _synthesize, req.text)
     
     elapsed = time.time() - start_time
     metrics.timing("synthesis_duration", elapsed)
@@ -83,7 +118,7 @@ def get_logs(limit: int = 100):
 
 
 @app.get("/metrics")
-def get_metrics(period: Optional[int] = None):
+def get_metrics(period: int = 60):
     """Get metrics from this service."""
     return metrics.get_all_metrics(time_period_minutes=period)
 
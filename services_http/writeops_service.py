@@ -2,10 +2,11 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import Optional
-import requests
 from bankassist.config import get_service_url
+from shared.utils.http import session, DEFAULT_TIMEOUT
+from shared.utils.json import DefaultResponse
 
-app = FastAPI(title="Write Operation Service")
+app = FastAPI(title="Write Operation Service", default_response_class=DefaultResponse)
 FRAUD_URL = get_service_url("fraud")
 DB_URL = get_service_url("database")
 
@@ -30,11 +31,11 @@ def transfer(req: TransferRequest):
         raise HTTPException(status_code=403, detail="Additional verification required for write operations")
     
     # Check fraud consent
-    consent_resp = requests.post(f"{FRAUD_URL}/consent", json={
+    consent_resp = session.post(f"{FRAUD_URL}/consent", json={
         "account_id": req.from_acct,
         "amount": req.amount,
         "context": req.context or {}
-    })
+    }, timeout=DEFAULT_TIMEOUT)
     consent_resp.raise_for_status()
     consent_data = consent_resp.json()
     
@@ -42,14 +43,14 @@ def transfer(req: TransferRequest):
         return TransferResponse(status="rejected", reason=consent_data.get("reason"))
     
     # Ensure to_acct exists
-    requests.post(f"{DB_URL}/ensure_account", json={"account_id": req.to_acct, "balance": 0.0})
+    session.post(f"{DB_URL}/ensure_account", json={"account_id": req.to_acct, "balance": 0.0}, timeout=DEFAULT_TIMEOUT)
     
     # Perform write
-    tx_resp = requests.post(f"{DB_URL}/write_transaction", json={
+    tx_resp = session.post(f"{DB_URL}/write_transaction", json={
         "account_id": req.from_acct,
         "counterparty": req.to_acct,
         "amount": req.amount
-    })
+    }, timeout=DEFAULT_TIMEOUT)
     tx_resp.raise_for_status()
     tx_data = tx_resp.json()
     
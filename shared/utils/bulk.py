@@ -0,0 +1,68 @@
+"""Batched read endpoint shared by all services."""
+import inspect
+import logging
+from typing import List
+
+from fastapi import FastAPI, Response
+from fastapi.params import Param
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from shared.utils.json import loads
+
+logger = logging.getLogger(__name__)
+
+# Read-only monitoring endpoints /bulk may answer; nothing else is callable through it
+BULK_PATHS = frozenset({"/health", "/metrics", "/logs"})
+
+
+class BulkRequest(BaseModel):
+    paths: List[str]
+
+
+def _default_kwargs(endpoint) -> dict:
+    """Keyword arguments calling ``endpoint`` with its declared defaults, as a plain GET would."""
+    kwargs = {}
+    for name, param in inspect.signature(endpoint).parameters.items():
+        default = param.default
+        if isinstance(default, Param):
+            default = default.default  # Query(...) and friends
+        if default is inspect.Parameter.empty or default is ...:
+            raise TypeError(f"parameter {name!r} has no default")
+        kwargs[name] = default
+    return kwargs
+
+
+def add_bulk_endpoint(app: FastAPI):
+    """Register POST /bulk, which answers several monitoring GETs in one round trip.
+
+    The dashboard polls /health, /metrics and /logs on every service each tick;
+    this lets it fetch all three with a single request. Only those paths are
+    served, each called with its default parameters. Paths the service does
+    not expose (or that fail, which is logged) are left out of the response so
+    callers can treat them as missing.
+    """
+
+    @app.post("/bulk")
+    async def bulk(req: BulkRequest):
+        wanted = BULK_PATHS.intersection(req.paths)
+        results = {}
+        for route in app.routes:
+            path = getattr(route, "path", None)
+            if path not in wanted or path in results or "GET" not in getattr(route, "methods", ()):
+                continue
+            try:
+                kwargs = _default_kwargs(route.endpoint)
+                if inspect.iscoroutinefunction(route.endpoint):
+                    result = await route.endpoint(**kwargs)
+                else:
+                    # Sync endpoints run in the threadpool, as FastAPI runs them
+                    result = await run_in_threadpool(route.endpoint, **kwargs)
+                if isinstance(result, Response):
+                    # Endpoints that pre-serialize their JSON body
+                    result = loads(result.body)
+            except Exception:
+                logger.exception("Bulk fetch of %s failed", path)
+                continue
+            results[path] = result
+        return results
@@ -0,0 +1,206 @@
+"""Caching helpers: Redis when configured, bounded in-process LRU otherwise."""
+import asyncio
+import hashlib
+import importlib
+import importlib.util
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from shared.utils.intent import canonical_text
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    # redis not installed, only in-process caches are available
+    redis = None
+
+# Semantic caching needs both; without them SemanticCache never hits. They are
+# only imported on first use since sentence-transformers pulls in torch.
+SEMANTIC_CACHE_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("hnswlib", "sentence_transformers")
+)
+
+
+def create_redis_client(redis_url: Optional[str]):
+    """Async Redis client for ``redis_url``, or None when unset or redis is not installed."""
+    if redis_url and redis is not None:
+        return redis.from_url(redis_url, decode_responses=True)
+    return None
+
+
+class LocalTTLCache:
+    """Bounded LRU whose entries also expire after ``ttl_seconds``."""
+
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: float = 30):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+
+    def get(self, key) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key, value, ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class SingleFlight:
+    """Collapses concurrent calls that share a key into one.
+
+    The first caller for a key runs ``fn``; callers that arrive while it is
+    in flight await the same result (or exception) instead of repeating it.
+    If that first caller is cancelled, the callers waiting on it retry, one
+    of them running ``fn`` in its place.
+    """
+
+    def __init__(self):
+        self._inflight = {}  # key -> asyncio.Future
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        while (fut := self._inflight.get(key)) is not None:
+            try:
+                # shield: a cancelled waiter must not cancel everyone else's result
+                return await asyncio.shield(fut)
+            except asyncio.CancelledError:
+                if not fut.cancelled() or asyncio.current_task().cancelling():
+                    raise  # this waiter itself was cancelled
+                # Only the leader was cancelled: try again, maybe as the leader
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # retrieved here so an unawaited future is not logged
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+
+class TextCache:
+    """String values keyed by canonicalized text, e.g. LLM answers per question.
+
+    Keys are ``<namespace>:<blake2b of the canonical text>``; stored in Redis
+    when a client is given so every worker shares hits, else in-process.
+    """
+
+    def __init__(self, namespace: str, client=None, local_maxsize: int = 10_000):
+        self.namespace = namespace
+        self.client = client
+        self._local = LocalTTLCache(maxsize=local_maxsize) if client is None else None
+
+    def key(self, text: str) -> str:
+        digest = hashlib.blake2b(canonical_text(text).encode("utf-8"), digest_size=16).hexdigest()
+        return f"{self.namespace}:{digest}"
+
+    async def get(self, text: str) -> Optional[str]:
+        key = self.key(text)
+        if self.client is None:
+            return self._local.get(key)
+        return await self.client.get(key)
+
+    async def set(self, text: str, value: str, ttl_seconds: int):
+        key = self.key(text)
+        if self.client is None:
+            self._local.put(key, value, ttl_seconds)
+        else:
+            await self.client.set(key, value, ex=ttl_seconds)
+
+
+class SemanticCache:
+    """Answers reused across paraphrases ("what are your hours" / "when are you open").
+
+    Canonical questions are embedded with a sentence-transformers model into
+    an HNSW cosine index; a lookup returns the answer stored for the nearest
+    past question when their similarity is at least ``threshold``. The index
+    is per worker and holds ``max_elements`` questions, overwriting the
+    oldest once full. Without sentence-transformers and hnswlib installed,
+    lookups always miss and nothing is stored.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_elements: int = 10_000,
+                 model_name: str = "all-MiniLM-L6-v2"):
+        self.threshold = threshold
+        self.max_elements = max_elements
+        self.model_name = model_name
+        self.enabled = SEMANTIC_CACHE_AVAILABLE
+        self._encoder = None
+        self._index = None
+        self._answers = {}  # index label -> answer
+        self._next_label = 0
+        self._lock = threading.Lock()
+        # A miss is followed by set() for the same text; keep its embedding
+        self._vectors = LocalTTLCache(maxsize=256, ttl_seconds=60)
+
+    def _embed(self, text: str):
+        canonical = canonical_text(text)
+        # _vectors reorders itself on every read, so it is only touched
+        # under the lock; encoding runs outside it
+        with self._lock:
+            vec = self._vectors.get(canonical)
+            if vec is None and self._encoder is None:
+                # Loading the model is slow, so it happens on first use
+                hnswlib = importlib.import_module("hnswlib")
+                sentence_transformers = importlib.import_module("sentence_transformers")
+                self._encoder = sentence_transformers.SentenceTransformer(self.model_name)
+                self._index = hnswlib.Index(space="cosine", dim=self._encoder.get_sentence_embedding_dimension())
+                self._index.init_index(max_elements=self.max_elements, ef_construction=200, M=16)
+                self._index.set_ef(50)
+        if vec is None:
+            vec = self._encoder.encode(canonical)
+            with self._lock:
+                self._vectors.put(canonical, vec)
+        return vec
+
+    def _lookup(self, text: str) -> Optional[str]:
+        vec = self._embed(text)
+        with self._lock:
+            if not self._answers:
+                return None
+            labels, distances = self._index.knn_query(vec, k=1)
+            if 1 - distances[0][0] < self.threshold:
+                return None
+            return self._answers.get(int(labels[0][0]))
+
+    def _store(self, text: str, answer: str):
+        vec = self._embed(text)
+        with self._lock:
+            # Reusing a label replaces that vector in place
+            label = self._next_label % self.max_elements
+            self._index.add_items(vec, [label])
+            self._answers[label] = answer
+            self._next_label += 1
+
+    async def get(self, text: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        # Embedding is CPU-bound, keep it off the event loop
+        return await asyncio.to_thread(self._lookup, text)
+
+    async def set(self, text: str, answer: str):
+        if self.enabled:
+            await asyncio.to_thread(self._store, text, answer)
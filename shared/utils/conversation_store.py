@@ -0,0 +1,226 @@
+"""Call conversation stores: in-process by default, Redis when configured."""
+import heapq
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import List, Optional, Tuple
+
+from shared.utils.json import dumps as _dumps, loads as _loads
+
+
+class ConversationStore:
+    """Active and recently completed call conversations kept in this process.
+
+    A conversation is ``{call_sid, phone, messages, started_at, ended_at}``.
+    At most ``max_completed`` finished conversations are kept, as a
+    segmented LRU: a new one enters the probationary segment, and looking it
+    up with ``find_completed`` promotes it to the protected segment of
+    ``hot_completed`` entries (by default 2/5 of the total). Only the
+    probationary segment evicts, oldest first, so conversations that
+    dashboards keep reopening outlive a burst of new calls. With
+    ``hot_completed=0`` this is a plain LRU.
+    """
+
+    def __init__(self, max_completed: int = 50, hot_completed: Optional[int] = None):
+        self.max_completed = max_completed
+        self.hot_completed = max_completed * 2 // 5 if hot_completed is None else min(hot_completed, max_completed)
+        self._active = {}
+        self._last_activity = OrderedDict()  # call_sid -> time, least recent first
+        self._probation = OrderedDict()  # call_sid -> conversation, least recent first
+        self._hot = OrderedDict()  # call_sid -> conversation, least recently looked up first
+
+    async def start(self, call_sid: str, phone: str, started_at: Optional[float] = None):
+        started_at = started_at or time.time()
+        self._active[call_sid] = {
+            "call_sid": call_sid,
+            "phone": phone,
+            "messages": [],
+            "started_at": started_at,
+            "ended_at": None
+        }
+        self._last_activity.pop(call_sid, None)
+        self._last_activity[call_sid] = started_at
+
+    async def add_message(self, call_sid: str, role: str, text: str):
+        """Append a message to an active conversation; ignored once it has ended."""
+        conv = self._active.get(call_sid)
+        if conv is not None:
+            now = time.time()
+            conv["messages"].append({"role": role, "text": text, "timestamp": now})
+            self._last_activity[call_sid] = now
+            self._last_activity.move_to_end(call_sid)
+
+    async def get_active(self, call_sid: str) -> Optional[dict]:
+        return self._active.get(call_sid)
+
+    async def list_active(self) -> List[dict]:
+        return list(self._active.values())
+
+    async def idle_since(self, cutoff: float) -> List[str]:
+        """Active calls with no activity since ``cutoff``, least recent first."""
+        idle = []
+        for call_sid, last_activity in self._last_activity.items():
+            if last_activity >= cutoff:
+                break  # the rest were active more recently
+            idle.append(call_sid)
+        return idle
+
+    async def finish(self, call_sid: str, ended_at: Optional[float] = None) -> Optional[dict]:
+        """Move an active conversation to the completed list and return it."""
+        conv = self._active.pop(call_sid, None)
+        self._last_activity.pop(call_sid, None)
+        if conv is not None:
+            conv["ended_at"] = ended_at or time.time()
+            self._probation[call_sid] = conv
+            self._trim_probation()
+        return conv
+
+    def _trim_probation(self):
+        while self._probation and len(self._probation) + len(self._hot) > self.max_completed:
+            self._probation.popitem(last=False)
+
+    async def list_completed(self, limit: int = 50, since: float = 0) -> Tuple[List[dict], int]:
+        """Newest-first page of completed conversations that ended after ``since``, and the total."""
+        kept = chain(self._hot.values(), self._probation.values())
+        if since:
+            kept = (conv for conv in kept if conv["ended_at"] > since)
+        page = heapq.nlargest(max(limit, 0), kept, key=lambda conv: conv["ended_at"])
+        return page, len(self._hot) + len(self._probation)
+
+    async def find_completed(self, call_sid: str) -> Optional[dict]:
+        """A completed conversation by call SID; a hit protects it from eviction."""
+        conv = self._hot.get(call_sid)
+        if conv is not None:
+            self._hot.move_to_end(call_sid)
+            return conv
+        conv = self._probation.pop(call_sid, None)
+        if conv is None:
+            return None
+        self._hot[call_sid] = conv
+        if len(self._hot) > self.hot_completed:
+            # The least recently looked-up protected entry gets one more
+            # round in probation, as its most recent entry
+            demoted_sid, demoted = self._hot.popitem(last=False)
+            self._probation[demoted_sid] = demoted
+        return conv
+
+
+class RedisConversationStore(ConversationStore):
+    """Conversations kept in Redis so every worker sees every call.
+
+    Each active call is a hash ``conv:<sid>`` plus a message list
+    ``conv:<sid>:msgs`` (appends are a single RPUSH), indexed by the
+    ``conv:active`` sorted set scored by last activity. Finished calls are serialized onto the capped
+    ``conv:completed`` list, newest first, and under ``conv:done:<sid>``
+    for direct lookup until they expire.
+    """
+
+    ACTIVE_KEY = "conv:active"
+    COMPLETED_KEY = "conv:completed"
+
+    def __init__(self, client, max_completed: int = 50, ttl_seconds: int = 24 * 3600):
+        super().__init__(max_completed)
+        self.client = client
+        # Bounds how long an abandoned call's keys can linger
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(call_sid: str) -> str:
+        return f"conv:{call_sid}"
+
+    async def start(self, call_sid: str, phone: str, started_at: Optional[float] = None):
+        key = self._key(call_sid)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.delete(key, f"{key}:msgs")
+            pipe.hset(key, mapping={"call_sid": call_sid, "phone": phone or "", "started_at": started_at or time.time()})
+            pipe.expire(key, self.ttl_seconds)
+            pipe.zadd(self.ACTIVE_KEY, {call_sid: started_at or time.time()})
+            await pipe.execute()
+
+    async def add_message(self, call_sid: str, role: str, text: str):
+        key = self._key(call_sid)
+        now = time.time()
+        message = _dumps({"role": role, "text": text, "timestamp": now})
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.rpush(f"{key}:msgs", message)
+            pipe.expire(f"{key}:msgs", self.ttl_seconds)
+            # xx: never re-adds a call that has already finished
+            pipe.zadd(self.ACTIVE_KEY, {call_sid: now}, xx=True)
+            await pipe.execute()
+
+    async def _load(self, call_sids: List[str]) -> List[dict]:
+        if not call_sids:
+            return []
+        async with self.client.pipeline(transaction=False) as pipe:
+            for call_sid in call_sids:
+                key = self._key(call_sid)
+                pipe.hgetall(key)
+                pipe.lrange(f"{key}:msgs", 0, -1)
+            results = await pipe.execute()
+        conversations = []
+        for meta, messages in zip(results[::2], results[1::2]):
+            if not meta:
+                continue  # expired or finished meanwhile
+            conversations.append({
+                "call_sid": meta["call_sid"],
+                "phone": meta["phone"] or None,
+                "messages": [_loads(m) for m in messages],
+                "started_at": float(meta["started_at"]),
+                "ended_at": None
+            })
+        return conversations
+
+    async def get_active(self, call_sid: str) -> Optional[dict]:
+        conversations = await self._load([call_sid])
+        return conversations[0] if conversations else None
+
+    async def list_active(self) -> List[dict]:
+        return await self._load(await self.client.zrange(self.ACTIVE_KEY, 0, -1))
+
+    async def idle_since(self, cutoff: float) -> List[str]:
+        return await self.client.zrangebyscore(self.ACTIVE_KEY, "-inf", f"({cutoff}")
+
+    async def finish(self, call_sid: str, ended_at: Optional[float] = None) -> Optional[dict]:
+        # Only the worker whose ZREM succeeds records the call, so a call
+        # ended from two places is completed once
+        if not await self.client.zrem(self.ACTIVE_KEY, call_sid):
+            return None
+        conv = await self.get_active(call_sid)
+        if conv is None:
+            return None
+        conv["ended_at"] = ended_at or time.time()
+        key = self._key(call_sid)
+        async with self.client.pipeline(transaction=True) as pipe:
+            data = _dumps(conv)
+            pipe.lpush(self.COMPLETED_KEY, data)
+            pipe.ltrim(self.COMPLETED_KEY, 0, self.max_completed - 1)
+            pipe.set(f"conv:done:{call_sid}", data, ex=self.ttl_seconds)
+            pipe.delete(key, f"{key}:msgs")
+            await pipe.execute()
+        return conv
+
+    async def _completed_all(self, limit: int) -> Tuple[List[dict], int]:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.lrange(self.COMPLETED_KEY, 0, limit - 1)
+            pipe.llen(self.COMPLETED_KEY)
+            raw, total = await pipe.execute()
+        return [_loads(c) for c in raw], total
+
+    async def list_completed(self, limit: int = 50, since: float = 0) -> Tuple[List[dict], int]:
+        if limit <= 0:
+            return [], await self.client.llen(self.COMPLETED_KEY)
+        conversations, total = await self._completed_all(limit)
+        if since:
+            conversations = [c for c in conversations if c["ended_at"] > since]
+        return conversations, total
+
+    async def find_completed(self, call_sid: str) -> Optional[dict]:
+        data = await self.client.get(f"conv:done:{call_sid}")
+        return _loads(data) if data is not None else None
+
+
+def create_conversation_store(redis_client=None, max_completed: int = 50) -> ConversationStore:
+    """Redis-backed store when given a client (see ``create_redis_client``), else in-process."""
+    if redis_client is not None:
+        return RedisConversationStore(redis_client, max_completed)
+    return ConversationStore(max_completed)
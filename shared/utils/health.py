@@ -0,0 +1,18 @@
+"""Health check endpoint shared by all services."""
+import json
+
+from fastapi import FastAPI, Response
+
+
+def add_health_route(app: FastAPI, name: str):
+    """Register GET /health, answering ``{"status": "ok", "service": name}``.
+
+    The dashboard probes every service each tick, so the body is encoded
+    once here and the handler is async: no dict to serialize and no
+    threadpool hop per probe.
+    """
+    body = json.dumps({"status": "ok", "service": name}, separators=(",", ":")).encode()
+
+    @app.get("/health")
+    async def health():
+        return Response(content=body, media_type="application/json")
@@ -0,0 +1,31 @@
+"""Pooled HTTP session for service-to-service calls."""
+import atexit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds for calls between local services
+DEFAULT_TIMEOUT = (1, 5)
+
+
+def create_session(pool_connections: int = 32, pool_maxsize: int = 128) -> requests.Session:
+    """Build a keep-alive session that retries connection failures and gateway errors.
+
+    Status retries only apply to idempotent methods, so POSTs are never
+    replayed after the downstream service has seen them.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504], raise_on_status=False),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by everything in the process; sockets are closed on exit
+session = create_session()
+atexit.register(session.close)
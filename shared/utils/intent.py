@@ -1,16 +1,34 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def canonical_text(text: str) -> str:
+    """Lowercase and collapse whitespace, so trivially different phrasings share cache keys."""
+    return _WHITESPACE_RE.sub(" ", text.strip().lower())
+
 
 def classify_intent(text: str) -> str:
-    lt = text.lower()
-    if any(w in lt for w in ["transfer", "send money", "pay", "move"]):
-        return "write"
-    if any(w in lt for w in ["how much", "balance", "last transactions", "transactions"]):
-        return "read"
-    if any(w in lt for w in ["offer", "card", "loan", "savings", "what do you have"]):
-        return "offers"
-    if any(w in lt for w in ["complaint", "issue", "problem", "fraud report"]):
-        return "complaint"
-    if any(w in lt for w in ["qr", "qr code", "merchant"]):
-        return "qr"
+    return _classify_canonical(canonical_text(text))
+
+
+# Checked in order: the first intent with a keyword in the text wins
+_INTENT_KEYWORDS = (
+    ("write", ("transfer", "send money", "pay", "move")),
+    ("read", ("how much", "balance", "last transactions", "transactions")),
+    ("offers", ("offer", "card", "loan", "savings", "what do you have")),
+    ("complaint", ("complaint", "issue", "problem", "fraud report")),
+    ("qr", ("qr", "qr code", "merchant")),
+)
+
+
+@lru_cache(maxsize=10_000)
+def _classify_canonical(lt: str) -> str:
+    for intent, keywords in _INTENT_KEYWORDS:
+        for w in keywords:
+            if w in lt:
+                return intent
     return "general"
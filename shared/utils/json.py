@@ -0,0 +1,15 @@
+"""JSON encoding shared by all services: orjson when installed, the standard library otherwise."""
+import json
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+    dumps = orjson.dumps
+    loads = orjson.loads
+except ImportError:
+    # orjson not installed, use the standard JSON encoder
+    from fastapi.responses import JSONResponse as DefaultResponse
+    loads = json.loads
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
@@ -1,7 +1,11 @@
 """Centralized logging configuration for all services."""
+import atexit
 import logging
+import queue
 import sys
+from collections import deque
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
 from pathlib import Path
 import json
@@ -46,12 +50,17 @@ class ServiceLogger:
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
         
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        # Request handlers only enqueue records; console and file writes
+        # (and their handler locks) happen on the listener's thread
+        log_queue = queue.SimpleQueue()
+        self.listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.listener.stop)  # flushes whatever is still queued
+        self.logger.addHandler(QueueHandler(log_queue))
         
         # In-memory log buffer for dashboard (last 100 entries)
-        self.log_buffer = []
         self.max_buffer_size = 100
+        self.log_buffer = deque(maxlen=self.max_buffer_size)
     
     def _add_to_buffer(self, level: str, message: str, extra: Optional[dict] = None):
         """Add log entry to in-memory buffer."""
@@ -62,9 +71,7 @@ class ServiceLogger:
             "message": message,
             "extra": extra or {}
         }
-        self.log_buffer.append(entry)
-        if len(self.log_buffer) > self.max_buffer_size:
-            self.log_buffer.pop(0)
+        self.log_buffer.append(entry)  # drops the oldest entry once full
     
     def debug(self, message: str, **kwargs):
         self.logger.debug(message)
@@ -88,8 +95,8 @@ class ServiceLogger:
     
     def get_recent_logs(self, limit: int = 50):
         """Get recent log entries for dashboard."""
-        return self.log_buffer[-limit:]
+        return list(self.log_buffer)[-limit:]
     
     def clear_logs(self):
         """Clear the log buffer."""
-        self.log_buffer = []
+        self.log_buffer.clear()
@@ -1,7 +1,8 @@
 """Time-series metrics collection for services."""
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
+import asyncio
 import time
 
 
@@ -10,7 +11,7 @@ class MetricsCollector:
     
     def __init__(self, service_name: str):
         self.service_name = service_name
-        self.metrics: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.max_datapoints))
         self.counters: Dict[str, int] = defaultdict(int)
         self.gauges: Dict[str, float] = defaultdict(float)
         self.max_datapoints = 1000  # Keep last 1000 data points per metric
@@ -37,11 +38,8 @@ class MetricsCollector:
             "type": metric_type,
             "tags": tags or {}
         }
+        # The deque drops the oldest datapoint once max_datapoints is reached
         self.metrics[metric_name].append(datapoint)
-        
-        # Trim old datapoints
-        if len(self.metrics[metric_name]) > self.max_datapoints:
-            self.metrics[metric_name] = self.metrics[metric_name][-self.max_datapoints:]
     
     def get_metric_data(self, metric_name: str, time_period_minutes: int = 60) -> List[Dict[str, Any]]:
         """Get metric data for a specific time period."""
@@ -79,3 +77,46 @@ class MetricsCollector:
             "counters": dict(self.counters),
             "gauges": dict(self.gauges)
         }
+
+
+class BatchedMetrics:
+    """Buffers counter increments and applies them to a collector periodically.
+
+    Hot paths call ``increment`` many times per request; this turns those
+    into one datapoint per counter per flush. Everything other than
+    ``increment`` is passed straight through, after a flush so reads never
+    miss buffered counts.
+    """
+    
+    def __init__(self, collector: MetricsCollector, flush_interval: float = 0.25):
+        self.collector = collector
+        self.flush_interval = flush_interval
+        self._pending: Counter = Counter()
+    
+    def increment(self, metric_name: str, value: int = 1, tags: Dict[str, str] = None):
+        """Buffer a counter increment; tagged increments are recorded immediately."""
+        if tags:
+            self.collector.increment(metric_name, value, tags)
+        else:
+            self._pending[metric_name] += value
+    
+    def flush(self):
+        """Apply buffered increments to the collector."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, Counter()
+        for metric_name, value in pending.items():
+            self.collector.increment(metric_name, value)
+    
+    async def run(self):
+        """Flush every ``flush_interval`` seconds until cancelled."""
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                self.flush()
+        finally:
+            self.flush()
+    
+    def __getattr__(self, name):
+        self.flush()
+        return getattr(self.collector, name)
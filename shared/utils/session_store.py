@@ -0,0 +1,188 @@
+"""Caller session stores: in-process by default, Redis when configured."""
+import asyncio
+import uuid
+
+from shared.utils.cache import LocalTTLCache
+
+
+def new_session(phone: str, account_id: str, verified: bool) -> dict:
+    return {
+        "phone": phone,
+        "account_id": account_id,
+        "verified": verified,
+        "pending_verification_type": None
+    }
+
+
+class SessionStore:
+    """Sessions kept in a dict: lost on restart and not shared between workers."""
+
+    def __init__(self):
+        self._sessions = {}
+
+    async def get_or_create(self, phone: str, account_id: str, verified: bool) -> dict:
+        if phone not in self._sessions:
+            self._sessions[phone] = new_session(phone, account_id, verified)
+        return self._sessions[phone]
+
+    async def update(self, session: dict, **fields):
+        """Apply ``fields`` to ``session`` and persist them."""
+        session.update(fields)
+
+    async def begin_verification(self, session: dict, verification_type: str) -> bool:
+        """Mark an OTP flow as pending unless the caller is already verified.
+
+        Returns False (with ``session`` refreshed) when another request
+        verified the caller first, so no second OTP needs to go out.
+        """
+        if session["verified"]:
+            return False
+        session["pending_verification_type"] = verification_type
+        return True
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+
+class RedisSessionStore(SessionStore):
+    """Sessions kept as Redis hashes (``sess:<phone>``) with a sliding TTL.
+
+    Every worker sees the same verification state and sessions survive
+    restarts; Redis itself should run with an eviction policy such as
+    ``maxmemory-policy allkeys-lru`` to bound memory.
+
+    Hot sessions are also held in a small per-worker LRU for
+    ``local_ttl_seconds`` so repeated turns on a call skip the Redis round
+    trip. Updates are written through and announced on
+    ``INVALIDATION_CHANNEL`` so other workers drop their copy; the local TTL
+    bounds staleness if a notice is missed.
+    """
+
+    INVALIDATION_CHANNEL = "sess_invalidate"
+
+    # Check-and-set in one round trip: no other request can verify the caller
+    # between reading ``verified`` and recording the pending OTP flow
+    BEGIN_VERIFICATION_SCRIPT = """
+    if redis.call('HGET', KEYS[1], 'verified') == '1' then
+        return 0
+    end
+    redis.call('HSET', KEYS[1], 'pending_verification_type', ARGV[1])
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    redis.call('PUBLISH', ARGV[3], ARGV[4])
+    return 1
+    """
+
+    def __init__(self, client, ttl_seconds: int = 3600,
+                 local_maxsize: int = 10_000, local_ttl_seconds: float = 30):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self._local = LocalTTLCache(local_maxsize, local_ttl_seconds)
+        self._origin = uuid.uuid4().hex
+        self._listener = None
+        self._begin_verification = client.register_script(self.BEGIN_VERIFICATION_SCRIPT)
+
+    @staticmethod
+    def _key(phone: str) -> str:
+        return f"sess:{phone}"
+
+    @staticmethod
+    def _encode(fields: dict) -> dict:
+        # Hash values are strings: booleans as "1"/"0", None as ""
+        return {
+            k: ("1" if v else "0") if isinstance(v, bool) else ("" if v is None else v)
+            for k, v in fields.items()
+        }
+
+    @staticmethod
+    def _decode(data: dict) -> dict:
+        return {
+            "phone": data["phone"],
+            "account_id": data["account_id"],
+            "verified": data["verified"] == "1",
+            "pending_verification_type": data.get("pending_verification_type") or None
+        }
+
+    async def get_or_create(self, phone: str, account_id: str, verified: bool) -> dict:
+        session = self._local.get(phone)
+        if session is not None:
+            return session
+        key = self._key(phone)
+        async with self.client.pipeline(transaction=True) as pipe:
+            # HSETNX per field only fills in a session that does not exist yet
+            for field, value in self._encode(new_session(phone, account_id, verified)).items():
+                pipe.hsetnx(key, field, value)
+            pipe.expire(key, self.ttl_seconds)
+            pipe.hgetall(key)
+            results = await pipe.execute()
+        session = self._decode(results[-1])
+        self._local.put(session["phone"], session)
+        return session
+
+    async def update(self, session: dict, **fields):
+        session.update(fields)
+        self._local.put(session["phone"], session)
+        key = self._key(session["phone"])
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=self._encode(fields))
+            pipe.expire(key, self.ttl_seconds)
+            pipe.publish(self.INVALIDATION_CHANNEL, f"{self._origin}:{session['phone']}")
+            await pipe.execute()
+
+    async def begin_verification(self, session: dict, verification_type: str) -> bool:
+        phone = session["phone"]
+        started = await self._begin_verification(
+            keys=[self._key(phone)],
+            args=[verification_type, self.ttl_seconds, self.INVALIDATION_CHANNEL, f"{self._origin}:{phone}"]
+        )
+        if started:
+            session["pending_verification_type"] = verification_type
+        else:
+            session["verified"] = True
+        self._local.put(phone, session)
+        return bool(started)
+
+    async def _listen_invalidations(self):
+        while True:
+            try:
+                pubsub = self.client.pubsub()
+                await pubsub.subscribe(self.INVALIDATION_CHANNEL)
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        origin, _, phone = message["data"].partition(":")
+                        if origin != self._origin:
+                            self._local.pop(phone)
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Redis unavailable; cached entries still expire on their own
+                self._local.clear()
+                await asyncio.sleep(1)
+
+    async def start(self):
+        """Begin listening for other workers' invalidations."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen_invalidations())
+
+    async def close(self):
+        """Stop the invalidation listener; the Redis client belongs to the caller."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+
+def create_session_store(redis_client=None, ttl_seconds: int = 3600) -> SessionStore:
+    """Redis-backed store when given a client (see ``create_redis_client``), else in-process."""
+    if redis_client is not None:
+        return RedisSessionStore(redis_client, ttl_seconds)
+    return SessionStore()